@@ -0,0 +1,245 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file draws every graph of the steps in main.py into a folder without opening a browser. The datasets
+are loaded once and shared by every graph, and the graphs can be built at the same time in a pool of threads.
+
+Run it with
+    python batch.py report --format html --workers 4"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import dataset_registry
+import draw_graph
+import global_map
+import helper_functions
+import render
+
+# The datasets of dataset_registry, along with the frames drawn by the maps of global_map
+LOADERS: Dict[str, Callable[[], object]] = dict(dataset_registry.LOADERS,
+                                                temperature_frame=global_map.temperature_frame,
+                                                co2_frame=global_map.co2_frame)
+
+
+@dataclass
+class Graph:
+    """A graph drawn in a step of main.py
+    Attributes
+        - step: the step of main.py the graph is drawn in
+        - name: the name of the graph, which names its file
+        - alias: a short name of the graph, which names it in report.py
+        - description: what the graph draws
+        - defaults: maps every parameter the graph takes to its value in main.py. A countries of None stands for
+          the countries described in description
+        - datasets: the names of the datasets the graph uses, as in LOADERS
+        - draw: draws the graph from the datasets and the value of every parameter into a render target
+    Representative Invariants:
+        - all(name in LOADERS for name in self.datasets)
+    """
+    step: int
+    name: str
+    alias: str
+    description: str
+    defaults: Dict[str, Any]
+    datasets: Tuple[str, ...]
+    draw: Callable[[dataset_registry.DatasetRegistry, Dict[str, Any], render.RenderTarget], object]
+
+
+def load_datasets() -> dataset_registry.DatasetRegistry:
+    """Return the datasets used by the graphs, with the United States of America renamed in the CO2 dataset.
+    Every dataset is only loaded once a graph uses it"""
+    return dataset_registry.DatasetRegistry(LOADERS)
+
+
+def _in_all(datasets: dataset_registry.DatasetRegistry) -> set:
+    """Return the countries that are in both the CO2 and the temperature dataset"""
+    return helper_functions.list_of_countries_in_all(datasets['co2_data'], datasets['country_data'])
+
+
+def _co2_countries(datasets: dataset_registry.DatasetRegistry) -> set:
+    """Return the countries that are in the CO2 dataset"""
+    return helper_functions.list_of_countries_co2(datasets['co2_data'])
+
+
+def _countries(parameters: Dict[str, Any], default: Callable[[], set]) -> set:
+    """Return the countries in parameters, or the countries returned by default if none were given"""
+    if parameters['countries'] is None:
+        return default()
+    return set(parameters['countries'])
+
+
+def graphs() -> List[Graph]:
+    """Return every graph drawn in the steps of main.py, with the years and countries used there"""
+    return [
+        Graph(2, 'changing_co2_graph', 'changing-co2-map',
+              'A map of the CO2 emission of every country, changing through the years',
+              {'start_year': 1990, 'end_year': 2017}, ('co2_frame',),
+              lambda d, p, target: global_map.draw_changing_co2_graph(p['start_year'], p['end_year'], target)),
+        Graph(2, 'changing_global_graph_temperature', 'changing-temperature-map',
+              'A map of the temperature of every country, changing through the years',
+              {'start_year': 1990, 'end_year': 2013, 'resolution': 'yearly', 'max_frames': 60, 'compact': True},
+              ('temperature_frame',),
+              lambda d, p, target: global_map.draw_changing_global_graph_temperature(
+                  str(p['start_year']) + '-01-01', str(p['end_year']) + '-01-01', p['resolution'], p['max_frames'],
+                  p['compact'], target)),
+        Graph(2, 'ranking_comparison', 'ranking-comparison',
+              'The ranking of the temperature increase, the CO2 increase and the GDP of countries. By default the '
+              'countries are those in both the CO2 and the temperature dataset',
+              {'start_year': 1990, 'end_year': 2017, 'countries': None}, ('country_data', 'co2_data', 'gdp_data'),
+              lambda d, p, target: draw_graph.draw_ranking_comparison(
+                  d['country_data'], d['co2_data'], d['gdp_data'], _countries(p, lambda: _in_all(d)),
+                  p['start_year'], p['end_year'], target=target)),
+        Graph(3, 'global_graph_year', 'global-temperature', 'The yearly average temperature of the world', {},
+              ('global_data',), lambda d, p, target: draw_graph.draw_global_graph_year(d['global_data'], target)),
+        Graph(3, 'global_co2_year', 'global-co2', 'The yearly average CO2 in the atmosphere', {}, ('global_co2',),
+              lambda d, p, target: draw_graph.draw_global_co2_year(d['global_co2'], target)),
+        Graph(3, 'global_co2_vs_temperature', 'global-co2-vs-temperature',
+              'The CO2 in the atmosphere against the temperature of the world', {}, ('global_data', 'global_co2'),
+              lambda d, p, target: draw_graph.draw_global_co2_vs_temperature(d['global_data'], d['global_co2'],
+                                                                             target)),
+        Graph(4, 'co2_gdp_ranking', 'co2-gdp-ranking',
+              'The ranking of the CO2 increase, the total CO2 and the GDP of countries since start_year. By default '
+              'the countries are those in the CO2 dataset',
+              {'start_year': 1983, 'countries': None}, ('co2_data', 'gdp_data'),
+              lambda d, p, target: draw_graph.co2_gdp_ranking(
+                  d['co2_data'], d['gdp_data'], _countries(p, lambda: _co2_countries(d)), p['start_year'],
+                  target=target)),
+        Graph(5, 'percentage_of_pollution', 'pollution-share',
+              'The share of the CO2 emission of the top countries by GDP. By default the countries are those in '
+              'the CO2 dataset',
+              {'start_year': 1990, 'end_year': 2017, 'countries': None, 'top': 10}, ('gdp_data', 'co2_data'),
+              lambda d, p, target: draw_graph.draw_percentage_of_pollution(
+                  d['gdp_data'], d['co2_data'], _countries(p, lambda: _co2_countries(d)), p['start_year'],
+                  p['end_year'], p['top'], target)),
+        Graph(6, 'country_increase_vs_average', 'country-increase-vs-average',
+              'The temperature increase of countries against their average temperature. By default the countries '
+              'are those with temperatures from start_year on',
+              {'start_year': 1990, 'end_year': 2013, 'countries': None}, ('country_data',),
+              lambda d, p, target: draw_graph.draw_country_increase_vs_average(
+                  d['country_data'], _countries(p, lambda: helper_functions.list_of_countries(d['country_data'],
+                                                                                                p['start_year'])),
+                  p['start_year'], p['end_year'], target)),
+        Graph(7, 'increase_co2_increase_temperature_country', 'country-regression',
+              'The regression of the temperature increase of one country on its CO2 increase',
+              {'start_year': 1990, 'end_year': 2013, 'country': 'United States'}, ('country_data', 'co2_data'),
+              lambda d, p, target: draw_graph.draw_increase_co2_increase_temperature_country(
+                  d['country_data'], d['co2_data'], p['country'], p['start_year'], p['end_year'], target)),
+        Graph(8, 'increase_co2_increase_temperature', 'co2-temperature-regression',
+              'The regression of the temperature increase of countries on their CO2 increase. By default the '
+              'countries are those in both the CO2 and the temperature dataset',
+              {'start_year': 1990, 'end_year': 2013, 'countries': None}, ('country_data', 'co2_data'),
+              lambda d, p, target: draw_graph.draw_increase_co2_increase_temperature(
+                  d['country_data'], d['co2_data'], _countries(p, lambda: _in_all(d)), p['start_year'],
+                  p['end_year'], target)),
+        Graph(9, 'country_vs_global', 'country-vs-global',
+              'The temperature of one country against the temperature of the world', {'country': 'Australia'},
+              ('global_data', 'country_data'),
+              lambda d, p, target: draw_graph.draw_country_vs_global(d['global_data'], d['country_data'],
+                                                                     p['country'], target)),
+        Graph(9, 'country_vs_global_year', 'country-vs-global-year',
+              'The yearly temperature of one country against the temperature of the world',
+              {'start_year': 1950, 'end_year': 2013, 'country': 'Australia'}, ('global_data', 'country_data'),
+              lambda d, p, target: draw_graph.draw_country_vs_global_year(
+                  d['global_data'], d['country_data'], p['country'], p['start_year'], p['end_year'], target)),
+        Graph(9, 'co2_emission', 'country-co2', 'The CO2 emission of one country through the years',
+              {'country': 'United States'}, ('co2_data',),
+              lambda d, p, target: draw_graph.draw_co2_emission(d['co2_data'], p['country'], target)),
+        Graph(9, 'country_graph_year', 'country-temperature', 'The yearly average temperature of one country',
+              {'country': 'Australia'}, ('country_data',),
+              lambda d, p, target: draw_graph.draw_country_graph_year(d['country_data'], p['country'], target)),
+        Graph(9, 'smoothed_global_temperature', 'smoothed-global-temperature',
+              'The monthly temperature of the world, smoothed over a window of months',
+              {'method': 'mean', 'window': 120}, ('global_data',),
+              lambda d, p, target: draw_graph.draw_smoothed_series(d['global_data'], p['method'], p['window'],
+                                                                   target=target)),
+        Graph(9, 'smoothed_global_co2', 'smoothed-global-co2',
+              'The monthly CO2 in the atmosphere, smoothed over a window of months',
+              {'method': 'mean', 'window': 12}, ('global_co2',),
+              lambda d, p, target: draw_graph.draw_smoothed_series(d['global_co2'], p['method'], p['window'],
+                                                                   target=target)),
+        Graph(9, 'smoothed_country_temperature', 'smoothed-country-temperature',
+              'The monthly temperature of one country, smoothed over a window of months',
+              {'country': 'Australia', 'method': 'mean', 'window': 120}, ('country_data',),
+              lambda d, p, target: draw_graph.draw_smoothed_series(d['country_data'], p['method'], p['window'],
+                                                                   p['country'], target)),
+        Graph(9, 'smoothed_countries', 'smoothed-countries',
+              'The monthly temperature of countries, smoothed over a window of months. By default the countries '
+              'are those in both the CO2 and the temperature dataset',
+              {'countries': None, 'method': 'slope', 'window': 360}, ('country_data', 'co2_data'),
+              lambda d, p, target: draw_graph.draw_smoothed_countries(
+                  d['country_data'], _countries(p, lambda: _in_all(d)), p['method'], p['window'], target)),
+    ]
+
+
+def select(all_graphs: List[Graph], choices: List[str]) -> List[Graph]:
+    """Return the graphs of all_graphs chosen by choices, in the order of all_graphs. A choice is either a step of
+    main.py, such as 3, the name of a graph, with - or _ between its words, such as ranking-comparison, its alias,
+    such as global-co2, or the start of the name or alias of only one graph, such as ranking.
+    Raise ValueError if a choice matches no graph, or starts the names of more than one graph"""
+    chosen = set()
+    for choice in choices:
+        name = choice.replace('-', '_')
+        matches = {graph.name for graph in all_graphs if choice in (str(graph.step), graph.alias) or name == graph.name}
+        if matches == set():
+            matches = {graph.name for graph in all_graphs
+                       if graph.name.startswith(name) or graph.alias.startswith(choice.replace('_', '-'))}
+            if len(matches) > 1:
+                raise ValueError(repr(choice) + ' could be any of ' + ', '.join(
+                    graph.alias for graph in all_graphs if graph.name in matches) + ', give more of its name')
+        if matches == set():
+            raise ValueError('There is no step or graph called ' + repr(choice) + ', expected a step from 2 to 9 '
+                             'or one of ' + ', '.join(graph.alias for graph in all_graphs))
+        chosen.update(matches)
+    return [graph for graph in all_graphs if graph.name in chosen]
+
+
+def render_all(output_directory: str, file_format: str = 'html', workers: int = 1, steps: Optional[List[int]] = None,
+               datasets: Optional[dataset_registry.DatasetRegistry] = None) -> Dict[str, float]:
+    """Write every graph of the given steps, or of every step if steps is None, into output_directory as
+    file_format files. Return how many seconds every written file took to draw
+    Representative Invariants:
+        - file_format in {'html', 'json'}
+        - workers >= 1"""
+    if datasets is None:
+        datasets = load_datasets()
+    chosen = [graph for graph in graphs() if steps is None or graph.step in steps]
+    os.makedirs(output_directory, exist_ok=True)
+
+    def draw(graph: Graph) -> Tuple[str, float]:
+        path = os.path.join(output_directory, 'step' + str(graph.step) + '_' + graph.name + '.' + file_format)
+        start = time.perf_counter()
+        graph.draw(datasets, graph.defaults, render.RenderTarget(file_format, path))
+        return (path, time.perf_counter() - start)
+
+    if workers > 1:
+        with ThreadPoolExecutor(workers) as pool:
+            return dict(pool.map(draw, chosen))
+    return dict(draw(graph) for graph in chosen)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write every graph of main.py into a folder')
+    parser.add_argument('output', help='the folder the graphs are written into')
+    parser.add_argument('--format', choices=['html', 'json'], default='html', help='the type of file written')
+    parser.add_argument('--workers', type=int, default=1, help='how many graphs are drawn at the same time')
+    parser.add_argument('--steps', type=int, nargs='+', help='the steps of main.py to draw, every step by default')
+    arguments = parser.parse_args()
+    batch_start = time.perf_counter()
+    written = render_all(arguments.output, arguments.format, arguments.workers, arguments.steps)
+    for written_path in written:
+        print('%-80s %8.3f s' % (written_path, written[written_path]))
+    print('Wrote %d graphs in %.3f s' % (len(written), time.perf_counter() - batch_start))
@@ -0,0 +1,296 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file measures how long the loaders, the helper functions and the graphs take on synthetic datasets
+with the same layout as the five real csv files and the xml form of the CO2 file. The datasets are scaled by
+multiplying the amount of countries, and the timings are written to a json report so that they can be compared
+between versions.
+
+Run it with
+    python benchmark.py --scales 1 10 --output benchmark_report.json"""
+
+import argparse
+import contextlib
+import datetime
+import json
+import math
+import os
+import platform
+import random
+import tempfile
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+import co2_store
+import converting_data
+import country_index
+import data_cache
+import dataset_registry
+import helper_functions
+import memo
+import regression
+import render
+
+# The amount of countries in each real dataset, which is the size of a dataset at scale 1
+TEMPERATURE_COUNTRIES = 243
+CO2_COUNTRIES = 43
+GDP_COUNTRIES = 200
+
+REPEATS = 3
+
+
+def country_name(i: int) -> str:
+    """Return the name of the i-th synthetic country. The first one is the United States so that
+    mutate_united_states has something to rename"""
+    if i == 0:
+        return 'United States'
+    return 'Country ' + str(i).zfill(5)
+
+
+def write_datasets(directory: str, scale: int, seed: int = 110) -> None:
+    """Write the five synthetic csv files and the xml form of the CO2 file into directory, with scale times as many
+    countries as the real ones"""
+    generator = random.Random(seed)
+
+    with open(os.path.join(directory, converting_data.GLOBAL_TEMPERATURE_FILE), 'w') as file:
+        file.write('dt,LandAverageTemperature,LandAverageTemperatureUncertainty,LandMaxTemperature,'
+                   'LandMaxTemperatureUncertainty,LandMinTemperature,LandMinTemperatureUncertainty,'
+                   'LandAndOceanAverageTemperature,LandAndOceanAverageTemperatureUncertainty\n')
+        for year in range(1750, 2016):
+            for month in range(1, 13):
+                temperature = 8.5 + 6 * math.sin(month / 2) + (year - 1750) * 0.004 + generator.gauss(0, 0.5)
+                file.write('%04d-%02d-01,%r,0.1,,,,,,\n' % (year, month, temperature))
+
+    with open(os.path.join(directory, converting_data.COUNTRY_TEMPERATURE_FILE), 'w') as file:
+        file.write('dt,AverageTemperature,AverageTemperatureUncertainty,Country\n')
+        for i in range(TEMPERATURE_COUNTRIES * scale):
+            name = country_name(i)
+            base = generator.uniform(-10, 28)
+            for year in range(1900, 2014):
+                for month in range(1, 13 if year < 2013 else 10):
+                    temperature = base + 8 * math.sin(month / 2) + (year - 1900) * 0.01 + generator.gauss(0, 1)
+                    file.write('%04d-%02d-01,%r,0.3,%s\n' % (year, month, temperature, name))
+
+    with open(os.path.join(directory, converting_data.CO2_EMISSION_FILE), 'w') as file, \
+            open(os.path.join(directory, converting_data.CO2_EMISSION_XML_FILE), 'w') as xml_file:
+        file.write('"Country or Area","Year","Value"\n')
+        xml_file.write('<ROOT>\n    <data>\n')
+        for i in range(CO2_COUNTRIES * scale):
+            name = 'United States of America' if i == 0 else country_name(i)
+            emission = generator.uniform(1000, 5000000)
+            for year in range(2017, 1989, -1):
+                value = emission * (1 + (year - 1990) * 0.01)
+                file.write('"%s","%d","%r"\n' % (name, year, value))
+                xml_file.write('        <record>\n'
+                               '            <field name="Country or Area">%s</field>\n'
+                               '            <field name="Year">%d</field>\n'
+                               '            <field name="Value">%r</field>\n'
+                               '        </record>\n' % (name, year, value))
+        xml_file.write('    </data>\n</ROOT>')
+
+    with open(os.path.join(directory, converting_data.GDP_FILE), 'w') as file:
+        file.write(',Gross domestic product 2019,,,,\n,,,,,\n,,,,(millions of,\n,Ranking,,Economy,US dollars),\n'
+                   ',,,,,\n')
+        for i in range(GDP_COUNTRIES * scale):
+            file.write('C%d,%d,,%s," %s ",\n' % (i, i + 1, country_name(i), format(10 ** 7 // (i + 1), ',')))
+        file.write(',,,,,\n')
+
+    with open(os.path.join(directory, converting_data.GLOBAL_CO2_FILE), 'w') as file:
+        file.write('Year,Month,MEI,CO2,CH4,N2O,CFC-11,CFC-12,TSI,Aerosols,Temp\n')
+        for year in range(1983, 2009):
+            for month in range(1 if year > 1983 else 5, 13):
+                co2 = 340 + (year - 1983) * 1.6 + generator.gauss(0, 0.5)
+                file.write('%d,%d,0,%r,0,0,0,0,0,0,0\n' % (year, month, co2))
+
+
+def measure(function: Callable[[], object], repeats: int = REPEATS,
+            datasets: Optional[Dict[str, object]] = None) -> Dict[str, float]:
+    """Return the fastest and the mean wall time of calling function repeats times. The remembered results of
+    the helper functions are forgotten before every call, along with the country index and the CO2 store of every
+    dataset in datasets, so that every call builds them again like the first call does"""
+    times = []
+    for _ in range(repeats):
+        memo.clear()
+        for dataset in (datasets or {}).values():
+            if isinstance(dataset, list):
+                country_index.forget(dataset)
+                co2_store.forget(dataset)
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return {'min': min(times), 'mean': sum(times) / len(times)}
+
+
+@contextlib.contextmanager
+def working_directory(directory: str) -> Iterator[None]:
+    """Change into directory for the duration of the with block"""
+    previous = os.getcwd()
+    os.chdir(directory)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def benchmark_loaders(results: Dict[str, dict], repeats: int) -> None:
+    """Time every loader, once without the binary cache and once with it"""
+    loaders = {'convert_global_temperatures': converting_data.convert_global_temperatures,
+               'convert_country_temperatures': converting_data.convert_country_temperatures,
+               'co2_emission_convert': converting_data.co2_emission_convert,
+               'co2_emission_convert_xml': converting_data.co2_emission_convert_xml,
+               'gdp_convert': converting_data.gdp_convert,
+               'global_co2_convert': converting_data.global_co2_convert}
+    for name in loaders:
+        results['loader.' + name + '.cold'] = measure(lambda: _without_cache(loaders[name]), repeats)
+        loaders[name]()
+        results['loader.' + name + '.warm'] = measure(loaders[name], repeats)
+
+
+def benchmark_helpers(results: Dict[str, dict], datasets: Dict[str, object], repeats: int) -> None:
+    """Time the yearly aggregations, the rankings, the regressions and the country intersection"""
+    country_data = datasets['country_data']
+    global_data = datasets['global_data']
+    co2_data = datasets['co2_data']
+    nations = helper_functions.list_of_countries(country_data, 1990)
+    in_all = helper_functions.list_of_countries_in_all(co2_data, country_data)
+    co2_nations = helper_functions.list_of_countries_co2(co2_data)
+    x = [float(i) for i in range(100000)]
+    y = [2 * value + math.sin(value) for value in x]
+
+    helpers = {
+        'create_global_yearly_data': lambda: helper_functions.create_global_yearly_data(global_data, 1900, 2013),
+        'create_country_yearly_data': lambda: helper_functions.create_country_yearly_data(
+            country_data, country_name(0), 1900, 2013),
+        'list_of_countries': lambda: helper_functions.list_of_countries(country_data, 1990),
+        'list_of_countries_in_all': lambda: helper_functions.list_of_countries_in_all(co2_data, country_data),
+        'temperature_increase_ranking': lambda: helper_functions.temperature_increase_ranking(
+            country_data, nations, 1990, 2013),
+        'co2_increase_ranking': lambda: helper_functions.co2_increase_ranking(co2_data, co2_nations, 1990),
+        'co2_ranking': lambda: helper_functions.co2_ranking(co2_data, co2_nations, 1990),
+        'co2_temperature_fits': lambda: helper_functions.co2_temperature_fits(country_data, co2_data, in_all,
+                                                                              1990, 2013),
+        'year_country_matrix': lambda: helper_functions.year_country_matrix(country_data, co2_data),
+        'regression.fit': lambda: regression.fit(x, y),
+    }
+    for name in helpers:
+        results['helper.' + name] = measure(helpers[name], repeats, datasets)
+
+
+def benchmark_figures(results: Dict[str, dict], datasets: Dict[str, object], repeats: int) -> None:
+    """Time building every graph of draw_graph and every map of global_map without showing it. The frames of the
+    maps are read before the maps are timed, like the datasets of the graphs. Nothing is timed if plotly or pandas
+    is missing"""
+    try:
+        import draw_graph
+        import global_map
+    except ImportError:
+        results['figure'] = {'skipped': 'plotly or pandas is not installed'}
+        return
+
+    country_data = datasets['country_data']
+    global_data = datasets['global_data']
+    co2_data = datasets['co2_data']
+    gdp_data = datasets['gdp_data']
+    global_co2 = datasets['global_co2']
+    nation = country_name(0)
+    in_all = helper_functions.list_of_countries_in_all(co2_data, country_data)
+    co2_nations = helper_functions.list_of_countries_co2(co2_data)
+    nations = helper_functions.list_of_countries(country_data, 1990)
+    global_map.forget_frames()
+    global_map.temperature_frame()
+    global_map.co2_frame()
+    figures = {
+        'draw_global_graph': lambda: draw_graph.draw_global_graph(global_data),
+        'draw_global_graph_year': lambda: draw_graph.draw_global_graph_year(global_data),
+        'draw_global_co2_year': lambda: draw_graph.draw_global_co2_year(global_co2),
+        'draw_global_co2_vs_temperature': lambda: draw_graph.draw_global_co2_vs_temperature(global_data, global_co2),
+        'draw_country_graph': lambda: draw_graph.draw_country_graph(country_data, nation),
+        'draw_country_graph_year': lambda: draw_graph.draw_country_graph_year(country_data, nation),
+        'draw_co2_emission': lambda: draw_graph.draw_co2_emission(co2_data, nation),
+        'draw_country_vs_global': lambda: draw_graph.draw_country_vs_global(global_data, country_data, nation),
+        'draw_country_vs_global_year': lambda: draw_graph.draw_country_vs_global_year(
+            global_data, country_data, nation, 1950, 2013),
+        'draw_smoothed_series.global': lambda: draw_graph.draw_smoothed_series(global_data, 'mean', 120),
+        'draw_smoothed_series.country': lambda: draw_graph.draw_smoothed_series(country_data, 'mean', 120, nation),
+        'draw_smoothed_countries': lambda: draw_graph.draw_smoothed_countries(country_data, in_all, 'slope', 360),
+        'draw_ranking_comparison': lambda: draw_graph.draw_ranking_comparison(
+            country_data, co2_data, gdp_data, in_all, 1990, 2017),
+        'co2_gdp_ranking': lambda: draw_graph.co2_gdp_ranking(co2_data, gdp_data, co2_nations, 1990),
+        'draw_percentage_of_pollution': lambda: draw_graph.draw_percentage_of_pollution(
+            gdp_data, co2_data, co2_nations, 1990, 2017, 10),
+        'draw_country_increase_vs_average': lambda: draw_graph.draw_country_increase_vs_average(
+            country_data, nations, 1990, 2013),
+        'draw_increase_co2_increase_temperature_country':
+            lambda: draw_graph.draw_increase_co2_increase_temperature_country(country_data, co2_data, nation,
+                                                                              1990, 2013),
+        'draw_increase_co2_increase_temperature': lambda: draw_graph.draw_increase_co2_increase_temperature(
+            country_data, co2_data, in_all, 1990, 2013),
+        'draw_global_graph_temperature': lambda: global_map.draw_global_graph_temperature('2012-01-01',
+                                                                                          '2013-01-01'),
+        'draw_global_graph_co2': lambda: global_map.draw_global_graph_co2(2016, 2017),
+        'draw_changing_global_graph_temperature.monthly': lambda: global_map.draw_changing_global_graph_temperature(
+            '1990-01-01', '2013-01-01'),
+        'draw_changing_global_graph_temperature.yearly': lambda: global_map.draw_changing_global_graph_temperature(
+            '1990-01-01', '2013-01-01', 'yearly', compact=True),
+        'draw_changing_co2_graph': lambda: global_map.draw_changing_co2_graph(1990, 2017),
+    }
+    with render.using(render.RenderTarget('figure')):
+        for name in figures:
+            results['figure.' + name] = measure(figures[name], repeats, datasets)
+    global_map.forget_frames()
+
+
+def run(scales: List[int], repeats: int = REPEATS) -> dict:
+    """Return the report of every benchmark at every scale"""
+    report = {'created': datetime.datetime.now().isoformat(timespec='seconds'),
+              'python': platform.python_version(), 'platform': platform.platform(),
+              'numpy': regression.numpy is not None, 'repeats': repeats, 'scales': {}}
+    for scale in scales:
+        results = {}
+        with tempfile.TemporaryDirectory() as directory, working_directory(directory):
+            write_datasets(directory, scale)
+            benchmark_loaders(results, repeats)
+            registry = dataset_registry.DatasetRegistry()
+            datasets = {name: registry[name] for name in dataset_registry.LOADERS}
+            results['rows.country_data'] = len(datasets['country_data'])
+            results['rows.co2_data'] = len(datasets['co2_data'])
+            benchmark_helpers(results, datasets, repeats)
+            benchmark_figures(results, datasets, repeats)
+            datasets.clear()
+            del registry
+            memo.clear()
+        report['scales'][str(scale)] = results
+    return report
+
+
+def _without_cache(loader: Callable[[], object]) -> object:
+    """Call loader after removing every file of the binary cache, so that the csv file is parsed again"""
+    if os.path.isdir(data_cache.CACHE_DIRECTORY):
+        for name in os.listdir(data_cache.CACHE_DIRECTORY):
+            os.remove(os.path.join(data_cache.CACHE_DIRECTORY, name))
+    return loader()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time the loaders, helper functions and graphs on synthetic data')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10],
+                        help='how many times more countries than the real datasets, up to 100')
+    parser.add_argument('--repeats', type=int, default=REPEATS, help='how many times every benchmark is run')
+    parser.add_argument('--output', default='benchmark_report.json', help='where the json report is written')
+    arguments = parser.parse_args()
+    benchmark_report = run(arguments.scales, arguments.repeats)
+    with open(arguments.output, 'w') as report_file:
+        json.dump(benchmark_report, report_file, indent=2)
+    for scale_name in benchmark_report['scales']:
+        for benchmark_name, timing in benchmark_report['scales'][scale_name].items():
+            if isinstance(timing, dict) and 'min' in timing:
+                print('%4sx  %-60s %10.4f s' % (scale_name, benchmark_name, timing['min']))
@@ -0,0 +1,203 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file keeps the yearly CO2 emission of every country of a list of CO2Emission together with the
+totals, increases and average increases computed from it. When the UN publishes a new year, only the new rows
+are added to the list, and everything computed so far is brought up to date with the new rows alone instead of
+being computed again from the whole list"""
+
+import functools
+import statistics
+import weakref
+from bisect import bisect_left, bisect_right
+from fractions import Fraction
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import country_index
+import memo
+from records import CO2Emission
+
+
+class CO2Store:
+    """The yearly CO2 emission of every country of a list of CO2Emission, along with what is computed from it
+    Instance Attributes
+        - years: maps every country to the years of its rows, in increasing order
+        - emissions: maps every country to the emission of its rows, in the same order as years
+        - increases: maps every country to the increase in emission from each of its rows to the next one
+        - _totals: maps a country to a mapping from a year to the exact total emission of the country from that
+          year on, for every total asked for so far
+        - _increase_sums: maps a country to a mapping from a year to the exact sum and the amount of the
+          increases of the country after that year, for every average asked for so far
+    Representative Invariants:
+        - all(len(self.years[country]) == len(self.emissions[country]) for country in self.years)
+        - all(len(self.increases[country]) == max(len(self.years[country]) - 1, 0) for country in self.years)
+        - all(self.years[country] == sorted(set(self.years[country])) for country in self.years)
+    """
+    years: Dict[str, List[int]]
+    emissions: Dict[str, List[float]]
+    increases: Dict[str, List[float]]
+    _totals: Dict[str, Dict[int, Fraction]]
+    _increase_sums: Dict[str, Dict[int, Tuple[Fraction, int]]]
+
+    def __init__(self, data: List[CO2Emission]) -> None:
+        """Initialize the store of data. The countries are kept in the order they first appear in data"""
+        self.years = {}
+        self.emissions = {}
+        self.increases = {}
+        self._totals = {}
+        self._increase_sums = {}
+        index = country_index.index_of(data)
+        for country in index.rows:
+            self._set_country(country, [(row.year, row.emission) for row in index.rows[country]])
+
+    @classmethod
+    def from_columns(cls, years: Sequence[int], emissions: Sequence[float], codes: Sequence[int],
+                     names: List[str]) -> 'CO2Store':
+        """Return the store of the rows whose year, emission and country names[codes[i]] are the i-th items of
+        years, emissions and codes, without making a CO2Emission for every row. The countries are kept in the
+        order they first appear"""
+        rows = {}
+        for (year, emission, code) in zip(years, emissions, codes):
+            if names[code] not in rows:
+                rows[names[code]] = [(year, emission)]
+            else:
+                rows[names[code]].append((year, emission))
+        store = cls([])
+        for country in rows:
+            store._set_country(country, rows[country])
+        return store
+
+    def add(self, row: CO2Emission) -> bool:
+        """Add row to the store and update every total and average asked for so far. Return False and leave
+        the store as it is if the country of row already has a row for the same year"""
+        country = row.country
+        if country not in self.years:
+            self._set_country(country, [(row.year, row.emission)])
+            return True
+        years = self.years[country]
+        if row.year > years[-1]:
+            increase = row.emission - self.emissions[country][-1]
+            years.append(row.year)
+            self.emissions[country].append(row.emission)
+            self.increases[country].append(increase)
+            totals = self._totals[country]
+            for year in totals:
+                if row.year >= year:
+                    totals[year] += Fraction(row.emission)
+            increase_sums = self._increase_sums[country]
+            for year in increase_sums:
+                if years[-2] > year:
+                    (total, amount) = increase_sums[year]
+                    increase_sums[year] = (total + Fraction(increase), amount + 1)
+            return True
+        position = bisect_left(years, row.year)
+        if years[position] == row.year:
+            return False
+        # A year earlier than the last one is filled in, so the country is computed again
+        self._set_country(country, list(zip(years, self.emissions[country])) + [(row.year, row.emission)])
+        return True
+
+    def total_since(self, country: str, year: int) -> Optional[float]:
+        """Return the total emission of country from year on, or None if it has no row from year on. The total is
+        summed exactly and rounded once, like math.fsum, so it does not depend on the order the rows were read or
+        appended in"""
+        if country not in self.years:
+            return None
+        totals = self._totals[country]
+        if year not in totals:
+            start = bisect_left(self.years[country], year)
+            if start == len(self.years[country]):
+                return None
+            totals[year] = sum(map(Fraction, self.emissions[country][start:]), Fraction(0))
+        return float(totals[year])
+
+    def increases_between(self, country: str, start_year: int, end_year: int) -> List[float]:
+        """Return the increase from each row of country to the next, for its rows from start_year to
+        end_year (both included)"""
+        if country not in self.years:
+            return []
+        start = bisect_left(self.years[country], start_year)
+        end = bisect_right(self.years[country], end_year)
+        return self.increases[country][start:max(end - 1, start)]
+
+    def average_increase_since(self, country: str, year: int) -> float:
+        """Return the mean of the increases of country between its rows after year, rounded like
+        statistics.mean. Raise statistics.StatisticsError if there is no such increase"""
+        if country not in self.years:
+            raise statistics.StatisticsError('mean requires at least one data point')
+        increase_sums = self._increase_sums[country]
+        if year not in increase_sums:
+            increases = self.increases[country][bisect_left(self.years[country], year + 1):]
+            increase_sums[year] = (sum(map(Fraction, increases), Fraction(0)), len(increases))
+        (total, amount) = increase_sums[year]
+        if amount == 0:
+            raise statistics.StatisticsError('mean requires at least one data point')
+        return float(total / amount)
+
+    def _set_country(self, country: str, rows: List[Tuple[int, float]]) -> None:
+        """Replace every row of country with rows, given as years and emissions, and forget everything
+        computed for it so far"""
+        rows.sort()
+        self.years[country] = [year for (year, _) in rows]
+        self.emissions[country] = [emission for (_, emission) in rows]
+        self.increases[country] = [rows[i + 1][1] - rows[i][1] for i in range(len(rows) - 1)]
+        self._totals[country] = {}
+        self._increase_sums[country] = {}
+
+
+# Maps the id of every list with a store to a weak reference to the list and its store. The store is dropped as
+# soon as the list is garbage collected, so building a store for a list does not keep it alive
+_stores: Dict[int, Tuple[weakref.ref, CO2Store]] = {}
+
+
+def store_of(data: List[CO2Emission]) -> CO2Store:
+    """Return the CO2Store of data, building it the first time it is asked for. The store is only kept if data
+    can be weakly referenced, such as a records.RecordList, and is built again every time otherwise"""
+    entry = _stores.get(id(data))
+    if entry is not None and entry[0]() is data:
+        return entry[1]
+    store = CO2Store(data)
+    try:
+        reference = weakref.ref(data, functools.partial(_collect, id(data)))
+    except TypeError:
+        return store
+    _stores[id(data)] = (reference, store)
+    return store
+
+
+def forget(data: List[CO2Emission]) -> None:
+    """Forget the store of data. This must be called whenever the rows of data are mutated other than
+    through append"""
+    _stores.pop(id(data), None)
+
+
+def append(data: List[CO2Emission], rows: Iterable[CO2Emission]) -> int:
+    """Append to data the rows of a country and year that data does not have yet, updating its country index
+    and its store with only those rows. Return how many rows were appended"""
+    store = store_of(data)
+    index = country_index.index_of(data)
+    appended = 0
+    for row in rows:
+        if store.add(row):
+            data.append(row)
+            index.add(row)
+            appended += 1
+    if appended > 0:
+        memo.touch(data)
+    return appended
+
+
+def _collect(identity: int, reference: weakref.ref) -> None:
+    """Drop the store of the list of id identity, which reference referred to, as it was garbage collected"""
+    entry = _stores.get(identity)
+    if entry is not None and entry[0] is reference:
+        del _stores[identity]
@@ -1,185 +1,497 @@
-"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
-
-Copyright and Usage Information
-===============================
-
-This file is provided solely for the personal and private use of graders
-grading this project and people who has permission from the creator to use. All forms of
-distribution of this code, whether as given or with any changes, are
-expressly prohibited.
-
-This file is Copyright (c) 2020 Jason Sastra
-
-This group of code will convert all the csv filed into dataclasses that are
-easier to process. It also mutates some values in the data sets such that it is more convenient to work with"""
-
-import csv
-import datetime
-from dataclasses import dataclass
-from typing import List, Optional
-
-# This part contains all the Dataclasses
-
-
-@dataclass
-class GlobalTemperature:
-    """The dataset from GlobalTemperatures.csv, formatted to show three variables, date in datetime.date,
-    average temperature, uncertainty in average temperature
-    Attributes
-        - date: the datetime in datetime.date format, with year-month-day
-        - temperature: average temperature of the world in floats
-    """
-    date: datetime.date
-    temperature: Optional[float]
-
-
-@dataclass
-class CountryTemperature:
-    """The dataset from GlobalLandTemperaturesByCountry.csv, formatted  to show three variables, date in datetime.date
-    average temperature, and the country itself
-    Attributes
-        - date: the datetime in datetime.date format, with year-month-day
-        - temperature: average temperature of the country in floats
-        - country: the name of the country in strings
-    """
-    date: datetime.date
-    temperature: Optional[float]
-    country: str
-
-
-@dataclass
-class CO2Emission:
-    """The dataset from UNdata_Export_20201102_015629836,
-    Carbon dioxide (CO2) Emissions without Land Use,
-    Land-Use Change and Forestry (LULUCF), in kilotonne CO2 equi.csv, formatted to show three variables,
-    country or area, year, emission
-    Attributes
-        - date: the datetime in datetime.date format, with every month and date being January 1st
-        - emission: The emission as a float in killotone CO2
-        - country: the name of the country in strings
-    """
-    date: datetime.date
-    emission: float
-    country: str
-
-
-@dataclass
-class GDP:
-    """The dataset from GDP.csv, formetted to show three variables, ranking, country, and GDP. This dataset
-    shows the ranking of all country's GDP in 2019
-    Attributes
-        - ranking: the rank the country's GDP, from highest to lowest
-        - country: the name of the country in strings
-        - gdp: the GDP calculated in millions of USD in strings"""
-    ranking: int
-    gdp: str
-    country: str
-
-
-@dataclass
-class GlobalCO2:
-    """The dataset from climate_change.csv, formatted to show two variables, datetime and CO2 emission.
-    This dataset shows the global CO2 in parts per million by volume
-    Attributes
-        - date: the datetime in datetime.date format
-        - emission: the parts"""
-    date: datetime.date
-    emission: float
-
-# This part converts the csv filed into its respective dataclass
-
-
-def convert_global_temperatures() -> List[GlobalTemperature]:
-    """Open the GlobalTemperatures.csv document and arrange it into the dataclass
-    Global Temperature which contains dates and temperatures above the year 1900."""
-    data_so_far = []
-    with open('GlobalTemperature.csv') as file:
-        reader = csv.reader(file)
-        next(reader)
-        for row in reader:
-            dates = str.split(row[0], '-')
-            if int(dates[0]) >= 1900:
-                date = datetime.date(int(dates[0]), int(dates[1]), int(dates[2]))
-                if row[1] == '':
-                    temperature = GlobalTemperature(date, None)
-                else:
-                    temperature = GlobalTemperature(date, float(row[1]))
-                data_so_far.append(temperature)
-    return data_so_far
-
-
-def convert_country_temperatures() -> List[CountryTemperature]:
-    """
-    Open the GlobalLandTemperaturesByCountry file and arrange it into the dataclass CountryTemperature
-    """
-    data_so_far = []
-    with open('GlobalLandTemperaturesByCountry.csv') as file:
-        reader = csv.reader(file)
-        next(reader)
-        for row in reader:
-            dates = str.split(row[0], '-')
-            if int(dates[0]) >= 1900:
-                date = datetime.date(int(dates[0]), int(dates[1]), int(dates[2]))
-                if row[1] != '':
-                    new_data = CountryTemperature(date, float(row[1]), row[3])
-                    data_so_far.append(new_data)
-                else:
-                    new_data = CountryTemperature(date, None, row[3])
-                    data_so_far.append(new_data)
-    return data_so_far
-
-
-def co2_emission_convert() -> List[CO2Emission]:
-    """Convert the data from UNdata_Export into the dataclass format of CO2Emission"""
-    data_so_far = []
-    with open('UNdata_Export_20201102_015629836, '
-              'Carbon dioxide (CO2) Emissions without Land Use, Land-Use Change and Forestry (LULUCF), '
-              'in kilotonne CO2 equi.csv') as file:
-        reader = csv.reader(file)
-        next(reader)
-        for row in reader:
-            data = CO2Emission(datetime.date(int(row[1]), 1, 1),
-                               float(row[2]), row[0])
-            data_so_far.append(data)
-    return data_so_far
-
-
-def gdp_convert() -> List[GDP]:
-    """Convert the data from GDP.csv into the dataclass format of GDP"""
-    data_so_far = []
-    with open('GDP.csv') as file:
-        reader = csv.reader(file)
-        next(reader)
-        next(reader)
-        next(reader)
-        next(reader)
-        next(reader)
-        for row in reader:
-            if row[1] != '':
-                data = GDP(int(row[1]), row[4], row[3])
-                data_so_far.append(data)
-            else:
-                return data_so_far
-
-
-def global_co2_convert() -> List[GlobalCO2]:
-    """Convert the data from climate_change.csv"""
-    data_so_far = []
-    with open('climate_change.csv') as file:
-        reader = csv.reader(file)
-        next(reader)
-        for row in reader:
-            data = GlobalCO2(datetime.date(int(row[0]), int(row[1]), 1), float(row[3]))
-            data_so_far.append(data)
-    return data_so_far
-
-
-def mutate_united_states(co2: List[CO2Emission]) -> List[CO2Emission]:
-    """Mutate the dataset within co2_data so that the country written there for specifically
-    United States matches with the one in country_data and gdp,
-    which is written as United States"""
-
-    for row in co2:
-        if row.country == 'United States of America':
-            row.country = 'United States'
-    return co2
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This group of code will convert all the csv filed into dataclasses that are
+easier to process. It also mutates some values in the data sets such that it is more convenient to work with"""
+
+import csv
+import datetime
+import functools
+import math
+import sys
+from array import array
+from bisect import bisect_left
+from xml.etree import ElementTree
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+from temperature_table import CountryTemperatureTable
+from gdp_table import GDPTable
+import co2_store
+import country_index
+import country_registry
+import data_cache
+import memo
+import profiling
+from records import GlobalTemperature, CountryTemperature, CO2Emission, GDP, GlobalCO2, RecordList
+
+# This part converts the csv filed into its respective dataclass
+
+GLOBAL_TEMPERATURE_FILE = 'GlobalTemperature.csv'
+COUNTRY_TEMPERATURE_FILE = 'GlobalLandTemperaturesByCountry.csv'
+CO2_EMISSION_FILE = ('UNdata_Export_20201102_015629836, '
+                     'Carbon dioxide (CO2) Emissions without Land Use, Land-Use Change and Forestry (LULUCF), '
+                     'in kilotonne CO2 equi.csv')
+# The same data as CO2_EMISSION_FILE, exported from UNdata as xml
+CO2_EMISSION_XML_FILE = 'UNdata_Export_20201102_015040290.xml'
+GDP_FILE = 'GDP.csv'
+GLOBAL_CO2_FILE = 'climate_change.csv'
+
+# How many bytes of a temperature file are read at once
+CHUNK_SIZE = 1 << 22
+# The years of the calendar that the dates of a temperature file are checked against
+CALENDAR_YEARS = range(1600, 2200)
+
+
+@profiling.profiled
+def convert_global_temperatures() -> List[GlobalTemperature]:
+    """Open the GlobalTemperatures.csv document and arrange it into the dataclass
+    Global Temperature which contains dates and temperatures above the year 1900."""
+    columns = data_cache.cached(GLOBAL_TEMPERATURE_FILE, _parse_global_temperatures)
+    return RecordList(GlobalTemperature(datetime.date(year, month, 1), None if math.isnan(temperature) else temperature)
+                      for (year, month, temperature) in zip(columns['years'], columns['months'],
+                                                            columns['temperatures']))
+
+
+def _parse_global_temperatures() -> Dict[str, array]:
+    """Parse GlobalTemperatures.csv into the columns of convert_global_temperatures, where a missing
+    temperature is stored as nan"""
+    try:
+        return read_temperature_columns(GLOBAL_TEMPERATURE_FILE, 1900)
+    except ValueError:
+        # The file is not laid out as expected, so it is read one row at a time instead
+        pass
+    years = array('h')
+    months = array('b')
+    temperatures = array('d')
+    for row in iter_global_temperatures(GLOBAL_TEMPERATURE_FILE, 1900):
+        years.append(row.year)
+        months.append(row.month)
+        temperatures.append(math.nan if row.temperature is None else row.temperature)
+    return {'years': years, 'months': months, 'temperatures': temperatures}
+
+
+@profiling.profiled
+def convert_country_temperatures() -> CountryTemperatureTable:
+    """
+    Open the GlobalLandTemperaturesByCountry file and arrange it into a CountryTemperatureTable,
+    where a missing temperature is stored as nan
+    """
+    columns = data_cache.cached(COUNTRY_TEMPERATURE_FILE, _parse_country_temperatures)
+    return CountryTemperatureTable.from_columns(columns)
+
+
+def _parse_country_temperatures() -> Dict[str, Union[array, List[str]]]:
+    """Parse GlobalLandTemperaturesByCountry.csv into the columns of a CountryTemperatureTable"""
+    try:
+        columns = read_temperature_columns(COUNTRY_TEMPERATURE_FILE, 1900, with_country=True)
+        return CountryTemperatureTable(columns['years'], columns['months'], columns['temperatures'],
+                                       columns['codes'], columns['names']).to_columns()
+    except ValueError:
+        # The file is not laid out as expected, so it is read one row at a time instead
+        pass
+    years = array('h')
+    months = array('b')
+    temperatures = array('d')
+    codes = array('H')
+    names = []
+    name_to_code: Dict[str, int] = {}
+    for row in iter_country_temperatures(COUNTRY_TEMPERATURE_FILE, 1900):
+        if row.country not in name_to_code:
+            name_to_code[row.country] = len(names)
+            names.append(sys.intern(row.country))
+        years.append(row.year)
+        months.append(row.month)
+        temperatures.append(math.nan if row.temperature is None else row.temperature)
+        codes.append(name_to_code[row.country])
+    return CountryTemperatureTable(years, months, temperatures, codes, names).to_columns()
+
+
+@profiling.profiled
+def co2_emission_convert() -> List[CO2Emission]:
+    """Convert the data from UNdata_Export into the dataclass format of CO2Emission, with every country
+    written as its name in the temperature data"""
+    columns = data_cache.cached(CO2_EMISSION_FILE, _parse_co2_emission)
+    return _co2_emission_rows(columns)
+
+
+@profiling.profiled
+def co2_emission_convert_xml(path: str = CO2_EMISSION_XML_FILE) -> List[CO2Emission]:
+    """Convert the xml form of UNdata_Export in the file path into the same dataclasses as co2_emission_convert.
+    The file is read one record at a time, so it can be much larger than the memory"""
+    columns = data_cache.cached(path, lambda: _co2_emission_columns(iter_co2_emission_xml(path)))
+    return _co2_emission_rows(columns)
+
+
+def _co2_emission_rows(columns: Dict[str, Union[array, List[str]]]) -> List[CO2Emission]:
+    """Return the CO2Emission of every row of the columns of a UNdata_Export file, indexed by country"""
+    data_so_far = RecordList(CO2Emission(datetime.date(year, 1, 1), emission, country_registry.canonical_name(country))
+                             for (year, emission, country) in zip(columns['years'], columns['emissions'],
+                                                                  columns['countries']))
+    country_index.index_of(data_so_far)
+    return data_so_far
+
+
+@profiling.profiled
+def append_co2_emission(co2: List[CO2Emission], path: str = CO2_EMISSION_FILE,
+                        start_year: Optional[int] = None) -> int:
+    """Add to co2 the rows of a new release of UNdata_Export in the file path, from start_year on, for a country
+    and year that co2 does not have yet. The release is read as xml if path ends with .xml, and as csv otherwise.
+    The countries are written as their name in the temperature data.
+    What co2_store has computed from co2 is brought up to date with the added rows only.
+    Return how many rows were added"""
+    if path.endswith('.xml'):
+        release = iter_co2_emission_xml(path, start_year)
+    else:
+        release = iter_co2_emission(path, start_year)
+    rows = (CO2Emission(row.date, row.emission, country_registry.canonical_name(row.country)) for row in release)
+    return co2_store.append(co2, rows)
+
+
+def _parse_co2_emission() -> Dict[str, Union[array, List[str]]]:
+    """Parse the UNdata_Export csv file into the columns of co2_emission_convert"""
+    return _co2_emission_columns(iter_co2_emission(CO2_EMISSION_FILE))
+
+
+def _co2_emission_columns(rows: Iterator[CO2Emission]) -> Dict[str, Union[array, List[str]]]:
+    """Return the years, emissions and countries of rows as the columns of co2_emission_convert"""
+    years = array('h')
+    emissions = array('d')
+    countries = []
+    for row in rows:
+        years.append(row.year)
+        emissions.append(row.emission)
+        countries.append(sys.intern(row.country))
+    return {'years': years, 'emissions': emissions, 'countries': countries}
+
+
+@profiling.profiled
+def gdp_convert() -> GDPTable:
+    """Convert the data from GDP.csv into a GDPTable, with every country written as its name
+    in the temperature data"""
+    columns = data_cache.cached(GDP_FILE, _parse_gdp)
+    return GDPTable.from_columns({'rankings': columns['rankings'], 'gdps': columns['gdps'],
+                                  'countries': [country_registry.canonical_name(country)
+                                                for country in columns['countries']]})
+
+
+def _parse_gdp() -> Dict[str, Union[array, List[str]]]:
+    """Parse GDP.csv into the columns of gdp_convert"""
+    rankings = array('q')
+    gdps = []
+    countries = []
+    for row in iter_gdp(GDP_FILE):
+        rankings.append(row.ranking)
+        gdps.append(row.gdp)
+        countries.append(row.country)
+    return {'rankings': rankings, 'gdps': gdps, 'countries': countries}
+
+
+@profiling.profiled
+def global_co2_convert() -> List[GlobalCO2]:
+    """Convert the data from climate_change.csv"""
+    columns = data_cache.cached(GLOBAL_CO2_FILE, _parse_global_co2)
+    return RecordList(GlobalCO2(datetime.date(year, month, 1), emission)
+                      for (year, month, emission) in zip(columns['years'], columns['months'], columns['emissions']))
+
+
+def _parse_global_co2() -> Dict[str, array]:
+    """Parse climate_change.csv into the columns of global_co2_convert"""
+    years = array('h')
+    months = array('b')
+    emissions = array('d')
+    for row in iter_global_co2(GLOBAL_CO2_FILE):
+        years.append(row.year)
+        months.append(row.month)
+        emissions.append(row.emission)
+    return {'years': years, 'months': months, 'emissions': emissions}
+
+# This part reads the two temperature files in large chunks straight into columns. Every date in them is written
+# as YYYY-MM-DD, so a row is kept or dropped by comparing its first bytes with the bounds, and the rows of a
+# country are usually consecutive months, which are checked against a calendar in one comparison instead of
+# being decoded one at a time
+
+
+@profiling.profiled
+def read_temperature_columns(path: str, start_year: Optional[int] = None, end_year: Optional[int] = None,
+                             with_country: bool = False) -> Dict[str, Union[array, List[str]]]:
+    """Return the years, months and temperatures of every row in the temperature file path from start_year
+    to end_year (both included), where a missing temperature is nan. If with_country is True, the last field of
+    every row is its country, which is returned as a code into the list of names.
+    Raise ValueError if a row is not laid out like GlobalTemperatures.csv or GlobalLandTemperaturesByCountry.csv"""
+    columns = {'years': array('h'), 'months': array('b'), 'temperatures': array('d')}
+    codes = array('H')
+    names = []
+    name_to_code: Dict[bytes, int] = {}
+    low = None if start_year is None else b'%04d' % start_year
+    high = None if end_year is None else b'%04d' % (end_year + 1)
+    with open(path, 'rb') as file:
+        width = file.readline().count(b',') + 1
+        for data in _chunks(file):
+            if not with_country:
+                rows = data.split(b'\n')
+                rows.pop()
+                _add_rows(columns, rows, width, low, high)
+                continue
+            start = 0
+            while start < len(data):
+                (country, end) = _country_block(data, start)
+                rows = data[start:end].split(b'\n')
+                rows.pop()
+                if data.count(b',' + country + b'\n', start, end) != len(rows):
+                    raise ValueError('The rows of ' + _decode_field(country) + ' in ' + path + ' are not together')
+                added = _add_rows(columns, rows, width + country.count(b','), low, high)
+                if added > 0:
+                    if country not in name_to_code:
+                        name_to_code[country] = len(names)
+                        names.append(sys.intern(_decode_field(country)))
+                    codes.extend(array('H', [name_to_code[country]]) * added)
+                start = end
+    if with_country:
+        columns['codes'] = codes
+        columns['names'] = names
+    return columns
+
+
+def _chunks(file: BinaryIO) -> Iterator[bytes]:
+    """Yield the rest of file CHUNK_SIZE bytes at a time, where every chunk ends with a whole line and
+    ends its lines with a line feed only. A line cut at the end of a chunk is kept for the next one"""
+    rest = b''
+    chunk = file.read(CHUNK_SIZE)
+    while chunk != b'':
+        data = rest + chunk
+        cut = data.rfind(b'\n') + 1
+        rest = data[cut:]
+        if cut > 0 and b'\r' in data:
+            yield data[:cut].replace(b'\r\n', b'\n')
+        elif cut > 0:
+            yield data[:cut]
+        chunk = file.read(CHUNK_SIZE)
+    if rest.strip() != b'':
+        yield rest.rstrip(b'\r') + b'\n'
+
+
+def _country_block(data: bytes, start: int) -> Tuple[bytes, int]:
+    """Return the country of the row at start in data and where the rows of that country right after it end.
+    The end is found by bisecting the rows, as the rows of every country are together"""
+    first_end = data.index(b'\n', start) + 1
+    fields = data[start:first_end - 1].split(b',', 3)
+    if len(fields) != 4:
+        raise ValueError('The row ' + repr(data[start:first_end]) + ' does not have four fields')
+    suffix = b',' + fields[3] + b'\n'
+    low = first_end
+    high = len(data)
+    while low < high:
+        row_start = max(data.rfind(b'\n', 0, (low + high) // 2) + 1, low)
+        row_end = data.index(b'\n', row_start) + 1
+        if data.endswith(suffix, row_start, row_end):
+            low = row_end
+        else:
+            high = row_start
+    return (fields[3], low)
+
+
+def _add_rows(columns: Dict[str, array], rows: List[bytes], width: int, low: Optional[bytes],
+              high: Optional[bytes]) -> int:
+    """Add the year, month and temperature of every row in rows that starts from low and before high to columns,
+    where every row has width fields, and return how many rows were added"""
+    if low is not None or high is not None:
+        rows = _between(rows, low, high)
+    if rows == []:
+        return 0
+    fields = b','.join(rows).split(b',')
+    if len(fields) != width * len(rows):
+        raise ValueError('A row does not have ' + str(width) + ' fields')
+    dates = fields[0::width]
+    (calendar, calendar_index, calendar_years, calendar_months) = _calendar()
+    first = calendar_index.get(dates[0])
+    if first is not None and calendar[first:first + len(dates)] == dates:
+        columns['years'].extend(calendar_years[first:first + len(dates)])
+        columns['months'].extend(calendar_months[first:first + len(dates)])
+    else:
+        year_of = {}
+        month_of = {}
+        for date in set(dates):
+            if len(date) != 10 or date[4:5] != b'-' or date[7:8] != b'-' or date[8:] != b'01':
+                raise ValueError('The date ' + repr(date) + ' is not the first day of a month written as YYYY-MM-DD')
+            year_of[date] = int(date[:4])
+            month_of[date] = int(date[5:7])
+        columns['years'].extend(map(year_of.__getitem__, dates))
+        columns['months'].extend(map(month_of.__getitem__, dates))
+    temperatures = fields[1::width]
+    if b'' in temperatures:
+        temperatures = [temperature or b'nan' for temperature in temperatures]
+    columns['temperatures'].extend(map(float, temperatures))
+    return len(rows)
+
+
+def _between(rows: List[bytes], low: Optional[bytes], high: Optional[bytes]) -> List[bytes]:
+    """Return the rows in rows that start from low and before high. The rows are found by bisecting rows, as
+    the rows of a file are sorted by date, and one at a time if they turn out not to be"""
+    start = 0 if low is None else bisect_left(rows, low)
+    end = len(rows) if high is None else max(bisect_left(rows, high), start)
+    kept = rows[start:end]
+    if (start == 0 or max(rows[:start]) < low) and (end == len(rows) or min(rows[end:]) >= high) \
+            and (kept == [] or ((low is None or min(kept) >= low) and (high is None or max(kept) < high))):
+        return kept
+    return [row for row in rows if (low is None or row >= low) and (high is None or row < high)]
+
+
+@functools.lru_cache(maxsize=None)
+def _calendar() -> Tuple[List[bytes], Dict[bytes, int], array, array]:
+    """Return the first day of every month from CALENDAR_YEARS written as YYYY-MM-DD, where every date is in,
+    and the year and the month of every date"""
+    dates = [b'%04d-%02d-01' % (year, month) for year in CALENDAR_YEARS for month in range(1, 13)]
+    years = array('h', [year for year in CALENDAR_YEARS for _ in range(12)])
+    months = array('b', list(range(1, 13)) * len(CALENDAR_YEARS))
+    return (dates, {dates[i]: i for i in range(len(dates))}, years, months)
+
+
+def _decode_field(field: bytes) -> str:
+    """Return the text of the last field of a csv row, without its quotes"""
+    text = field.decode('utf-8')
+    if text.startswith('"'):
+        return next(csv.reader([text]))[0]
+    return text
+
+# This part reads the csv files one row at a time. The rows that are filtered out by start_year, end_year
+# or countries are skipped before they are turned into a dataclass
+
+
+def iter_global_temperatures(path: str = GLOBAL_TEMPERATURE_FILE, start_year: Optional[int] = None,
+                             end_year: Optional[int] = None) -> Iterator[GlobalTemperature]:
+    """Yield every GlobalTemperature in the file path from start_year to end_year (both included)"""
+    with open(path) as file:
+        reader = csv.reader(file)
+        next(reader)
+        for row in reader:
+            dates = str.split(row[0], '-')
+            year = int(dates[0])
+            if _in_years(year, start_year, end_year):
+                date = datetime.date(year, int(dates[1]), int(dates[2]))
+                if row[1] == '':
+                    yield GlobalTemperature(date, None)
+                else:
+                    yield GlobalTemperature(date, float(row[1]))
+
+
+def iter_country_temperatures(path: str = COUNTRY_TEMPERATURE_FILE, start_year: Optional[int] = None,
+                              end_year: Optional[int] = None,
+                              countries: Optional[set] = None) -> Iterator[CountryTemperature]:
+    """Yield every CountryTemperature in the file path from start_year to end_year (both included)
+    of the given countries. Every country is kept if countries is None"""
+    with open(path) as file:
+        reader = csv.reader(file)
+        next(reader)
+        for row in reader:
+            if countries is not None and row[3] not in countries:
+                continue
+            dates = str.split(row[0], '-')
+            year = int(dates[0])
+            if _in_years(year, start_year, end_year):
+                date = datetime.date(year, int(dates[1]), int(dates[2]))
+                if row[1] != '':
+                    yield CountryTemperature(date, float(row[1]), row[3])
+                else:
+                    yield CountryTemperature(date, None, row[3])
+
+
+def iter_co2_emission(path: str = CO2_EMISSION_FILE, start_year: Optional[int] = None,
+                      end_year: Optional[int] = None, countries: Optional[set] = None) -> Iterator[CO2Emission]:
+    """Yield every CO2Emission in the UNdata_Export file path from start_year to end_year (both included)
+    of the given countries. Every country is kept if countries is None"""
+    with open(path) as file:
+        reader = csv.reader(file)
+        next(reader)
+        for row in reader:
+            if countries is not None and row[0] not in countries:
+                continue
+            year = int(row[1])
+            if _in_years(year, start_year, end_year):
+                yield CO2Emission(datetime.date(year, 1, 1), float(row[2]), row[0])
+
+
+def iter_co2_emission_xml(path: str = CO2_EMISSION_XML_FILE, start_year: Optional[int] = None,
+                          end_year: Optional[int] = None,
+                          countries: Optional[set] = None) -> Iterator[CO2Emission]:
+    """Yield every CO2Emission in the xml form of the UNdata_Export file path from start_year to end_year
+    (both included) of the given countries. Every country is kept if countries is None.
+    Every <record> is removed from the tree as soon as its <field>s are read, so only one record is kept in
+    memory at a time"""
+    parents = []
+    for (event, element) in ElementTree.iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            parents.append(element)
+            continue
+        parents.pop()
+        if element.tag != 'record':
+            continue
+        fields = {field.get('name'): field.text for field in element}
+        parents[-1].remove(element)
+        country = fields['Country or Area']
+        if countries is not None and country not in countries:
+            continue
+        year = int(fields['Year'])
+        if _in_years(year, start_year, end_year):
+            yield CO2Emission(datetime.date(year, 1, 1), float(fields['Value']), country)
+
+
+def iter_gdp(path: str = GDP_FILE, countries: Optional[set] = None) -> Iterator[GDP]:
+    """Yield the GDP of the given countries in the file path, until the first row without a ranking.
+    Every country is kept if countries is None"""
+    with open(path) as file:
+        reader = csv.reader(file)
+        next(reader)
+        next(reader)
+        next(reader)
+        next(reader)
+        next(reader)
+        for row in reader:
+            if row[1] == '':
+                return
+            if countries is None or row[3] in countries:
+                yield GDP(int(row[1]), row[4], row[3])
+
+
+def iter_global_co2(path: str = GLOBAL_CO2_FILE, start_year: Optional[int] = None,
+                    end_year: Optional[int] = None) -> Iterator[GlobalCO2]:
+    """Yield every GlobalCO2 in the file path from start_year to end_year (both included)"""
+    with open(path) as file:
+        reader = csv.reader(file)
+        next(reader)
+        for row in reader:
+            year = int(row[0])
+            if _in_years(year, start_year, end_year):
+                yield GlobalCO2(datetime.date(year, int(row[1]), 1), float(row[3]))
+
+
+def _in_years(year: int, start_year: Optional[int], end_year: Optional[int]) -> bool:
+    """Return whether year is from start_year to end_year (both included). A bound that is None is ignored"""
+    return (start_year is None or year >= start_year) and (end_year is None or year <= end_year)
+
+
+@profiling.profiled
+def mutate_united_states(co2: List[CO2Emission]) -> List[CO2Emission]:
+    """Mutate the dataset within co2_data so that every country written there, such as
+    United States of America, matches with the one in country_data and gdp,
+    which is written as United States. The rows made by co2_emission_convert already match, so they
+    are left as they are"""
+    renamed = False
+    for row in co2:
+        name = country_registry.canonical_name(row.country)
+        if name != row.country:
+            row.country = name
+            renamed = True
+    if renamed:
+        country_index.forget(co2)
+        co2_store.forget(co2)
+        country_index.index_of(co2)
+        memo.touch(co2)
+    return co2
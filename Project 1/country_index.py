@@ -0,0 +1,97 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file indexes a list of dataclasses by country and year, so that the rows of one country
+within a range of years can be found without going through the whole list"""
+
+import functools
+import weakref
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+
+class CountryIndex:
+    """An index of a list of dataclasses that have a date, a year and a country, such as CO2Emission
+    Instance Attributes
+        - rows: maps every country to its rows, sorted by date
+        - years: maps every country to the year of each of its rows, in the same order as rows
+    Representative Invariants:
+        - all(len(self.rows[country]) == len(self.years[country]) for country in self.rows)
+        - all(self.years[country] == sorted(self.years[country]) for country in self.years)
+    """
+    rows: Dict[str, list]
+    years: Dict[str, List[int]]
+
+    def __init__(self, data: list) -> None:
+        """Initialize the index of the given data. The countries are kept in the order they first
+        appear in data"""
+        self.rows = {}
+        for row in data:
+            if row.country not in self.rows:
+                self.rows[row.country] = [row]
+            else:
+                self.rows[row.country].append(row)
+        self.years = {}
+        for country in self.rows:
+            self.rows[country].sort(key=lambda x: x.date)
+            self.years[country] = [row.year for row in self.rows[country]]
+
+    def select(self, nation: str, start_year: Optional[int] = None, end_year: Optional[int] = None) -> list:
+        """Return the rows of the given nation from start_year to end_year (both included), sorted by date"""
+        if nation not in self.rows:
+            return []
+        years = self.years[nation]
+        start = 0 if start_year is None else bisect_left(years, start_year)
+        end = len(years) if end_year is None else bisect_right(years, end_year)
+        return self.rows[nation][start:end]
+
+    def add(self, row: object) -> None:
+        """Add row to the index, after the rows of its country from the same year or before"""
+        if row.country not in self.rows:
+            self.rows[row.country] = [row]
+            self.years[row.country] = [row.year]
+        else:
+            position = bisect_right(self.years[row.country], row.year)
+            self.rows[row.country].insert(position, row)
+            self.years[row.country].insert(position, row.year)
+
+
+# Maps the id of every indexed list to a weak reference to the list and its index. The index is dropped as soon
+# as the list is garbage collected, so indexing a list does not keep it alive
+_indexes: Dict[int, Tuple[weakref.ref, CountryIndex]] = {}
+
+
+def index_of(data: list) -> CountryIndex:
+    """Return the CountryIndex of data, building it the first time data is indexed. The index is only kept if
+    data can be weakly referenced, such as a records.RecordList, and is built again every time otherwise"""
+    entry = _indexes.get(id(data))
+    if entry is not None and entry[0]() is data:
+        return entry[1]
+    index = CountryIndex(data)
+    try:
+        reference = weakref.ref(data, functools.partial(_collect, id(data)))
+    except TypeError:
+        return index
+    _indexes[id(data)] = (reference, index)
+    return index
+
+
+def forget(data: list) -> None:
+    """Forget the index of data. This must be called whenever the rows of data are mutated"""
+    _indexes.pop(id(data), None)
+
+
+def _collect(identity: int, reference: weakref.ref) -> None:
+    """Drop the index of the list of id identity, which reference referred to, as it was garbage collected"""
+    entry = _indexes.get(identity)
+    if entry is not None and entry[0] is reference:
+        del _indexes[identity]
@@ -0,0 +1,142 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file gives every country a single name and number, whichever dataset it comes from. The CO2 data
+uses the names of the UN, the GDP data the names of the World Bank and the temperature data the names of
+Berkeley Earth, so the same country can be written in three ways. The names of Berkeley Earth are the ones kept"""
+
+import threading
+from typing import Dict, Iterable, List
+
+# Maps the UN and World Bank names of a country to its Berkeley Earth name
+ALIASES = {
+    # UN names
+    'United States of America': 'United States',
+    'United Kingdom of Great Britain and Northern Ireland': 'United Kingdom',
+    'Russian Federation': 'Russia',
+    'Czechia': 'Czech Republic',
+    'Türkiye': 'Turkey',
+    'Republic of Korea': 'South Korea',
+    "Democratic People's Republic of Korea": 'North Korea',
+    'Iran (Islamic Republic of)': 'Iran',
+    'Venezuela (Bolivarian Republic of)': 'Venezuela',
+    'Bolivia (Plurinational State of)': 'Bolivia',
+    'Syrian Arab Republic': 'Syria',
+    "Lao People's Democratic Republic": 'Laos',
+    'Viet Nam': 'Vietnam',
+    'Republic of Moldova': 'Moldova',
+    'United Republic of Tanzania': 'Tanzania',
+    'Democratic Republic of the Congo': 'Congo (Democratic Republic Of The)',
+    "Côte d'Ivoire": "Côte D'Ivoire",
+    'North Macedonia': 'Macedonia',
+    'The former Yugoslav Republic of Macedonia': 'Macedonia',
+    'Myanmar': 'Burma',
+    'Brunei Darussalam': 'Brunei',
+    'Cabo Verde': 'Cape Verde',
+    'Eswatini': 'Swaziland',
+    'Timor-Leste': 'Timor Leste',
+    'State of Palestine': 'Palestina',
+    'Micronesia (Federated States of)': 'Federated States Of Micronesia',
+    'China, Hong Kong SAR': 'Hong Kong',
+    'China, Macao SAR': 'Macau',
+    'Bosnia and Herzegovina': 'Bosnia And Herzegovina',
+    'Antigua and Barbuda': 'Antigua And Barbuda',
+    'Trinidad and Tobago': 'Trinidad And Tobago',
+    'Saint Kitts and Nevis': 'Saint Kitts And Nevis',
+    'Saint Vincent and the Grenadines': 'Saint Vincent And The Grenadines',
+    'Sao Tome and Principe': 'Sao Tome And Principe',
+    'Guinea-Bissau': 'Guinea Bissau',
+    'Isle of Man': 'Isle Of Man',
+    'Turks and Caicos Islands': 'Turks And Caicas Islands',
+    'United States Virgin Islands': 'Virgin Islands',
+    # World Bank names
+    'Bahamas, The': 'Bahamas',
+    'Gambia, The': 'Gambia',
+    'Congo, Dem. Rep.': 'Congo (Democratic Republic Of The)',
+    'Congo, Rep.': 'Congo',
+    'Egypt, Arab Rep.': 'Egypt',
+    'Iran, Islamic Rep.': 'Iran',
+    'Yemen, Rep.': 'Yemen',
+    'Korea, Rep.': 'South Korea',
+    "Korea, Dem. People's Rep.": 'North Korea',
+    'Venezuela, RB': 'Venezuela',
+    'Kyrgyz Republic': 'Kyrgyzstan',
+    'Lao PDR': 'Laos',
+    'Slovak Republic': 'Slovakia',
+    'Hong Kong SAR, China': 'Hong Kong',
+    'Macao SAR, China': 'Macau',
+    'Micronesia, Fed. Sts.': 'Federated States Of Micronesia',
+    'St. Kitts and Nevis': 'Saint Kitts And Nevis',
+    'St. Lucia': 'Saint Lucia',
+    'St. Vincent and the Grenadines': 'Saint Vincent And The Grenadines',
+    'São Tomé and Principe': 'Sao Tome And Principe',
+    'Virgin Islands (U.S.)': 'Virgin Islands',
+    'West Bank and Gaza': 'Palestina',
+}
+
+
+class CountryRegistry:
+    """Gives every country a number, which is the same for every name the country is written as
+    Instance Attributes
+        - names: the Berkeley Earth name of every country, where the number of a country is its index
+        - ids: maps every name of every country, including its aliases, to its number
+    Representative Invariants:
+        - all(self.names[self.ids[name]] == name for name in self.names)
+    """
+    names: List[str]
+    ids: Dict[str, int]
+    _lock: threading.Lock
+
+    def __init__(self, aliases: Dict[str, str]) -> None:
+        """Initialize the registry with the countries of aliases, where aliases maps a name to the name that
+        is kept"""
+        self.names = []
+        self.ids = {}
+        self._lock = threading.Lock()
+        for alias in aliases:
+            self.ids[alias] = self.id_of(aliases[alias])
+
+    def id_of(self, name: str) -> int:
+        """Return the number of the country written as name. A name that has not been seen before is
+        a new country"""
+        if name not in self.ids:
+            with self._lock:
+                if name not in self.ids:
+                    self.ids[name] = len(self.names)
+                    self.names.append(name)
+        return self.ids[name]
+
+    def canonical(self, name: str) -> str:
+        """Return the name that is kept for the country written as name"""
+        return self.names[self.id_of(name)]
+
+    def ids_of(self, names: Iterable[str]) -> set:
+        """Return the numbers of the countries written as names"""
+        return {self.id_of(name) for name in names}
+
+
+# The registry shared by every dataset
+registry = CountryRegistry(ALIASES)
+
+
+def canonical_name(name: str) -> str:
+    """Return the name that is kept for the country written as name"""
+    return registry.canonical(name)
+
+
+def in_all(*groups: Iterable[str]) -> set:
+    """Return the names that are kept for the countries that are in every one of groups, whichever way they
+    are written in each group"""
+    common = registry.ids_of(groups[0])
+    for group in groups[1:]:
+        common &= registry.ids_of(group)
+    return {registry.names[i] for i in common}
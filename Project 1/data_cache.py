@@ -0,0 +1,157 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file keeps a binary copy of every parsed dataset in the .cache folder. The copy is memory mapped
+when it is loaded, so the csv files only need to be parsed again whenever they change, or whenever the format of
+the cache or the parsers of converting_data change"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+CACHE_DIRECTORY = '.cache'
+
+# Every cache file starts with MAGIC, followed by the length of the header and the header itself in json.
+# The bytes of every column come after the header, each starting at a multiple of ALIGNMENT. The offsets
+# in the header are counted from the first multiple of ALIGNMENT after the header. The number at the end of
+# MAGIC is the version of this format
+MAGIC = b'CSC110CACHE2'
+ALIGNMENT = 8
+
+# The version of the columns parsed by converting_data, which is part of the key of every cache file. It must be
+# increased whenever a parser returns different columns, so that the cache files of the older parser are not used
+PARSER_VERSION = 1
+
+Column = Union[array, memoryview, List[str]]
+
+
+def cached(source: str, parse: Callable[[], Dict[str, Column]]) -> Dict[str, Column]:
+    """Return the columns parsed from the file source. The columns are read from the cache if the cache
+    is up to date with source. Otherwise they are parsed with parse and stored in the cache.
+    A column is either an array or a list of strings"""
+    columns = load(source)
+    if columns is None:
+        columns = parse()
+        store(source, columns)
+    return columns
+
+
+def load(source: str) -> Optional[Dict[str, Column]]:
+    """Return the cached columns of the file source, or None if they are not cached, if source has changed
+    since they were cached or if the cache file is not valid. The arrays are returned as memoryviews of the memory
+    mapped cache file, which is closed once every one of them is garbage collected, and right away otherwise"""
+    path = _cache_path(source)
+    try:
+        with open(path, 'rb') as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        (header, data_start) = _read_header(mapped, source)
+    except (OSError, ValueError, KeyError, TypeError, struct.error):
+        mapped.close()
+        return None
+
+    data = memoryview(mapped)
+    columns = {}
+    try:
+        for name, typecode, offset, length in header['columns']:
+            start = data_start + offset
+            if typecode == 'str':
+                columns[name] = mapped[start:start + length].decode('utf-8').split('\0') if length > 0 else []
+            else:
+                columns[name] = data[start:start + length].cast(typecode)
+    except ValueError:
+        # A column of strings is not valid utf-8, so every view is released before the file is closed
+        for column in columns.values():
+            if isinstance(column, memoryview):
+                column.release()
+        data.release()
+        mapped.close()
+        return None
+    data.release()
+    if all(isinstance(column, list) for column in columns.values()):
+        mapped.close()
+    return columns
+
+
+def store(source: str, columns: Dict[str, Column]) -> None:
+    """Write the columns parsed from the file source into the cache. Nothing is written if the
+    cache folder can not be written to"""
+    sections = []
+    for name in columns:
+        if isinstance(columns[name], list):
+            sections.append((name, 'str', '\0'.join(columns[name]).encode('utf-8')))
+        else:
+            column = memoryview(columns[name])
+            sections.append((name, column.format, column.tobytes()))
+
+    layout = []
+    offset = 0
+    for (name, typecode, raw) in sections:
+        layout.append([name, typecode, offset, len(raw)])
+        offset = _align(offset + len(raw))
+    header = json.dumps({'key': _key(source), 'columns': layout}).encode('utf-8')
+    data_start = _align(len(MAGIC) + 8 + len(header))
+
+    path = _cache_path(source)
+    try:
+        os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+        with open(path + '.tmp', 'wb') as file:
+            file.write(MAGIC + struct.pack('<Q', len(header)) + header)
+            for (column, (_, _, raw)) in zip(layout, sections):
+                file.write(b'\0' * (data_start + column[2] - file.tell()))
+                file.write(raw)
+        os.replace(path + '.tmp', path)
+    except OSError:
+        pass
+
+
+def _read_header(mapped: mmap.mmap, source: str) -> Tuple[dict, int]:
+    """Return the header of the cache file mapped and where its columns start. Raise ValueError if mapped is
+    not a cache file of the current version of source or if its columns do not fit in it, and any of OSError,
+    KeyError, TypeError or struct.error if it can not be read"""
+    if mapped[:len(MAGIC)] != MAGIC:
+        raise ValueError('Not a cache file of this format')
+    (header_length,) = struct.unpack_from('<Q', mapped, len(MAGIC))
+    header_start = len(MAGIC) + 8
+    header = json.loads(bytes(mapped[header_start:header_start + header_length]))
+    if header['key'] != _key(source):
+        raise ValueError('The cache file is out of date')
+    data_start = _align(header_start + header_length)
+    for (_, typecode, offset, length) in header['columns']:
+        size = 1 if typecode == 'str' else array(typecode).itemsize
+        if offset < 0 or length < 0 or length % size != 0 or data_start + offset + length > len(mapped):
+            raise ValueError('A column does not fit in the cache file')
+    return (header, data_start)
+
+
+def _key(source: str) -> list:
+    """Return what identifies the current version of the file source: the version of its parser, its path,
+    size and modification time"""
+    status = os.stat(source)
+    return [PARSER_VERSION, os.path.abspath(source), status.st_size, status.st_mtime_ns]
+
+
+def _cache_path(source: str) -> str:
+    """Return the path of the cache file of the file source"""
+    digest = hashlib.sha1(os.path.abspath(source).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(CACHE_DIRECTORY, os.path.basename(source)[:40] + '-' + digest + '.bin')
+
+
+def _align(offset: int) -> int:
+    """Return the first multiple of ALIGNMENT that is at least offset"""
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
@@ -0,0 +1,76 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file names the five datasets of the project without loading them. A dataset is only loaded the first
+time it is used, and is kept afterwards, so drawing one graph only costs the datasets that graph needs. Every
+dataset loaded is registered with memo, so the results of the helper functions called with it are remembered"""
+
+import threading
+from typing import Callable, Dict, Optional
+
+import converting_data
+import memo
+
+# Maps the name of every dataset to the function that loads it
+LOADERS: Dict[str, Callable[[], object]] = {
+    'country_data': converting_data.convert_country_temperatures,
+    'global_data': converting_data.convert_global_temperatures,
+    'co2_data': lambda: converting_data.mutate_united_states(converting_data.co2_emission_convert()),
+    'gdp_data': converting_data.gdp_convert,
+    'global_co2': converting_data.global_co2_convert,
+}
+
+
+class DatasetRegistry:
+    """The datasets of the project, each loaded the first time it is used. A dataset can be used either as an
+    attribute, such as registry.country_data, or as a key, such as registry['country_data']
+    Instance Attributes
+        - loaders: maps the name of every dataset to the function that loads it
+        - _loaded: maps the name of every dataset loaded so far to the dataset
+        - _locks: maps the name of every dataset to the lock held while it is loaded, so that it is loaded once
+          even if many threads use it, while other datasets are loaded at the same time
+    """
+    loaders: Dict[str, Callable[[], object]]
+    _loaded: Dict[str, object]
+    _locks: Dict[str, threading.Lock]
+
+    def __init__(self, loaders: Optional[Dict[str, Callable[[], object]]] = None) -> None:
+        """Initialize the registry of the datasets loaded by loaders, or of the five datasets in LOADERS if
+        loaders is None. Nothing is loaded yet"""
+        self.loaders = LOADERS if loaders is None else loaders
+        self._loaded = {}
+        self._locks = {name: threading.Lock() for name in self.loaders}
+
+    def __getitem__(self, name: str) -> object:
+        """Return the dataset called name, loading it if it is the first time it is used"""
+        if name not in self._loaded:
+            if name not in self.loaders:
+                raise KeyError(name)
+            with self._locks[name]:
+                if name not in self._loaded:
+                    dataset = self.loaders[name]()
+                    memo.register(dataset)
+                    self._loaded[name] = dataset
+        return self._loaded[name]
+
+    def __getattr__(self, name: str) -> object:
+        """Return the dataset called name, loading it if it is the first time it is used"""
+        if name.startswith('_') or name == 'loaders':
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def loaded(self) -> set:
+        """Return the names of the datasets loaded so far"""
+        return set(self._loaded)
@@ -0,0 +1,80 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file contains the table that stores GDP.csv. The GDP of every country is stored as a number, and
+the table is never changed once it is made, so the same table can be ranked by many graphs at once"""
+
+import math
+from array import array
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+
+class GDPTable:
+    """The dataset from GDP.csv stored column by column, from the highest GDP to the lowest. The row i of the
+    table is the country countries[i], ranked rankings[i] with a GDP of gdps[i]
+    Instance Attributes
+        - rankings: the ranking of every row, from highest to lowest GDP
+        - gdps: the GDP of every row in millions of USD, nan if it is missing
+        - countries: the name of the country of every row
+        - ranks: maps the name of every country to its ranking
+        - _rows: maps the name of every country to its row
+    Representative Invariants:
+        - len(self.rankings) == len(self.gdps) == len(self.countries)
+        - list(self.rankings) == sorted(self.rankings)
+        - all(self.ranks[self.countries[i]] == self.rankings[i] for i in range(len(self)))
+    """
+    rankings: memoryview
+    gdps: memoryview
+    countries: Tuple[str, ...]
+    ranks: Mapping[str, int]
+    _rows: Dict[str, int]
+
+    def __init__(self, rankings: Sequence[int], gdps: Sequence[float], countries: Sequence[str]) -> None:
+        """Initialize the table from its columns, which must already be sorted by ranking"""
+        self.rankings = memoryview(array('q', rankings)).toreadonly()
+        self.gdps = memoryview(array('d', gdps)).toreadonly()
+        self.countries = tuple(countries)
+        self._rows = {country: row for row, country in enumerate(self.countries)}
+        self.ranks = MappingProxyType({country: self.rankings[self._rows[country]] for country in self._rows})
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Union[Sequence[int], List[str]]]) -> 'GDPTable':
+        """Return the table of the columns parsed from GDP.csv, where the GDP is written as in the file,
+        such as " 21,427,700 " """
+        return cls(columns['rankings'], [parse_gdp(gdp) for gdp in columns['gdps']], columns['countries'])
+
+    def __len__(self) -> int:
+        """Return the amount of countries in the table"""
+        return len(self.countries)
+
+    def gdp_of(self, country: str) -> Optional[float]:
+        """Return the GDP of country, or None if it is not in the table"""
+        if country not in self._rows:
+            return None
+        return self.gdps[self._rows[country]]
+
+    def rerank(self, countries: set) -> 'GDPTable':
+        """Return a new table of only the given countries that are in this table, ranked from 1 in the
+        same order. This table is left as it is"""
+        rows = sorted(self._rows[country] for country in countries if country in self._rows)
+        return GDPTable(range(1, len(rows) + 1), [self.gdps[row] for row in rows],
+                        [self.countries[row] for row in rows])
+
+
+def parse_gdp(gdp: str) -> float:
+    """Return the GDP written in GDP.csv as a number, such as 21427700.0 for " 21,427,700 ",
+    or nan if it is not a number"""
+    try:
+        return float(gdp.replace(',', ''))
+    except ValueError:
+        return math.nan
@@ -9,87 +9,166 @@ distribution of this code, whether as given or with any changes, are
 expressly prohibited.
 
 This file is Copyright (c) 2020 Jason Sastra
-This python file is used to draw the global maps"""
+This python file is used to draw the global maps. Every csv file is read into a frame the first time a map
+needs it, and that frame is shared by every map drawn afterwards"""
 
 
+import functools
+from typing import Optional, Union
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objs as go
+import converting_data
+import profiling
+import render
 
+RESOLUTIONS = ('monthly', 'yearly', 'decadal')
 
-def draw_global_graph_temperature(start_date: str, end_date: str) -> None:
+
+@profiling.profiled
+@functools.lru_cache(maxsize=None)
+def temperature_frame() -> pd.DataFrame:
+    """Return the temperature of every country for every month in GlobalLandTemperaturesByCountry.csv without the
+    missing temperatures. The rows are indexed by their date and sorted by date, then by country.
+    The frame is shared by every caller, so it must not be mutated"""
+    data = pd.read_csv(converting_data.COUNTRY_TEMPERATURE_FILE, usecols=['dt', 'AverageTemperature', 'Country'],
+                       parse_dates=['dt'], dtype={'Country': 'category'})
+    clean_data = data.dropna()
+    grouped = clean_data.groupby(['dt', 'Country'], observed=True)['AverageTemperature'].sum()
+    return grouped.reset_index(level='Country')
+
+
+@profiling.profiled
+@functools.lru_cache(maxsize=None)
+def co2_frame() -> pd.DataFrame:
+    """Return the CO2 emission of every country for every year in the UNdata csv file without the missing values.
+    The rows are indexed by their year and sorted by year, then by country.
+    The frame is shared by every caller, so it must not be mutated"""
+    data = pd.read_csv(converting_data.CO2_EMISSION_FILE, dtype={'Country or Area': 'category'})
+    clean_data = data.dropna()
+    grouped = clean_data.groupby(['Year', 'Country or Area'], observed=True)['Value'].sum()
+    return grouped.reset_index(level='Country or Area')
+
+
+def forget_frames() -> None:
+    """Forget the frames read so far, so that the next map reads its csv file again, such as after the csv files
+    were changed"""
+    for frame in (temperature_frame, co2_frame):
+        while not hasattr(frame, 'cache_clear'):
+            frame = frame.__wrapped__
+        frame.cache_clear()
+
+
+def _by_period(data: pd.DataFrame, resolution: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """Return the mean temperature of every country in every month, year or decade of data, depending on
+    resolution, where data is the rows after start and up to and including end. A year or decade that is only
+    partly after start or up to end is left out, so that every period is the mean of all of its months.
+    The period is written as a string in the column dt, and the rows are sorted by period"""
+    if resolution == 'monthly':
+        return data.assign(dt=data.index.strftime('%Y-%m-%d')).reset_index(drop=True)
+    first_year = start.year + 1
+    last_year = end.year if end.month == 12 else end.year - 1
+    if resolution == 'decadal':
+        first_year = (first_year + 9) // 10 * 10
+        last_year = (last_year + 1) // 10 * 10 - 1
+    data = data[(data.index.year >= first_year) & (data.index.year <= last_year)]
+    if resolution == 'yearly':
+        periods = data.index.year.astype(str)
+    elif resolution == 'decadal':
+        periods = (data.index.year // 10 * 10).astype(str) + 's'
+    else:
+        raise ValueError('Unknown resolution ' + repr(resolution) + ', expected one of ' + str(RESOLUTIONS))
+    grouped = data.groupby([periods.rename('dt'), 'Country'], observed=True)['AverageTemperature'].mean()
+    return grouped.reset_index()
+
+
+def _between(frame: pd.DataFrame, start: Union[pd.Timestamp, int], end: Union[pd.Timestamp, int]) -> pd.DataFrame:
+    """Return the rows of frame with an index after start and up to and including end, without copying them"""
+    return frame.iloc[frame.index.searchsorted(start, side='right'):frame.index.searchsorted(end, side='right')]
+
+
+@profiling.profiled
+def draw_global_graph_temperature(start_date: str, end_date: str,
+                                  target: Optional[render.RenderTarget] = None) -> go.Figure:
     """draw global graph of the effects of global warming
     start and end date must be in the format YYYY-MM-DD
     Representative Invariant:
         - start_date >= '1750-01-01'
         - end_date <= '2013-01-01'
         - start_date > end_date"""
-    data = pd.read_csv("GlobalLandTemperaturesByCountry.csv")
-    data = data.drop("AverageTemperatureUncertainty", axis=1)
-    clean_data = data.dropna()
-    sorted_data = clean_data.groupby(['Country', 'dt']).sum().reset_index().sort_values('dt', ascending=False)
-    range_of_date = (sorted_data['dt'] > start_date) & (sorted_data['dt'] <= end_date)
-    graphed_data = sorted_data.loc[range_of_date]
+    graphed_data = _between(temperature_frame(), pd.Timestamp(start_date), pd.Timestamp(end_date)).iloc[::-1]
 
     fig = go.Figure(data=go.Choropleth(locations=graphed_data['Country'], locationmode='country names',
                                        z=graphed_data['AverageTemperature'], colorscale='icefire'))
     fig.update_layout(title_text='Global Warming', geo=dict(showcoastlines=False, projection_type='equirectangular'))
-    fig.show()
+    return render.render(fig, target)
 
 
-def draw_global_graph_co2(start_year: int, end_year: int) -> None:
+@profiling.profiled
+def draw_global_graph_co2(start_year: int, end_year: int, target: Optional[render.RenderTarget] = None) -> go.Figure:
     """Draw global graph of the amount of CO2 emission. Start and end date must be only year
     Representative Invariants:
         - start_year >= 1990
         - end_year <= 2017
         - start_date > end_date"""
-    data = pd.read_csv("UNdata_Export_20201102_015629836, Carbon dioxide (CO2) Emissions without Land Use, Land-Use Change and Forestry (LULUCF), in kilotonne CO2 equi.csv")
-    clean_data = data.dropna()
-    sorted_data = clean_data.groupby(['Country or Area', 'Year']).sum().reset_index().sort_values('Year', ascending=False)
-    range_of_date = (sorted_data['Year'] > start_year) & (sorted_data['Year'] <= end_year)
-    graphed_data = sorted_data.loc[range_of_date]
+    graphed_data = _between(co2_frame(), start_year, end_year).iloc[::-1]
 
     fig = go.Figure(data=go.Choropleth(locations=graphed_data['Country or Area'], locationmode='country names',
                     z=graphed_data['Value'], colorscale=['grey', 'black']))
     fig.update_layout(title_text='CO2 Emission', geo=dict(showcoastlines=False, projection_type='equirectangular'))
-    fig.show()
+    return render.render(fig, target)
 
 
-def draw_changing_global_graph_temperature(start_date: str, end_date: str) -> None:
+@profiling.profiled
+def draw_changing_global_graph_temperature(start_date: str, end_date: str, resolution: str = 'monthly',
+                                           max_frames: Optional[int] = None, compact: bool = False,
+                                           target: Optional[render.RenderTarget] = None) -> go.Figure:
     """Draw global graph of the effects of global warming. Including the change throughout the years.
-    start and end date must be in the format YYYY-MM-DD
+    start and end date must be in the format YYYY-MM-DD. Every frame of the animation is one month, one year or
+    one decade depending on resolution, with the mean temperature of every country in that period.
+    A year or decade that is only partly between start_date and end_date is left out. If there are more than
+    max_frames frames, only evenly spaced frames are kept, always along with the first and the last.
+    If compact is True, the temperatures are rounded to two decimals and stored as 32 bit floats to make the graph
+    smaller
     Representative Invariant:
         - start_date >= '1750-01-01'
         - end_date <= '2013-01-01'
-        - start_date > end_date"""
-    data = pd.read_csv("GlobalLandTemperaturesByCountry.csv")
-    data = data.drop("AverageTemperatureUncertainty", axis=1)
-    clean_data = data.dropna()
-    sorted_data = clean_data.groupby(['Country', 'dt']).sum().reset_index()
-    range_of_date = (sorted_data['dt'] > start_date) & (sorted_data['dt'] <= end_date)
-    graphed_data = sorted_data.loc[range_of_date]
+        - start_date > end_date
+        - resolution in RESOLUTIONS
+        - max_frames is None or max_frames >= 1"""
+    (start, end) = (pd.Timestamp(start_date), pd.Timestamp(end_date))
+    graphed_data = _by_period(_between(temperature_frame(), start, end), resolution, start, end)
+    if max_frames is not None:
+        periods = graphed_data['dt'].unique()
+        if len(periods) > max_frames:
+            if max_frames == 1:
+                kept_periods = periods[-1:]
+            else:
+                step = (len(periods) - 1) / (max_frames - 1)
+                kept_periods = periods[[round(i * step) for i in range(max_frames)]]
+            graphed_data = graphed_data[graphed_data['dt'].isin(kept_periods)]
+    if compact:
+        graphed_data = graphed_data.assign(AverageTemperature=graphed_data['AverageTemperature'].round(2)
+                                           .astype('float32'))
 
     fig = px.choropleth(graphed_data, locations='Country', locationmode='country names',
                         color='AverageTemperature', animation_frame='dt', color_continuous_scale='reds')
     fig.update_layout(title_text='Global Warming: Change in Temperature Throughout the Years',
                       geo=dict(showcoastlines=False))
-    fig.show()
+    return render.render(fig, target)
 
 
-def draw_changing_co2_graph(start_year: int, end_year: int) -> None:
+@profiling.profiled
+def draw_changing_co2_graph(start_year: int, end_year: int, target: Optional[render.RenderTarget] = None) -> go.Figure:
     """The the change in temperature for the 43 countries within UNdata through the years given in start_year and
     end_year
     Representative Invariants:
         - start_year >= 1990
         - end_year <= 2017
         - start_date > end_date"""
-    data = pd.read_csv("UNdata_Export_20201102_015629836, Carbon dioxide (CO2) Emissions without Land Use, Land-Use Change and Forestry (LULUCF), in kilotonne CO2 equi.csv")
-    clean_data = data.dropna()
-    sorted_data = clean_data.groupby(['Country or Area', 'Year']).sum().reset_index()
-    range_of_date = (sorted_data['Year'] > start_year) & (sorted_data['Year'] <= end_year)
-    graphed_data = sorted_data.loc[range_of_date]
+    graphed_data = _between(co2_frame(), start_year, end_year).reset_index()
     fig = px.choropleth(graphed_data, locations='Country or Area', locationmode='country names',
                         color='Value', animation_frame='Year', color_continuous_scale=['grey', 'black'])
     fig.update_layout(title_text='CO2 Emission: Change in Emission Throughout the Years',
                       geo=dict(showcoastlines=False))
-    fig.show()
+    return render.render(fig, target)
@@ -1,348 +1,404 @@
-"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
-
-Copyright and Usage Information
-===============================
-
-This file is provided solely for the personal and private use of students
-taking CSC110 at the University of Toronto St. George campus. All forms of
-distribution of this code, whether as given or with any changes, are
-expressly prohibited. For more information on copyright for CSC110 materials,
-please consult our Course Syllabus.
-
-This file is Copyright (c) 2020 Jason Sastra
-
-This python files contains all the helper functions that are used in this project.
-Most of these helper functions are used to find averages, sums, and many other"""
-
-
-from dataclasses import dataclass
-import datetime
-from typing import List, Optional, Tuple
-import statistics
-import operator
-
-
-@dataclass
-class GlobalTemperature:
-    """The dataset from GlobalTemperatures.csv, formatted to show three variables, date in datetime.date,
-    average temperature, uncertainty in average temperature
-    Attributes
-        - date: the datetime in datetime.date format, with year-month-day
-        - temperature: average temperature of the world in floats
-    """
-    date: datetime.date
-    temperature: Optional[float]
-
-
-@dataclass
-class CountryTemperature:
-    """The dataset from GlobalLandTemperaturesByCountry.csv, formatted  to show three variables, date in datetime.date
-    average temperature, and the country itself
-    Attributes
-        - date: the datetime in datetime.date format, with year-month-day
-        - temperature: average temperature of the country in floats
-        - country: the name of the country in strings
-    """
-    date: datetime.date
-    temperature: Optional[float]
-    country: str
-
-
-@dataclass
-class CO2Emission:
-    """The dataset from UNdata_Export_20201102_015629836,
-    Carbon dioxide (CO2) Emissions without Land Use,
-    Land-Use Change and Forestry (LULUCF), in kilotonne CO2 equi.csv, formatted to show three variables,
-    country or area, year, emission
-    Attributes
-        - date: the datetime in datetime.date format, with every month and date being January 1st
-        - emission: The emission as a float in killotone CO2
-        - country: the name of the country in strings
-    """
-    date: datetime.date
-    emission: float
-    country: str
-
-
-@dataclass
-class GDP:
-    """The dataset from GDP.csv, formetted to show three variables, ranking, country, and GDP. This dataset
-    shows the ranking of all country's GDP in 2019
-    Attributes
-        - ranking: the rank the country's GDP, from highest to lowest
-        - country: the name of the country in strings
-        - gdp: the GDP calculated in millions of USD in strings"""
-    ranking: int
-    gdp: str
-    country: str
-
-
-@dataclass
-class GlobalCO2:
-    """The dataset from climate_change.csv, formatted to show two variables, datetime and CO2 emission.
-    This dataset shows the global CO2 in parts per million by volume
-    Attributes
-        - date: the datetime in datetime.date format
-        - emission: the parts"""
-    date: datetime.date
-    emission: float
-
-
-def list_of_countries(country_data: List[CountryTemperature], year: int) -> set:
-    """Gives the list of countries that are available within the dataset of country datas that has temperature data for
-    years above the given year"""
-    return {row.country for row in country_data if int(row.date.strftime("%Y")) > year and row.temperature is not None}
-
-
-def list_of_countries_in_all(co2_data: List[CO2Emission], country_data: List[CountryTemperature]) -> set:
-    """Gives the list of countries that are available within the dataset of both co2_emission and country datas"""
-    country1 = {row.country for row in country_data}
-    country2 = {row.country for row in co2_data}
-    countries_so_far = set()
-    for row in country1:
-        for co2 in country2:
-            if row == co2:
-                countries_so_far.add(row)
-    return countries_so_far
-
-
-def list_of_countries_co2(co2_data: List[CO2Emission]) -> set:
-    """gives the list of countries that are available within the dataset of co2_data"""
-    return {row.country for row in co2_data}
-
-
-def create_global_yearly_data(global_data: List[GlobalTemperature],
-                              start_year: int, end_year: int) -> Tuple[List[int], List[float]]:
-    """Create a global temperature data based on yearly intervals in which the temperature
-     is averaged over the year, above the years given in start_year and below the year in end_year
-     Representative Invariants:
-        - year <= end_year <= 2013
-        - year >= 1900 >= end_year"""
-    years = []
-    temperature_so_far = []
-    new_data = [row for row in global_data if end_year >= int(row.date.strftime("%Y")) >= start_year]
-    for i in range(int(new_data[1].date.strftime("%Y")), int(new_data[-2].date.strftime("%Y"))):
-        sum_temperature = []
-        for row in new_data:
-            if int(row.date.strftime("%Y")) < i:
-                pass
-            elif int(row.date.strftime("%Y")) == i:
-                sum_temperature.append(row.temperature)
-            elif int(row.date.strftime("%Y")) > i:
-                years.append(i)
-                temperature_so_far.append(statistics.mean(sum_temperature))
-                break
-    return (years, temperature_so_far)
-
-
-def create_country_yearly_data(country_data: List[CountryTemperature],
-                               nation: str, year: int, end_year: int) -> List[CountryTemperature]:
-    """Create the yearly average temperature for the given country, for years above the year given
-    Representative Invariants:
-        - year <= end_year <= 2013
-        - year >= 1900 >= end_year"""
-    country_only_data = [row for row in country_data if row.country == nation]
-    data_so_far = []
-    for i in range(year, end_year):
-        sum_temperature = []
-        for row in country_only_data:
-            if int(row.date.strftime("%Y")) < i:
-                pass
-            elif int(row.date.strftime("%Y")) == i:
-                sum_temperature.append(row.temperature)
-            elif int(row.date.strftime("%Y")) >= i:
-                if isinstance(sum_temperature[0], float) is True:
-                    data_so_far.append(CountryTemperature(datetime.date(i, 1, 1),
-                                                          statistics.mean(sum_temperature), nation))
-                break
-    return data_so_far
-
-
-def yearly_increase_temperature(country_data: List[CountryTemperature],
-                                nation: str, start_year: int, end_year: int) -> List[float]:
-    """Finds the yearly increase in temperature for the country given, between years start_year and end_year
-    Representative Invariants:
-        - nation in list_of_countries(country_data)
-        - start_year >= 1750
-        - end_year <= 2013"""
-    new_data = create_country_yearly_data(country_data, nation, start_year, end_year)
-    temperature_increase = []
-    previous_year = None
-    for row in new_data:
-        if previous_year is None:
-            previous_year = row.temperature
-        if row.temperature is not None:
-            new_increase = (row.temperature - previous_year)
-            temperature_increase.append(new_increase)
-            previous_year = row.temperature
-    return temperature_increase
-
-
-def average_yearly_increase_temperature(country_data: List[CountryTemperature],
-                                        nation: str, year: int, end_year: int) -> float:
-    """Returns the average yearly increase in temperature, for years above the year given and below the end_year
-    Representative Invariants:
-        - year <= end_year <= 2013
-        - year >= 1900 >= end_year"""
-    data = create_country_yearly_data(country_data, nation, year, end_year)
-    new_data = [row for row in data if int(row.date.strftime("%Y")) >= year]
-    sum_temperature = []
-    previous_year = None
-    for row in new_data:
-        if previous_year is None:
-            previous_year = row.temperature
-        if row.temperature is not None:
-            new_increase = (row.temperature - previous_year)
-            sum_temperature.append(new_increase)
-            previous_year = row.temperature
-    if sum_temperature is not []:
-        average = statistics.mean(sum_temperature)
-        return average
-
-
-def average_country_temperature(country_data: List[CountryTemperature], nation: str, year: int) -> float:
-    """Returns the average temperature of the country, for years above year given"""
-    data = [row for row in country_data if row.country in nation]
-    new_data = [row for row in data if int(row.date.strftime("%Y")) >= year]
-    sum_temperature = []
-    for row in new_data:
-        if row.temperature is not None:
-            sum_temperature.append(row.temperature)
-    if sum_temperature != []:
-        average = statistics.mean(sum_temperature)
-        return average
-
-
-def temperature_increase_ranking(country_data: List[CountryTemperature],
-                                 nations: set, year: int, end_year: int) -> list:
-    """Rank the average yearly increase in temperature for all the countries in nations, for the years
-    above the year given
-    Representative Invariants:
-        - year <= end_year <= 2013
-        - year >= 1900 >= end_year"""
-    ranking = []
-    for nation in nations:
-        average_increase = average_yearly_increase_temperature(country_data, nation, year, end_year)
-        nation_ranking = [average_increase, nation]
-        ranking.append(nation_ranking)
-    ranking.sort(reverse=True)
-    for i in range(1, len(ranking) + 1):
-        ranking[i - 1][0] = i
-
-    return ranking
-
-
-def yearly_increase_co2(co2_data: List[CO2Emission], nation: str, start_year: int, end_year: int) -> List[float]:
-    """Returns a list of the yearly increase in CO2 for the given country from start_year to end_year
-    Representative Invariants:
-        - year <= end_year <= 2013
-        - year >= 1900 >= end_year"""
-    country_only_co2 = [row for row in co2_data if row.country == nation
-                        and start_year <= int(row.date.strftime("%Y")) <= end_year]
-    co2_change = []
-    sorted_data = sorted(country_only_co2, key=operator.attrgetter('date'))
-    previous_year = None
-    for row in sorted_data:
-        if previous_year is None:
-            previous_year = row.emission
-        else:
-            new_increase = row.emission - previous_year
-            co2_change.append(new_increase)
-            previous_year = row.emission
-    return co2_change
-
-
-def average_yearly_increase_co2(co2_data: List[CO2Emission], nation: str, year: int) -> float:
-    """Find the average yearly increase in co2 for the country given in years above the year given
-    Representative Invariants:
-        - nation in list_of_countries_co2(co2_data)"""
-    new_data = [row for row in co2_data if row.country == nation]
-    data = [row for row in new_data if int(row.date.strftime("%Y")) > year]
-    sorted_data = sorted(data, key=operator.attrgetter('date'))
-    sum_temperature = []
-    previous_year = None
-    for row in sorted_data:
-        if previous_year is None:
-            previous_year = row.emission
-        else:
-            new_increase = row.emission - previous_year
-            sum_temperature.append(new_increase)
-            previous_year = row.emission
-    average = statistics.mean(sum_temperature)
-    return average
-
-
-def co2_increase_ranking(co2_data: List[CO2Emission], nations: set, year: int) -> list:
-    """Ranks the average yearly increase in co2 for the countries given in years above the year given
-    Representative Invariants:
-        - all([nation in list_of_countries_co2(co2_data) for nation in nations])
-        - 2017 >= year >= 1950"""
-    ranking = []
-    for nation in nations:
-        average_increase = average_yearly_increase_co2(co2_data, nation, year)
-        nation_ranking = [average_increase, nation]
-        ranking.append(nation_ranking)
-    ranking.sort(reverse=True)
-    for i in range(1, len(ranking) + 1):
-        ranking[i - 1][0] = i
-
-    return ranking
-
-
-def co2_ranking(co2_data: List[CO2Emission], nations: set, year: int) -> dict:
-    """Returns a mapping of the total amount of CO2 emission produced above a certain year for the given countries
-    Representative Invariants:
-        - all([nation in list_of_countries_co2(co2_data) for nation in nations])
-        - 2017 >= year >= 1950"""
-    country_to_co2 = {}
-    new_data = [row for row in co2_data if int(row.date.strftime("%Y")) >= year and row.country in nations]
-    for row in new_data:
-        if row.country not in country_to_co2:
-            country_to_co2[row.country] = [row.emission]
-        else:
-            country_to_co2[row.country].append(row.emission)
-    for country in country_to_co2:
-        country_to_co2[country] = sum(country_to_co2[country])
-    return country_to_co2
-
-
-def simple_linear_regression(x: List[float or int], y: List[float or int]) -> Tuple[int, int]:
-    """Perform a linear regression on the given datasets
-    Representative Invariants:
-        len(x) = len(y)
-    """
-
-    b = sum([(x[n] - statistics.mean(x)) * (y[n] - statistics.mean(y)) for n in range(0, len(x))]) / \
-        sum([(n - statistics.mean(x)) ** 2 for n in x])
-    a = statistics.mean(y) - b * statistics.mean(x)
-    return (a, b)
-
-
-def calculate_r_squared(x_list: list, y_list: list, a: float, b: float) -> float:
-    """Return the R squared value when the given points are modelled as the line y = a + bx.
-    """
-    y_average = statistics.mean(y_list)
-    sstot = sum([(y - y_average) ** 2 for y in y_list])
-    ssres = sum([(y_list[n] - (a + b * x_list[n])) ** 2 for n in range(0, len(y_list))])
-    r_squared = 1 - (ssres / sstot)
-    return r_squared
-
-
-def linear_regression_into_graph_points(x_data: List[float or int], y_data: List[float or int],
-                                        x_start: int, x_end: int) -> List[list]:
-    """Use the linear regression to create graph points for plotly"""
-    equation = simple_linear_regression(x_data, y_data)
-    y_so_far = []
-    x_so_far = []
-    for x in range(x_start, x_end):
-        y = equation[0] + equation[1] * x
-        y_so_far.append(y)
-        x_so_far.append(x)
-    return [x_so_far, y_so_far]
-
-
-def ranked_by_gdp(gdp_data: List[GDP], countries: set) -> List[GDP]:
-    """Ranks the GDP of the countries given in descending order, from highest GDP to lowest GDP,
-    for its GDP in 2019"""
-    new_data = [row for row in gdp_data if row.country in countries]
-    return new_data
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC110 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC110 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python files contains all the helper functions that are used in this project.
+Most of these helper functions are used to find averages, sums, and many other"""
+
+
+from dataclasses import dataclass
+import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+import statistics
+import math
+from temperature_table import CountryTemperatureTable
+from gdp_table import GDPTable
+import co2_store
+import country_index
+import country_registry
+import regression
+import rolling
+import year_matrix
+import parallel_ranking
+import memo
+import profiling
+from records import GlobalTemperature, CountryTemperature, CO2Emission, GlobalCO2
+
+# How yearly_aggregate can combine the values of a year
+AGGREGATIONS = ('mean', 'sum', 'count', 'min', 'max')
+
+
+@dataclass
+class CountryFits:
+    """The linear regression of the yearly increase in temperature on the yearly increase in CO2 emission of
+    every country, with the increases it was computed from, lined up by year
+    Attributes
+        - nations: the countries, sorted by name
+        - years: the years of the increases, where the increase of a year is from the year before it
+        - co2_increase: the increase in CO2 emission of nations[i] in years[j] is co2_increase[i][j],
+          nan if it is missing
+        - temperature_increase: the increase in temperature of nations[i] in years[j] is
+          temperature_increase[i][j], nan if it is missing
+        - present: whether both increases of nations[i] in years[j] are there
+        - fits: maps every nation to the regression of its temperature increase on its CO2 increase
+    The increases and present are read-only arrays of year_matrix, so they are NumPy arrays if NumPy is installed
+    and tuples of rows otherwise
+    Representative Invariants:
+        - len(self.co2_increase) == len(self.temperature_increase) == len(self.present) == len(self.nations)
+        - all(len(row) == len(self.years) for row in self.present)
+        - set(self.fits) == set(self.nations)"""
+    nations: List[str]
+    years: List[int]
+    co2_increase: Any
+    temperature_increase: Any
+    present: Any
+    fits: Dict[str, regression.Regression]
+
+
+@profiling.profiled
+@memo.memoize
+def list_of_countries(country_data: CountryTemperatureTable, year: int) -> set:
+    """Gives the list of countries that are available within the dataset of country datas that has temperature data for
+    years above the given year"""
+    codes = {code for (row_year, temperature, code) in
+             zip(country_data.years, country_data.temperatures, country_data.codes)
+             if row_year > year and not math.isnan(temperature)}
+    return {country_data.names[code] for code in codes}
+
+
+@profiling.profiled
+@memo.memoize
+def list_of_countries_in_all(co2_data: List[CO2Emission], country_data: CountryTemperatureTable) -> set:
+    """Gives the list of countries that are available within the dataset of both co2_emission and country datas,
+    matching the countries by their number in the country registry"""
+    return country_registry.in_all(country_data.countries(), country_index.index_of(co2_data).rows)
+
+
+@profiling.profiled
+@memo.memoize
+def list_of_countries_co2(co2_data: List[CO2Emission]) -> set:
+    """gives the list of countries that are available within the dataset of co2_data"""
+    return {row.country for row in co2_data}
+
+
+@profiling.profiled
+def yearly_aggregate(years: Iterable[int], values: Iterable[Optional[float]], how: str = 'mean',
+                     start_year: Optional[int] = None, end_year: Optional[int] = None,
+                     first_required: bool = False) -> Tuple[List[int], List[float]]:
+    """Group the values by their year and combine each group with how, in a single pass through the data.
+    Missing values (None or nan) are skipped. If first_required is True, a year whose first row is missing is
+    left out entirely, like the yearly averages of a country always were. Only the years from start_year up to
+    but not including end_year that have at least one value are returned, in increasing order
+    Representative Invariants:
+        - how in AGGREGATIONS
+        - len(years) == len(values)"""
+    if how not in AGGREGATIONS:
+        raise ValueError('Unknown aggregation ' + repr(how) + ', expected one of ' + str(AGGREGATIONS))
+    # Maps every year to the count, sum, minimum and maximum of its values
+    groups = {}
+    # The years left out because their first row is missing
+    skipped = set()
+    previous_year = None
+    for year, value in zip(years, values):
+        first = year != previous_year
+        previous_year = year
+        if value is None or value != value:
+            if first and first_required:
+                skipped.add(year)
+            continue
+        if (start_year is not None and year < start_year) or (end_year is not None and year >= end_year):
+            continue
+        if year in skipped:
+            continue
+        if year not in groups:
+            groups[year] = [1, value, value, value]
+        else:
+            group = groups[year]
+            group[0] += 1
+            group[1] += value
+            if value < group[2]:
+                group[2] = value
+            if value > group[3]:
+                group[3] = value
+    sorted_years = sorted(groups)
+    if how == 'mean':
+        return (sorted_years, [groups[year][1] / groups[year][0] for year in sorted_years])
+    column = {'count': 0, 'sum': 1, 'min': 2, 'max': 3}[how]
+    return (sorted_years, [groups[year][column] for year in sorted_years])
+
+
+@profiling.profiled
+@memo.memoize
+def create_global_yearly_data(global_data: List[GlobalTemperature],
+                              start_year: int, end_year: int) -> Tuple[List[int], List[float]]:
+    """Create a global temperature data based on yearly intervals in which the temperature
+     is averaged over the year, above the years given in start_year and below the year in end_year
+     Representative Invariants:
+        - year <= end_year <= 2013
+        - year >= 1900 >= end_year"""
+    new_data = [row for row in global_data if end_year >= row.year >= start_year]
+    return yearly_aggregate([row.year for row in new_data], [row.temperature for row in new_data], 'mean',
+                            new_data[1].year, new_data[-2].year)
+
+
+@profiling.profiled
+@memo.memoize
+def create_country_yearly_data(country_data: CountryTemperatureTable,
+                               nation: str, year: int, end_year: int) -> List[CountryTemperature]:
+    """Create the yearly average temperature for the given country, for years above the year given.
+    The last year of the country's data is left out since it may not be complete, and so is a year whose first
+    month has no temperature
+    Representative Invariants:
+        - year <= end_year <= 2013
+        - year >= 1900 >= end_year"""
+    country_only_data = country_data.select(nation, year)
+    if len(country_only_data) == 0:
+        return []
+    (years, temperatures) = yearly_aggregate(country_only_data.years, country_only_data.temperatures, 'mean',
+                                             year, min(end_year, country_only_data.years[-1]), first_required=True)
+    return [CountryTemperature(datetime.date(years[i], 1, 1), temperatures[i], nation) for i in range(len(years))]
+
+
+@profiling.profiled
+@memo.memoize
+def smoothed_series(data: Union[CountryTemperatureTable, List[GlobalTemperature], List[GlobalCO2]], method: str,
+                    window: int, nation: Optional[str] = None) -> Tuple[List[datetime.date], List[float]]:
+    """Return the date of every row of data, or of the rows of nation if data is the table of country
+    temperatures, and its value smoothed with method over a window of window rows. A slope is the change
+    per year
+    Representative Invariants:
+        - method in rolling.METHODS
+        - window >= 1"""
+    (dates, values) = rolling.series(data, nation)
+    return (dates, rolling.smooth(values, method, window, [rolling.decimal_year(date) for date in dates]))
+
+
+@profiling.profiled
+@memo.memoize
+def yearly_increase_temperature(country_data: CountryTemperatureTable,
+                                nation: str, start_year: int, end_year: int) -> List[float]:
+    """Finds the yearly increase in temperature for the country given, between years start_year and end_year
+    Representative Invariants:
+        - nation in list_of_countries(country_data)
+        - start_year >= 1750
+        - end_year <= 2013"""
+    new_data = create_country_yearly_data(country_data, nation, start_year, end_year)
+    temperature_increase = []
+    previous_year = None
+    for row in new_data:
+        if previous_year is None:
+            previous_year = row.temperature
+        if row.temperature is not None:
+            new_increase = (row.temperature - previous_year)
+            temperature_increase.append(new_increase)
+            previous_year = row.temperature
+    return temperature_increase
+
+
+@profiling.profiled
+@memo.memoize
+def average_yearly_increase_temperature(country_data: CountryTemperatureTable,
+                                        nation: str, year: int, end_year: int) -> float:
+    """Returns the average yearly increase in temperature, for years above the year given and below the end_year
+    Representative Invariants:
+        - year <= end_year <= 2013
+        - year >= 1900 >= end_year"""
+    data = create_country_yearly_data(country_data, nation, year, end_year)
+    new_data = [row for row in data if row.year >= year]
+    sum_temperature = []
+    previous_year = None
+    for row in new_data:
+        if previous_year is None:
+            previous_year = row.temperature
+        if row.temperature is not None:
+            new_increase = (row.temperature - previous_year)
+            sum_temperature.append(new_increase)
+            previous_year = row.temperature
+    if sum_temperature is not []:
+        average = statistics.mean(sum_temperature)
+        return average
+
+
+@profiling.profiled
+@memo.memoize
+def average_country_temperature(country_data: CountryTemperatureTable, nation: str, year: int) -> float:
+    """Returns the average temperature of the country, for years above year given"""
+    new_data = country_data.select(nation, year)
+    sum_temperature = [temperature for temperature in new_data.temperatures if not math.isnan(temperature)]
+    if sum_temperature != []:
+        average = statistics.mean(sum_temperature)
+        return average
+
+
+@profiling.profiled
+@memo.memoize
+def temperature_increase_ranking(country_data: CountryTemperatureTable,
+                                 nations: set, year: int, end_year: int, workers: int = 1) -> list:
+    """Rank the average yearly increase in temperature for all the countries in nations, for the years
+    above the year given. If workers is more than 1, the nations are split between that many processes
+    Representative Invariants:
+        - year <= end_year <= 2013
+        - year >= 1900 >= end_year
+        - workers >= 1"""
+    if workers > 1:
+        ranking = parallel_ranking.average_increases(average_yearly_increase_temperature, country_data, nations,
+                                                     (year, end_year), workers)
+    else:
+        ranking = []
+        for nation in nations:
+            average_increase = average_yearly_increase_temperature(country_data, nation, year, end_year)
+            nation_ranking = [average_increase, nation]
+            ranking.append(nation_ranking)
+    ranking.sort(reverse=True)
+    for i in range(1, len(ranking) + 1):
+        ranking[i - 1][0] = i
+
+    return ranking
+
+
+@profiling.profiled
+@memo.memoize
+def yearly_increase_co2(co2_data: List[CO2Emission], nation: str, start_year: int, end_year: int) -> List[float]:
+    """Returns a list of the yearly increase in CO2 for the given country from start_year to end_year
+    Representative Invariants:
+        - year <= end_year <= 2013
+        - year >= 1900 >= end_year"""
+    return co2_store.store_of(co2_data).increases_between(nation, start_year, end_year)
+
+
+@profiling.profiled
+@memo.memoize
+def average_yearly_increase_co2(co2_data: List[CO2Emission], nation: str, year: int) -> float:
+    """Find the average yearly increase in co2 for the country given in years above the year given
+    Representative Invariants:
+        - nation in list_of_countries_co2(co2_data)"""
+    return co2_store.store_of(co2_data).average_increase_since(nation, year)
+
+
+@profiling.profiled
+@memo.memoize
+def co2_increase_ranking(co2_data: List[CO2Emission], nations: set, year: int, workers: int = 1) -> list:
+    """Ranks the average yearly increase in co2 for the countries given in years above the year given.
+    If workers is more than 1, the nations are split between that many processes
+    Representative Invariants:
+        - all([nation in list_of_countries_co2(co2_data) for nation in nations])
+        - 2017 >= year >= 1950
+        - workers >= 1"""
+    if workers > 1:
+        ranking = parallel_ranking.average_increases(co2_store.CO2Store.average_increase_since, co2_data, nations,
+                                                     (year,), workers)
+    else:
+        ranking = []
+        for nation in nations:
+            average_increase = average_yearly_increase_co2(co2_data, nation, year)
+            nation_ranking = [average_increase, nation]
+            ranking.append(nation_ranking)
+    ranking.sort(reverse=True)
+    for i in range(1, len(ranking) + 1):
+        ranking[i - 1][0] = i
+
+    return ranking
+
+
+@profiling.profiled
+@memo.memoize
+def co2_ranking(co2_data: List[CO2Emission], nations: set, year: int) -> dict:
+    """Returns a mapping of the total amount of CO2 emission produced above a certain year for the given countries
+    Representative Invariants:
+        - all([nation in list_of_countries_co2(co2_data) for nation in nations])
+        - 2017 >= year >= 1950"""
+    country_to_co2 = {}
+    store = co2_store.store_of(co2_data)
+    for country in store.years:
+        if country in nations:
+            total = store.total_since(country, year)
+            if total is not None:
+                country_to_co2[country] = total
+    return country_to_co2
+
+
+@profiling.profiled
+@memo.memoize
+def co2_temperature_fits(country_data: CountryTemperatureTable, co2_data: List[CO2Emission],
+                         nations: set, start_year: int, end_year: int) -> CountryFits:
+    """Fit the yearly increase in temperature against the yearly increase in CO2 emission for every nation at
+    once. The temperature is averaged over every year from start_year up to but not including end_year, like in
+    create_country_yearly_data, and the CO2 emission is taken from start_year to end_year.
+    An increase is only used when both its year and the year before it have data
+    Representative Invariants:
+        - start_year <= end_year <= 2013
+        - start_year >= 1990"""
+    sorted_nations = sorted(nations)
+    matrix = year_country_matrix(country_data, co2_data)
+    # The temperature of end_year is left out, like in create_country_yearly_data
+    temperature = matrix.select('temperature', sorted_nations, start_year, end_year, end_year - 1)
+    co2 = matrix.select('co2', sorted_nations, start_year, end_year)
+    temperature_increase = year_matrix.transpose(year_matrix.increase(temperature), len(sorted_nations))
+    co2_increase = year_matrix.transpose(year_matrix.increase(co2), len(sorted_nations))
+    fits = regression.fit_batch(co2_increase, temperature_increase)
+    return CountryFits(sorted_nations, list(range(start_year + 1, end_year + 1)), year_matrix.read_only(co2_increase),
+                       year_matrix.read_only(temperature_increase),
+                       year_matrix.read_only(year_matrix.present(co2_increase, temperature_increase)),
+                       {sorted_nations[i]: fits[i] for i in range(len(sorted_nations))})
+
+
+@profiling.profiled
+@memo.memoize
+def year_country_matrix(country_data: CountryTemperatureTable, co2_data: List[CO2Emission],
+                        gdp_data: Optional[GDPTable] = None) -> year_matrix.YearCountryMatrix:
+    """Return the yearly temperature, the CO2 emission and the GDP of every country lined up by year and country.
+    The temperature of a year is its mean like in create_country_yearly_data, where the last year of every
+    country is left out since it may not be complete. The GDP is nan if gdp_data is None"""
+    temperature = {}
+    for nation in country_data.countries():
+        rows = country_data.select(nation)
+        temperature[nation] = dict(zip(*yearly_aggregate(rows.years, rows.temperatures, 'mean', None,
+                                                         rows.years[-1], first_required=True)))
+    co2 = {nation: {row.year: row.emission for row in rows}
+           for (nation, rows) in country_index.index_of(co2_data).rows.items()}
+    gdp = {} if gdp_data is None else {country: gdp_data.gdp_of(country) for country in gdp_data.countries}
+    return year_matrix.YearCountryMatrix.from_series(temperature, co2, gdp)
+
+
+@profiling.profiled
+def simple_linear_regression(x: List[float or int], y: List[float or int]) -> Tuple[int, int]:
+    """Perform a linear regression on the given datasets
+    Representative Invariants:
+        len(x) = len(y)
+    """
+    result = regression.fit(x, y)
+    return (result.intercept, result.slope)
+
+
+@profiling.profiled
+def calculate_r_squared(x_list: list, y_list: list, a: float, b: float) -> float:
+    """Return the R squared value when the given points are modelled as the line y = a + bx.
+    """
+    y_average = math.fsum(y_list) / len(y_list)
+    sstot = math.fsum([(y - y_average) ** 2 for y in y_list])
+    ssres = math.fsum([(y_list[n] - (a + b * x_list[n])) ** 2 for n in range(0, len(y_list))])
+    r_squared = 1 - (ssres / sstot)
+    return r_squared
+
+
+@profiling.profiled
+def linear_regression_into_graph_points(x_data: List[float or int], y_data: List[float or int],
+                                        x_start: int, x_end: int) -> List[list]:
+    """Use the linear regression to create graph points for plotly"""
+    return regression.line_points(regression.fit(x_data, y_data), x_start, x_end)
+
+
+@profiling.profiled
+def ranked_by_gdp(gdp_data: GDPTable, countries: set) -> GDPTable:
+    """Ranks the GDP of the countries given in descending order, from highest GDP to lowest GDP,
+    for its GDP in 2019. gdp_data is left as it is"""
+    return gdp_data.rerank(countries)
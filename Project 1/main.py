@@ -10,93 +10,24 @@ expressly prohibited.
 
 This file is Copyright (c) 2020 Jason Sastra
 
-This file contains the main page to run the functions in"""
+This file contains the main page to run the functions in. The steps can also be drawn without uncommenting
+them, by giving their number or the name of their graph, such as
+    python main.py --step 3 --step ranking-comparison"""
 
 
-import datetime
-from dataclasses import dataclass
-from typing import Optional
-import converting_data
+import argparse
+import batch
+import dataset_registry
 import helper_functions
 import draw_graph
 import global_map
 
 
-@dataclass
-class GlobalTemperature:
-    """The dataset from GlobalTemperatures.csv, formatted to show three variables, date in datetime.date,
-    average temperature, uncertainty in average temperature
-    Attributes
-        - date: the datetime in datetime.date format, with year-month-day
-        - temperature: average temperature of the world in floats
-    """
-    date: datetime.date
-    temperature: Optional[float]
-
-
-@dataclass
-class CountryTemperature:
-    """The dataset from GlobalLandTemperaturesByCountry.csv, formatted  to show three variables, date in datetime.date
-    average temperature, and the country itself
-    Attributes
-        - date: the datetime in datetime.date format, with year-month-day
-        - temperature: average temperature of the country in floats
-        - country: the name of the country in strings
-    """
-    date: datetime.date
-    temperature: Optional[float]
-    country: str
-
-
-@dataclass
-class CO2Emission:
-    """The dataset from UNdata_Export_20201102_015629836,
-    Carbon dioxide (CO2) Emissions without Land Use,
-    Land-Use Change and Forestry (LULUCF), in kilotonne CO2 equi.csv, formatted to show three variables,
-    country or area, year, emission
-    Attributes
-        - date: the datetime in datetime.date format, with every month and date being January 1st
-        - emission: The emission as a float in killotone CO2
-        - country: the name of the country in strings
-    """
-    date: datetime.date
-    emission: float
-    country: str
-
-
-@dataclass
-class GDP:
-    """The dataset from GDP.csv, formetted to show three variables, ranking, country, and GDP. This dataset
-    shows the ranking of all country's GDP in 2019
-    Attributes
-        - ranking: the rank the country's GDP, from highest to lowest
-        - country: the name of the country in strings
-        - gdp: the GDP calculated in millions of USD in strings"""
-    ranking: int
-    gdp: str
-    country: str
-
-
-@dataclass
-class GlobalCO2:
-    """The dataset from climate_change.csv, formatted to show two variables, datetime and CO2 emission.
-    This dataset shows the global CO2 in parts per million by volume
-    Attributes
-        - date: the datetime in datetime.date format
-        - emission: the parts"""
-    date: datetime.date
-    emission: float
-
-
 # First Step
-# This part mutates the data sets into list of dataclasses to work with
+# This part names the data sets, which are mutated into list of dataclasses the first time a step uses them,
+# such as data.country_data, data.global_data, data.co2_data, data.gdp_data and data.global_co2
 
-country_data = converting_data.convert_country_temperatures()
-global_data = converting_data.convert_global_temperatures()
-co2_data = converting_data.co2_emission_convert()
-gdp_data = converting_data.gdp_convert()
-global_co2 = converting_data.global_co2_convert()
-co2_data = converting_data.mutate_united_states(co2_data)
+data = dataset_registry.DatasetRegistry()
 
 
 # The Given functions below are the ones used in the computational plan, comment it out in order to produce
@@ -110,38 +41,40 @@ co2_data = converting_data.mutate_united_states(co2_data)
 This functions serves as a way to see the changes in CO2 emission. The trends observed here will further be analyzed
 later"""
 
-# global_map.draw_changing_global_graph_temperature('1990-01-01', '2013-01-01')
+# global_map.draw_changing_global_graph_temperature('1990-01-01', '2013-01-01', 'yearly', 60, True)
 """This function is used to observe the changes in average temperature throughout the years in the range of the
-start_date and end_date given above. The trends observed here will further be analyzed later"""
+start_date and end_date given above. The trends observed here will further be analyzed later. Every frame is the
+mean of a year, and the resolution can also be 'monthly' or 'decadal'; 60 is the most frames kept, and True rounds
+the temperatures so the graph is smaller"""
 
-# draw_graph.draw_ranking_comparison(country_data, co2_data, gdp_data, helper_functions.list_of_countries_in_all(co2_data, country_data), 1990, 2017)
+# draw_graph.draw_ranking_comparison(data.country_data, data.co2_data, data.gdp_data, helper_functions.list_of_countries_in_all(data.co2_data, data.country_data), 1990, 2017)
 """This graph ranks all the country's respective values and see how they match up to each other. The
 trends observed here will further be analyzed later"""
 #########################################################
 # Third Step
 
-# draw_graph.draw_global_graph_year(global_data)
+# draw_graph.draw_global_graph_year(data.global_data)
 """This function analyzes the global change in temperature in relation to date"""
 
-# draw_graph.draw_global_co2_year(global_co2)
+# draw_graph.draw_global_co2_year(data.global_co2)
 """This function analyzes the global change in CO2 emission in relation to date"""
 
-# draw_graph.draw_global_co2_vs_temperature(global_data, global_co2)
+# draw_graph.draw_global_co2_vs_temperature(data.global_data, data.global_co2)
 """This function analyzes the global change in temperature in relation to CO2 emission.
 It is connected through date."""
 
 ##########################################################
 # Fourth Step
 
-# draw_graph.co2_gdp_ranking(co2_data, gdp_data, helper_functions.list_of_countries_co2(), 1983)
+# draw_graph.co2_gdp_ranking(data.co2_data, data.gdp_data, helper_functions.list_of_countries_co2(), 1983)
 """To modify this function, you can change the list of countries that want to be seen
 by changing the third value and the year it starts in by changing the fourth value"""
 ###########################################################
 # Fifth Step
 
-# draw_graph.draw_percentage_of_pollution(gdp_data, co2_data, helper_functions.list_of_countries_co2(co2_data), 1990, 2017, 10)
+# draw_graph.draw_percentage_of_pollution(data.gdp_data, data.co2_data, helper_functions.list_of_countries_co2(data.co2_data), 1990, 2017, 10)
 """This graph can be modified. 
-draw_percentage_of_pollution(gdp_data: list[GDP], co2_data: list[CO2_Emission], 
+draw_percentage_of_pollution(gdp_data: GDPTable, co2_data: list[CO2_Emission], 
 countries: set, start_year: int, end_year: int, amount_of_countries: int)
 It is possible to change the countries in the set, the start year, the end year, and most crucially,
 the amount of countries that will be calculated as a top nth country in terms of its GDP."""
@@ -149,7 +82,7 @@ the amount of countries that will be calculated as a top nth country in terms of
 ###########################################################
 # Sixth Step
 
-# draw_graph.draw_country_increase_vs_average(country_data, helper_functions.list_of_countries(country_data, 1990), 1990, 2013)
+# draw_graph.draw_country_increase_vs_average(data.country_data, helper_functions.list_of_countries(data.country_data, 1990), 1990, 2013)
 """start_year and end_year along with the countries can be modified for this function. Note that the countries
 must have data above the start_year therefore when calling list_of_countries(year: int), the year inside
 list_of_countries need to be above start_year"""
@@ -157,28 +90,60 @@ list_of_countries need to be above start_year"""
 ###########################################################
 # Seventh Step
 
-# draw_graph.draw_increase_co2_increase_temperature_country(country_data, co2_data, 'United States', 1990, 2013)
-"""draw_increase_co2_increase_temperature_country(country_data: List[CountryTemperature], co2_data: List[CO2Emission],
+# draw_graph.draw_increase_co2_increase_temperature_country(data.country_data, data.co2_data, 'United States', 1990, 2013)
+"""draw_increase_co2_increase_temperature_country(country_data: CountryTemperatureTable, co2_data: List[CO2Emission],
 nation: str, start_year: int, end_year: int), in this case, the options that can be modified is the start_year,
 end_year, and the nation. This step specifically focuses on a specific country to analyze."""
 
 ###########################################################
 # Eighth Step
 
-# draw_graph.draw_increase_co2_increase_temperature(country_data, co2_data, helper_functions.list_of_countries_in_all(co2_data, country_data), 1990, 2013)
+# draw_graph.draw_increase_co2_increase_temperature(data.country_data, data.co2_data, helper_functions.list_of_countries_in_all(data.co2_data, data.country_data), 1990, 2013)
 """In this case, the two things that could be modified is the set of countries and the dates."""
 
 ###########################################################
 # Additional graphs to be played around with for your curiosity
 
-# draw_graph.draw_country_vs_global(global_data, country_data, 'Australia')
+# draw_graph.draw_country_vs_global(data.global_data, data.country_data, 'Australia')
 """Insert your desired country into this function to show how global warming is affecting it compared to
 global warming in a global scale"""
 
-# draw_graph.draw_country_vs_global_year(global_data, country_data, 'Australia', 1950, 2013)
+# draw_graph.draw_country_vs_global_year(data.global_data, data.country_data, 'Australia', 1950, 2013)
 """Similar as above but this graph is more streamlined as the temperature is averaged throughout the year,
 so it does not fluctuate wildly for summer and winter"""
 
-
-print('Hello and welcome to this project, in this main.py file there are some functions that can be uncommented'
-      'in order to make various graphs, uncomment it in order to produce the graph you want.')
+# draw_graph.draw_co2_emission(data.co2_data, 'United States')
+"""The CO2 emission of the given country through the years"""
+
+# draw_graph.draw_country_graph_year(data.country_data, 'Australia')
+"""The temperature of the given country averaged throughout every year"""
+
+# draw_graph.draw_smoothed_series(data.global_data, 'mean', 120)
+"""The temperature of the world smoothed over a window of 120 months. The method can also be sum, slope or ewma,
+as in rolling.py"""
+
+# draw_graph.draw_smoothed_series(data.global_co2, 'mean', 12)
+"""The CO2 in the atmosphere smoothed over a window of 12 months"""
+
+# draw_graph.draw_smoothed_series(data.country_data, 'mean', 120, 'Australia')
+"""The temperature of the given country smoothed over a window of 120 months"""
+
+# draw_graph.draw_smoothed_countries(data.country_data, helper_functions.list_of_countries_in_all(data.co2_data, data.country_data), 'slope', 360)
+"""The trend of the temperature of every country, as the slope of its temperature over a window of 360 months"""
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Draw the graphs of the steps above in the browser')
+    parser.add_argument('--step', action='append', default=[],
+                        help='a step from 2 to 9, or the name, alias or start of the name of a graph, such as '
+                             'global-co2 or ranking; can be repeated')
+    arguments = parser.parse_args()
+    if arguments.step == []:
+        print('Hello and welcome to this project, in this main.py file there are some functions that can be '
+              'uncommented in order to make various graphs, uncomment it in order to produce the graph you want.')
+    try:
+        chosen = batch.select(batch.graphs(), arguments.step)
+    except ValueError as error:
+        parser.error(str(error))
+    for graph in chosen:
+        graph.draw(data, graph.defaults, None)
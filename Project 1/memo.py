@@ -0,0 +1,247 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file remembers the results of the helper functions, so that drawing the same graph twice does not
+compute everything again. Datasets are told apart by their identity and a version that changes whenever
+the dataset is mutated. Only the datasets registered, which dataset_registry.DatasetRegistry does for every
+dataset it loads, are remembered this way, and they are only weakly referenced, so a dataset that is no longer
+used is garbage collected along with the results remembered for it"""
+
+import dataclasses
+import functools
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+DEFAULT_MAX_SIZE = 512
+
+# The values that are part of a key along with their type, so that 1, 1.0 and True are different keys. Every other
+# argument must be a registered dataset
+_PLAIN_TYPES = (int, float, str, bool, type(None))
+
+
+class LRUCache:
+    """A mapping from keys to results that forgets the least recently used result once it is full
+    Instance Attributes
+        - max_size: the most results that are remembered at once
+        - hits: the amount of times a result was found
+        - misses: the amount of times a result was not found
+        - _results: the remembered results, from least to most recently used
+        - _lock: held while _results is read or changed, so the cache can be used from many threads
+    Representative Invariants:
+        - self.max_size >= 0
+        - len(self._results) <= self.max_size
+    """
+    max_size: int
+    hits: int
+    misses: int
+    _results: OrderedDict
+    _lock: threading.Lock
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Initialize an empty cache that remembers at most max_size results"""
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return whether key has a result and the result itself, marking it as the most recently used"""
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                self._results.move_to_end(key)
+                return (True, self._results[key])
+            self.misses += 1
+            return (False, None)
+
+    def put(self, key: Hashable, result: Any) -> None:
+        """Remember the result of key, forgetting the least recently used results if the cache is full"""
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+
+    def resize(self, max_size: int) -> None:
+        """Change the most results that are remembered, forgetting the least recently used ones if needed"""
+        with self._lock:
+            self.max_size = max_size
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+
+    def discard(self, keep: Callable[[Hashable], bool]) -> None:
+        """Forget every result whose key keep returns False for"""
+        with self._lock:
+            for key in [key for key in self._results if not keep(key)]:
+                del self._results[key]
+
+    def clear(self) -> None:
+        """Forget every result and reset the counters"""
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the amount of results remembered"""
+        return len(self._results)
+
+
+cache = LRUCache()
+
+# Maps the id of every registered dataset to a weak reference to it and its current version. Every version is
+# only given once, so a key is never matched by another object that is given the id of a garbage collected dataset
+_versions: Dict[int, Tuple[weakref.ref, int]] = {}
+_last_version = 0
+# The keys of the datasets garbage collected since their results were last forgotten
+_collected: List[Tuple[str, int, int]] = []
+# Held while _versions is read or changed. It is reentrant, since a dataset may be garbage collected, which
+# changes _versions, while the lock is held
+_lock = threading.RLock()
+
+
+def memoize(function: Callable) -> Callable:
+    """Return function with its results remembered in cache. The function must not mutate its arguments.
+    Every call returns a new copy of the lists, dicts, sets, tuples and dataclasses that are not frozen in the
+    remembered result, so the caller may mutate them without changing the result remembered. Everything else is
+    shared with every call, so the function must only return objects of other types that can not be changed,
+    such as the frozen records, the tables and read-only arrays"""
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            key = (function.__module__, function.__qualname__, tuple(_key_of(arg) for arg in args),
+                   tuple(sorted((name, _key_of(kwargs[name])) for name in kwargs)))
+            hash(key)
+        except TypeError:
+            return function(*args, **kwargs)
+        (found, result) = cache.get(key)
+        if not found:
+            result = function(*args, **kwargs)
+            _forget_collected()
+            cache.put(key, result)
+        return _fresh(result)
+    return wrapper
+
+
+def register(dataset: Any) -> None:
+    """Remember the results of the functions called with dataset until it is garbage collected. A dataset must
+    be registered to be told apart by its identity: a function called with any other object that is not a plain
+    value computes its result every time. Raise TypeError if dataset can not be weakly referenced, such as a
+    plain list, which is why the datasets that are lists are records.RecordList"""
+    with _lock:
+        if _registered(dataset) is None:
+            reference = weakref.ref(dataset, functools.partial(_collect, id(dataset)))
+            _versions[id(dataset)] = (reference, _new_version())
+
+
+def touch(dataset: Any) -> None:
+    """Give dataset a new version, so that every result remembered for it is no longer used. This must be
+    called whenever dataset is mutated. Nothing is remembered for a dataset that is not registered, so it is
+    left as it is"""
+    with _lock:
+        if _registered(dataset) is not None:
+            _versions[id(dataset)] = (_versions[id(dataset)][0], _new_version())
+
+
+def configure(max_size: int) -> None:
+    """Change the most results that are remembered at once"""
+    cache.resize(max_size)
+
+
+def statistics() -> Dict[str, int]:
+    """Return the hits, misses and amount of results currently remembered"""
+    return {'hits': cache.hits, 'misses': cache.misses, 'size': len(cache), 'max_size': cache.max_size}
+
+
+def clear() -> None:
+    """Forget every remembered result. The datasets stay registered"""
+    cache.clear()
+
+
+def _registered(dataset: Any) -> Any:
+    """Return the current version of dataset, or None if it is not registered"""
+    with _lock:
+        entry = _versions.get(id(dataset))
+        return entry[1] if entry is not None and entry[0]() is dataset else None
+
+
+def _new_version() -> int:
+    """Return a version that was never given before"""
+    global _last_version
+    with _lock:
+        _last_version += 1
+        return _last_version
+
+
+def _collect(identity: int, reference: weakref.ref) -> None:
+    """Forget the registered dataset of id identity, which reference referred to, as it was garbage collected.
+    Its results are forgotten by the next call to _forget_collected, since the cache may be in use right now"""
+    with _lock:
+        entry = _versions.get(identity)
+        if entry is not None and entry[0] is reference:
+            del _versions[identity]
+            _collected.append(('dataset', identity, entry[1]))
+
+
+def _forget_collected() -> None:
+    """Forget every result remembered for a dataset that was garbage collected"""
+    with _lock:
+        if _collected == []:
+            return
+        collected = set(_collected)
+        _collected.clear()
+    cache.discard(lambda key: not _mentions(key, collected))
+
+
+def _mentions(part: Hashable, keys: set) -> bool:
+    """Return whether part of a key is, or contains, one of the keys of a dataset in keys"""
+    if not isinstance(part, tuple):
+        return False
+    return part in keys or any(_mentions(item, keys) for item in part)
+
+
+def _key_of(arg: Any) -> Hashable:
+    """Return what identifies arg in a key. A plain value is identified by its type and value, a set by its items
+    and a dataset by its identity and version. Raise TypeError if arg is neither a plain value nor a registered
+    dataset"""
+    if isinstance(arg, _PLAIN_TYPES):
+        return (type(arg), arg)
+    if isinstance(arg, (set, frozenset)):
+        return frozenset(_key_of(item) for item in arg)
+    if isinstance(arg, tuple):
+        return tuple(_key_of(item) for item in arg)
+    version = _registered(arg)
+    if version is None:
+        raise TypeError('Only the registered datasets are remembered, not ' + type(arg).__name__)
+    return ('dataset', id(arg), version)
+
+
+def _fresh(result: Any) -> Any:
+    """Return a copy of the lists, dicts, sets, tuples and dataclasses that are not frozen in result, sharing
+    every other object in it"""
+    kind = type(result)
+    if kind is list:
+        return [_fresh(item) for item in result]
+    if kind is dict:
+        return {key: _fresh(result[key]) for key in result}
+    if kind is set:
+        return set(result)
+    if kind is tuple:
+        return tuple(_fresh(item) for item in result)
+    if dataclasses.is_dataclass(result) and not isinstance(result, type) \
+            and not result.__dataclass_params__.frozen:
+        return dataclasses.replace(result, **{field.name: _fresh(getattr(result, field.name))
+                                              for field in dataclasses.fields(result) if field.init})
+    return result
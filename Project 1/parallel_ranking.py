@@ -0,0 +1,139 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file computes the values of a ranking in a pool of processes. The dataset is put in shared memory
+once, so every process reads the same copy instead of receiving its own copy of every row"""
+
+import contextlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+
+from co2_store import CO2Store
+from records import CO2Emission
+from temperature_table import CountryTemperatureTable
+
+# Every column stored in shared memory is described by its name, its typecode, its offset and its length in bytes
+Layout = List[Tuple[str, str, int, int]]
+
+# Set in every worker process by _start_worker: the name of the block of shared memory, its layout, the string
+# columns, the kind of data, the function and its other arguments
+_worker_task = None
+
+
+def average_increases(function: Callable, data: Union[CountryTemperatureTable, List[CO2Emission]],
+                      nations: set, arguments: tuple, workers: int) -> List[list]:
+    """Return [function(data, nation, *arguments), nation] for every nation in nations, sorted by nation.
+    The nations are split between workers processes, which all read data from the same shared memory. A list of
+    CO2Emission is read by the workers as a CO2Store, so function is called with the store instead
+    Representative Invariants:
+        - workers >= 1
+        - function can be imported by name, so that it can be sent to the workers"""
+    (kind, columns, strings) = _to_columns(data)
+    sorted_nations = sorted(nations)
+    chunks = [sorted_nations[i::workers] for i in range(workers)]
+    with _shared(columns) as (memory, layout):
+        with ProcessPoolExecutor(workers, initializer=_start_worker,
+                                 initargs=(memory.name, layout, strings, kind, function, arguments)) as pool:
+            results = list(pool.map(_apply, chunks))
+    merged = [row for chunk in results for row in chunk]
+    merged.sort(key=lambda row: row[1])
+    return merged
+
+
+def _to_columns(data: Union[CountryTemperatureTable, List[CO2Emission]]) -> Tuple[str, Dict[str, Any],
+                                                                                  Dict[str, List[str]]]:
+    """Return the kind of data, its numeric columns and its string columns"""
+    if isinstance(data, CountryTemperatureTable):
+        columns = data.to_columns()
+        strings = {'names': columns.pop('names')}
+        return ('temperature', columns, strings)
+    names = []
+    name_to_code = {}
+    codes = array('H')
+    for row in data:
+        if row.country not in name_to_code:
+            name_to_code[row.country] = len(names)
+            names.append(row.country)
+        codes.append(name_to_code[row.country])
+    columns = {'years': array('h', [row.year for row in data]),
+               'emissions': array('d', [row.emission for row in data]),
+               'codes': codes}
+    return ('co2', columns, {'names': names})
+
+
+def _from_columns(kind: str, columns: Dict[str, Any]) -> Union[CountryTemperatureTable, CO2Store]:
+    """Return the data of the given kind stored in columns, as returned by _to_columns. The CO2 emission is
+    returned as the CO2Store of its rows, which is made straight from the columns"""
+    if kind == 'temperature':
+        return CountryTemperatureTable.from_columns(columns)
+    return CO2Store.from_columns(columns['years'], columns['emissions'], columns['codes'], columns['names'])
+
+
+@contextlib.contextmanager
+def _shared(columns: Dict[str, Any]) -> Iterator[Tuple[shared_memory.SharedMemory, Layout]]:
+    """Copy every column into one new block of shared memory and yield the block and where every column is in
+    it. The block is removed once the with block ends"""
+    layout = []
+    offset = 0
+    for name in columns:
+        column = memoryview(columns[name])
+        layout.append((name, column.format, offset, column.nbytes))
+        offset += (column.nbytes + 7) // 8 * 8
+    memory = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    try:
+        for (name, _, start, length) in layout:
+            memory.buf[start:start + length] = memoryview(columns[name]).cast('B')
+        yield (memory, layout)
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+@contextlib.contextmanager
+def _attached(memory_name: str, layout: Layout) -> Iterator[Dict[str, memoryview]]:
+    """Yield every column stored in the block of shared memory called memory_name. The views of the columns
+    are released and the block is closed once the with block ends, so nothing made from them may outlive it"""
+    memory = shared_memory.SharedMemory(name=memory_name)
+    columns = {name: memory.buf[start:start + length].cast(typecode)
+               for (name, typecode, start, length) in layout}
+    try:
+        yield columns
+    finally:
+        for column in columns.values():
+            column.release()
+        columns.clear()
+        try:
+            memory.close()
+        except BufferError:
+            # The traceback of an error raised in the with block still refers to what was made from the columns,
+            # so the block is closed when that traceback is garbage collected instead
+            pass
+
+
+def _start_worker(memory_name: str, layout: Layout, strings: Dict[str, List[str]], kind: str,
+                  function: Callable, arguments: tuple) -> None:
+    """Remember in this worker process where the data is and what to compute from it"""
+    global _worker_task
+    _worker_task = (memory_name, layout, strings, kind, function, arguments)
+
+
+def _apply(nations: List[str]) -> List[list]:
+    """Return [value, nation] for every nation in nations, reading the data of this worker process from the
+    shared memory for as long as they are computed"""
+    (memory_name, layout, strings, kind, function, arguments) = _worker_task
+    with _attached(memory_name, layout) as columns:
+        data = _from_columns(kind, dict(columns, **strings))
+        results = [[function(data, nation, *arguments), nation] for nation in nations]
+        del data
+    return results
@@ -0,0 +1,193 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file measures where the time goes when the project runs. The loaders, the helper functions and the
+draw functions are decorated with profiled, and any other block of code can be measured with section.
+Nothing is measured unless the environment variable CSC110_PROFILE is set before the project is imported, in
+which case every measured function is left exactly as it is. CSC110_PROFILE is a list of options separated by
+commas:
+    - table: print a table of every measurement to stderr when python exits
+    - json: write every measurement to PROFILE_FILE when python exits
+    - memory: also measure the peak memory allocated, with tracemalloc, which makes everything slower
+
+Run it with
+    CSC110_PROFILE=table,memory python main.py"""
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List
+
+ENVIRONMENT_VARIABLE = 'CSC110_PROFILE'
+PROFILE_FILE = 'profile.json'
+
+# The options given in the environment variable, empty if nothing is measured
+options = {option.strip() for option in os.environ.get(ENVIRONMENT_VARIABLE, '').split(',') if option.strip()}
+enabled = len(options) > 0
+
+
+@dataclass
+class Measurement:
+    """Everything measured for one function or section, over every time it ran
+    Attributes
+        - calls: how many times it ran
+        - seconds: the total wall time it took, including the functions it called
+        - rows: the total rows of the datasets it was given, or of the dataset it returned if it was given none
+        - peak_bytes: the most memory allocated during one run, 0 if memory is not measured
+    Representative Invariants:
+        - self.calls >= 0
+        - self.seconds >= 0
+    """
+    calls: int = 0
+    seconds: float = 0.0
+    rows: int = 0
+    peak_bytes: int = 0
+
+
+@dataclass
+class _Frame:
+    """A function or section that is running in the current thread
+    Attributes
+        - start: the memory traced when it started
+        - highest: the most memory traced while it ran, before the last time the peak of tracemalloc was reset"""
+    start: int
+    highest: int
+
+
+measurements: Dict[str, Measurement] = {}
+_lock = threading.Lock()
+_running = threading.local()
+
+
+def profiled(function: Callable) -> Callable:
+    """Return function measured under its module and name, or function itself if nothing is measured"""
+    if not enabled:
+        return function
+    name = function.__module__ + '.' + function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        rows = sum(_rows_of(arg) for arg in args) + sum(_rows_of(kwargs[key]) for key in kwargs)
+        with _measure(name) as measured:
+            result = function(*args, **kwargs)
+            measured['rows'] = rows if rows > 0 else _rows_of(result)
+        return result
+    return wrapper
+
+
+@contextlib.contextmanager
+def section(name: str, rows: int = 0) -> Iterator[None]:
+    """Measure the with block under name, as if it scanned rows rows. Nothing is done if nothing is measured"""
+    if not enabled:
+        yield
+        return
+    with _measure(name) as measured:
+        measured['rows'] = rows
+        yield
+
+
+def summary() -> Dict[str, Dict[str, float]]:
+    """Return every measurement so far, from the one that took the most time to the one that took the least"""
+    with _lock:
+        ordered = sorted(measurements.items(), key=lambda item: item[1].seconds, reverse=True)
+        return {name: asdict(measurement) for (name, measurement) in ordered}
+
+
+def table() -> str:
+    """Return every measurement so far as a table"""
+    lines = ['%-60s %8s %12s %12s %14s' % ('function', 'calls', 'seconds', 'rows', 'peak MB')]
+    for (name, measurement) in summary().items():
+        lines.append('%-60s %8d %12.4f %12d %14.3f' % (name, measurement['calls'], measurement['seconds'],
+                                                        measurement['rows'], measurement['peak_bytes'] / 1e6))
+    return '\n'.join(lines)
+
+
+def write_json(path: str = PROFILE_FILE) -> None:
+    """Write every measurement so far into the json file path"""
+    with open(path, 'w') as file:
+        json.dump(summary(), file, indent=2)
+
+
+def clear() -> None:
+    """Forget every measurement so far"""
+    with _lock:
+        measurements.clear()
+
+
+@contextlib.contextmanager
+def _measure(name: str) -> Iterator[Dict[str, int]]:
+    """Measure the with block under name. The rows the block scanned are set in the dictionary it is given"""
+    frames = _frames()
+    memory = tracemalloc.is_tracing()
+    if memory:
+        (current, peak) = tracemalloc.get_traced_memory()
+        if frames != []:
+            frames[-1].highest = max(frames[-1].highest, peak)
+        tracemalloc.reset_peak()
+        frames.append(_Frame(current, current))
+    measured = {'rows': 0}
+    start = time.perf_counter()
+    try:
+        yield measured
+    finally:
+        seconds = time.perf_counter() - start
+        peak_bytes = 0
+        if memory:
+            frame = frames.pop()
+            highest = max(frame.highest, tracemalloc.get_traced_memory()[1])
+            peak_bytes = highest - frame.start
+            if frames != []:
+                frames[-1].highest = max(frames[-1].highest, highest)
+        with _lock:
+            if name not in measurements:
+                measurements[name] = Measurement()
+            measurement = measurements[name]
+            measurement.calls += 1
+            measurement.seconds += seconds
+            measurement.rows += measured['rows']
+            measurement.peak_bytes = max(measurement.peak_bytes, peak_bytes)
+
+
+def _frames() -> List[_Frame]:
+    """Return the functions and sections that are running in the current thread, from the outermost"""
+    if not hasattr(_running, 'frames'):
+        _running.frames = []
+    return _running.frames
+
+
+def _rows_of(value: Any) -> int:
+    """Return how many rows value has if it is a dataset, or 0 otherwise. Sets, dictionaries and strings are
+    not datasets"""
+    if isinstance(value, (str, bytes, set, frozenset, dict)) or not hasattr(value, '__len__'):
+        return 0
+    return len(value)
+
+
+def _report() -> None:
+    """Print or write every measurement, as asked for in the environment variable"""
+    if 'table' in options:
+        print(table(), file=sys.stderr)
+    if 'json' in options:
+        write_json()
+
+
+if enabled:
+    if 'memory' in options:
+        tracemalloc.start()
+    atexit.register(_report)
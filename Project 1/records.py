@@ -0,0 +1,140 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file contains the dataclasses of every dataset, which every other file imports. Every dataclass
+has slots instead of a dictionary per row. The rows that are never changed after they are read are frozen,
+while CO2Emission is not, since its country is renamed by converting_data.mutate_united_states. The datasets
+that are lists of rows are RecordList"""
+
+import datetime
+from dataclasses import dataclass
+from typing import Optional
+
+
+class RecordList(list):
+    """A list of the rows of a dataset. Unlike a plain list it can be weakly referenced, so the caches kept for
+    a dataset, such as its remembered results in memo, are dropped once the dataset is garbage collected"""
+    __slots__ = ('__weakref__',)
+
+
+class _FrozenRecord:
+    """The parent of the frozen dataclasses, which lets them be copied and pickled even though they have slots and
+    cannot be assigned to"""
+    __slots__ = ()
+
+    def __getstate__(self) -> tuple:
+        """Return the value of every slot, in the order of __slots__"""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        """Set every slot to its value in state"""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class GlobalTemperature(_FrozenRecord):
+    """The dataset from GlobalTemperatures.csv, formatted to show three variables, date in datetime.date,
+    average temperature, uncertainty in average temperature
+    Attributes
+        - date: the datetime in datetime.date format, with year-month-day
+        - temperature: average temperature of the world in floats
+        - year: the year of date, computed when the row is made
+        - month: the month of date, computed when the row is made
+    """
+    __slots__ = ('date', 'temperature', 'year', 'month')
+    date: datetime.date
+    temperature: Optional[float]
+
+    def __post_init__(self) -> None:
+        """Compute the year and month of date once, so that filters compare integers"""
+        object.__setattr__(self, 'year', self.date.year)
+        object.__setattr__(self, 'month', self.date.month)
+
+
+@dataclass(frozen=True)
+class CountryTemperature(_FrozenRecord):
+    """The dataset from GlobalLandTemperaturesByCountry.csv, formatted  to show three variables, date in datetime.date
+    average temperature, and the country itself
+    Attributes
+        - date: the datetime in datetime.date format, with year-month-day
+        - temperature: average temperature of the country in floats
+        - country: the name of the country in strings
+        - year: the year of date, computed when the row is made
+        - month: the month of date, computed when the row is made
+    """
+    __slots__ = ('date', 'temperature', 'country', 'year', 'month')
+    date: datetime.date
+    temperature: Optional[float]
+    country: str
+
+    def __post_init__(self) -> None:
+        """Compute the year and month of date once, so that filters compare integers"""
+        object.__setattr__(self, 'year', self.date.year)
+        object.__setattr__(self, 'month', self.date.month)
+
+
+@dataclass
+class CO2Emission:
+    """The dataset from UNdata_Export_20201102_015629836,
+    Carbon dioxide (CO2) Emissions without Land Use,
+    Land-Use Change and Forestry (LULUCF), in kilotonne CO2 equi.csv, formatted to show three variables,
+    country or area, year, emission
+    Attributes
+        - date: the datetime in datetime.date format, with every month and date being January 1st
+        - emission: The emission as a float in killotone CO2
+        - country: the name of the country in strings
+        - year: the year of date, computed when the row is made
+        - month: the month of date, computed when the row is made
+    """
+    __slots__ = ('date', 'emission', 'country', 'year', 'month')
+    date: datetime.date
+    emission: float
+    country: str
+
+    def __post_init__(self) -> None:
+        """Compute the year and month of date once, so that filters compare integers"""
+        self.year = self.date.year
+        self.month = self.date.month
+
+
+@dataclass(frozen=True)
+class GDP(_FrozenRecord):
+    """The dataset from GDP.csv, formetted to show three variables, ranking, country, and GDP. This dataset
+    shows the ranking of all country's GDP in 2019
+    Attributes
+        - ranking: the rank the country's GDP, from highest to lowest
+        - country: the name of the country in strings
+        - gdp: the GDP calculated in millions of USD in strings"""
+    __slots__ = ('ranking', 'gdp', 'country')
+    ranking: int
+    gdp: str
+    country: str
+
+
+@dataclass(frozen=True)
+class GlobalCO2(_FrozenRecord):
+    """The dataset from climate_change.csv, formatted to show two variables, datetime and CO2 emission.
+    This dataset shows the global CO2 in parts per million by volume
+    Attributes
+        - date: the datetime in datetime.date format
+        - emission: the parts
+        - year: the year of date, computed when the row is made
+        - month: the month of date, computed when the row is made"""
+    __slots__ = ('date', 'emission', 'year', 'month')
+    date: datetime.date
+    emission: float
+
+    def __post_init__(self) -> None:
+        """Compute the year and month of date once, so that filters compare integers"""
+        object.__setattr__(self, 'year', self.date.year)
+        object.__setattr__(self, 'month', self.date.month)
@@ -0,0 +1,172 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file contains the simple linear regression used throughout the project. Every statistic of a
+regression is found in a single pass through the data, with NumPy if it is installed"""
+
+import math
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@dataclass
+class Regression:
+    """The result of modelling a set of points as the line y = intercept + slope * x
+    Attributes
+        - intercept: the y value of the line when x is 0
+        - slope: the increase in y for every increase of 1 in x
+        - r_squared: the r squared value of the line
+        - intercept_error: the standard error of the intercept
+        - slope_error: the standard error of the slope
+        - n: the amount of points used
+        - residuals: the y value of every point minus the y value of the line at that point
+    Representative Invariants:
+        - self.residuals == [] or len(self.residuals) == self.n"""
+    intercept: float
+    slope: float
+    r_squared: float
+    intercept_error: float
+    slope_error: float
+    n: int
+    residuals: List[float] = field(default_factory=list)
+
+
+class RunningRegression:
+    """A simple linear regression that is updated one point at a time using Welford's method, so that
+    the points do not need to be stored
+    Instance Attributes
+        - n: the amount of points added so far
+        - mean_x: the mean of the x values added so far
+        - mean_y: the mean of the y values added so far
+        - sxx: the sum of the squared differences between every x value and mean_x
+        - syy: the sum of the squared differences between every y value and mean_y
+        - sxy: the sum of the products of the differences of x from mean_x and y from mean_y
+    """
+    n: int
+    mean_x: float
+    mean_y: float
+    sxx: float
+    syy: float
+    sxy: float
+
+    def __init__(self) -> None:
+        """Initialize a regression with no points"""
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.sxx = 0.0
+        self.syy = 0.0
+        self.sxy = 0.0
+
+    def add(self, x: float, y: float) -> None:
+        """Add the point (x, y) to the regression. The point is skipped if x or y is missing"""
+        if x is None or y is None or x != x or y != y:
+            return
+        self.n += 1
+        dx = x - self.mean_x
+        self.mean_x += dx / self.n
+        dy = y - self.mean_y
+        self.mean_y += dy / self.n
+        self.sxx += dx * (x - self.mean_x)
+        self.syy += dy * (y - self.mean_y)
+        self.sxy += dx * (y - self.mean_y)
+
+    def result(self) -> Regression:
+        """Return the regression of every point added so far, without its residuals"""
+        return _from_sums(self.n, self.mean_x, self.mean_y, self.sxx, self.syy, self.sxy)
+
+
+def fit(x: Sequence[float], y: Sequence[float]) -> Regression:
+    """Return the simple linear regression of y on x. The points where x or y is missing are skipped
+    Representative Invariants:
+        - len(x) == len(y)"""
+    if numpy is not None:
+        return fit_batch([x], [y])[0]
+    running = RunningRegression()
+    for i in range(len(x)):
+        running.add(x[i], y[i])
+    result = running.result()
+    result.residuals = [y[i] - (result.intercept + result.slope * x[i]) for i in range(len(x))
+                        if _is_present(x[i]) and _is_present(y[i])]
+    return result
+
+
+def fit_batch(xs: Sequence[Sequence[float]], ys: Sequence[Sequence[float]]) -> List[Regression]:
+    """Return the simple linear regression of ys[i] on xs[i] for every row i. When NumPy is installed and
+    every row has the same length, all the rows are fitted at once. The points where x or y is missing
+    (None or nan) are skipped
+    Representative Invariants:
+        - len(xs) == len(ys)
+        - all(len(xs[i]) == len(ys[i]) for i in range(len(xs)))"""
+    if numpy is None or len({len(row) for row in xs}) > 1:
+        return [fit(xs[i], ys[i]) for i in range(len(xs))]
+
+    x = numpy.array(xs, dtype=float, ndmin=2)
+    y = numpy.array(ys, dtype=float, ndmin=2)
+    present = ~(numpy.isnan(x) | numpy.isnan(y))
+    n = present.sum(axis=1)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        mean_x = numpy.where(present, x, 0).sum(axis=1) / n
+        mean_y = numpy.where(present, y, 0).sum(axis=1) / n
+        dx = numpy.where(present, x - mean_x[:, None], 0)
+        dy = numpy.where(present, y - mean_y[:, None], 0)
+        sxx = (dx * dx).sum(axis=1)
+        syy = (dy * dy).sum(axis=1)
+        sxy = (dx * dy).sum(axis=1)
+        residuals = y - (mean_y - sxy / sxx * mean_x)[:, None] - (sxy / sxx)[:, None] * x
+
+    results = []
+    for i in range(len(n)):
+        result = _from_sums(int(n[i]), float(mean_x[i]), float(mean_y[i]),
+                            float(sxx[i]), float(syy[i]), float(sxy[i]))
+        result.residuals = residuals[i][present[i]].tolist()
+        results.append(result)
+    return results
+
+
+def line_points(regression: Regression, x_start: int, x_end: int) -> List[list]:
+    """Return the points of the regression line for every integer x from x_start up to but not including
+    x_end, as a list of the x values and a list of the y values"""
+    x_so_far = list(range(x_start, x_end))
+    y_so_far = [regression.intercept + regression.slope * x for x in x_so_far]
+    return [x_so_far, y_so_far]
+
+
+def _from_sums(n: int, mean_x: float, mean_y: float, sxx: float, syy: float, sxy: float) -> Regression:
+    """Return the regression of n points with the given means, sums of squares and sum of products.
+    The values that can not be found with this many points are nan"""
+    slope = _divide(sxy, sxx)
+    intercept = mean_y - slope * mean_x
+    ssres = syy - slope * sxy
+    r_squared = 1 - _divide(ssres, syy)
+    variance = max(ssres, 0.0) / (n - 2) if n > 2 else math.nan
+    slope_error = math.sqrt(_divide(variance, sxx)) if variance >= 0 else math.nan
+    intercept_error = math.sqrt(variance * (_divide(1, n) + _divide(mean_x ** 2, sxx))) if variance >= 0 \
+        else math.nan
+    return Regression(intercept, slope, r_squared, intercept_error, slope_error, n)
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """Return numerator / denominator, or nan if the denominator is 0"""
+    if denominator == 0:
+        return math.nan
+    return numerator / denominator
+
+
+def _is_present(value: Optional[float]) -> bool:
+    """Return whether value is not missing"""
+    return value is not None and value == value
@@ -0,0 +1,78 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file decides what happens to a graph once it is drawn. It can be shown in the browser like before,
+returned as a plotly Figure, or written into an html or json file without opening anything"""
+
+import contextlib
+import os
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+import profiling
+
+MODES = {'show', 'figure', 'html', 'json'}
+
+
+@dataclass
+class RenderTarget:
+    """Where a graph goes once it is drawn
+    Attributes
+        - mode: 'show' to open it in the browser, 'figure' to only return it, 'html' or 'json' to write it
+          into the file path
+        - path: the file the graph is written to
+    Representative Invariants:
+        - self.mode in MODES
+        - self.mode not in {'html', 'json'} or self.path is not None"""
+    mode: str = 'show'
+    path: Optional[str] = None
+
+
+# The target used by every draw function that is not given one
+default_target = RenderTarget()
+
+
+@profiling.profiled
+def render(fig: Any, target: Optional[RenderTarget] = None) -> Any:
+    """Send fig to target, or to default_target if target is None, and return fig"""
+    if target is None:
+        target = default_target
+    if target.mode == 'show':
+        fig.show()
+    elif target.mode == 'html':
+        _make_directory(target.path)
+        fig.write_html(target.path)
+    elif target.mode == 'json':
+        _make_directory(target.path)
+        fig.write_json(target.path)
+    elif target.mode != 'figure':
+        raise ValueError('Unknown render mode ' + repr(target.mode) + ', expected one of ' + str(sorted(MODES)))
+    return fig
+
+
+@contextlib.contextmanager
+def using(target: RenderTarget) -> Iterator[None]:
+    """Make target the default_target for the duration of the with block"""
+    global default_target
+    previous = default_target
+    default_target = target
+    try:
+        yield
+    finally:
+        default_target = previous
+
+
+def _make_directory(path: str) -> None:
+    """Create the folder that the file path goes into, if it does not exist"""
+    directory = os.path.dirname(path)
+    if directory != '':
+        os.makedirs(directory, exist_ok=True)
@@ -0,0 +1,218 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file runs the analyses of the project from the command line, without editing the years and countries
+written in main.py. Every analysis is a graph of batch.py named by its alias, and takes some of the parameters
+below. Every parameter can be given many values, in which case the analysis is drawn once for every combination
+of the values:
+    - start_year and end_year: the years the analysis covers
+    - country: the country of an analysis about one country
+    - countries: the countries of an analysis that compares countries
+    - top: how many countries are shown by the pollution share
+    - method and window: how a monthly series is smoothed, and over how many months, as in rolling
+    - resolution, max_frames and compact: the period of every frame of the temperature map, how many frames it
+      keeps at most and whether its temperatures are rounded, as in global_map
+The combinations are drawn in a pool of worker processes. The datasets are loaded once before the workers start,
+and every worker shares them with the process that started it instead of loading its own copy.
+
+Run it with
+    python report.py list
+    python report.py run ranking-comparison pollution-share --start-year 1980 1990 --output report --workers 4"""
+
+import argparse
+import hashlib
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import batch
+import country_registry
+import dataset_registry
+import global_map
+import render
+import rolling
+
+
+# Maps the alias of every graph of batch, which names it as an analysis, to the graph. Its defaults are the years
+# and countries used in main.py
+ANALYSES: Dict[str, batch.Graph] = {graph.alias: graph for graph in batch.graphs()}
+
+# Every task is the name of an analysis, the value of every parameter it takes and the file it is written into
+Task = Tuple[str, Dict[str, Any], str]
+
+# Every result is the file of a task, how many seconds it took and the error it raised, or None if it was written
+Result = Tuple[str, float, Optional[str]]
+
+# The datasets used by the analyses drawn in this process
+_datasets: Optional[dataset_registry.DatasetRegistry] = None
+
+
+def tasks(names: List[str], values: Dict[str, List[Any]], output_directory: str,
+          file_format: str = 'html') -> List[Task]:
+    """Return a task for every analysis in names and every combination of the values of the parameters it takes.
+    A parameter missing from values takes its default value, and values for a parameter an analysis does not take
+    are left out of that analysis. Combinations where start_year is after end_year are skipped
+    Representative Invariants:
+        - all(name in ANALYSES for name in names)
+        - file_format in {'html', 'json'}"""
+    all_tasks = []
+    for name in names:
+        parameters = list(ANALYSES[name].defaults)
+        choices = [values.get(parameter) or [ANALYSES[name].defaults[parameter]] for parameter in parameters]
+        for combination in itertools.product(*choices):
+            chosen = dict(zip(parameters, combination))
+            if chosen.get('start_year', 0) > chosen.get('end_year', chosen.get('start_year', 0)):
+                continue
+            path = os.path.join(output_directory, _file_name(name, chosen) + '.' + file_format)
+            all_tasks.append((name, chosen, path))
+    return all_tasks
+
+
+def run(all_tasks: List[Task], workers: int = 1,
+        datasets: Optional[dataset_registry.DatasetRegistry] = None) -> Iterator[Result]:
+    """Draw every task and yield its result as soon as it is written. A task that raises an error does not stop
+    the others. If workers is more than 1, the tasks are drawn in that many worker processes, which share the
+    datasets loaded here when the operating system can fork processes, and load their own otherwise
+    Representative Invariants:
+        - workers >= 1"""
+    global _datasets
+    _datasets = batch.load_datasets() if datasets is None else datasets
+    if workers <= 1:
+        for task in all_tasks:
+            yield _draw(task)
+        return
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+        for name in sorted({dataset for task in all_tasks for dataset in ANALYSES[task[0]].datasets}):
+            _datasets[name]
+    else:
+        context = multiprocessing.get_context()
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_start_worker) as pool:
+        for future in as_completed([pool.submit(_draw, task) for task in all_tasks]):
+            yield future.result()
+
+
+def _start_worker() -> None:
+    """Make the datasets of a worker process that was not forked with them"""
+    global _datasets
+    if _datasets is None:
+        _datasets = batch.load_datasets()
+
+
+def _draw(task: Task) -> Result:
+    """Draw task with the datasets of this process and return its result"""
+    (name, parameters, path) = task
+    start = time.perf_counter()
+    try:
+        ANALYSES[name].draw(_datasets, parameters, render.RenderTarget(os.path.splitext(path)[1][1:], path))
+    except Exception as error:
+        return (path, time.perf_counter() - start, type(error).__name__ + ': ' + str(error))
+    return (path, time.perf_counter() - start, None)
+
+
+def _file_name(name: str, parameters: Dict[str, Any]) -> str:
+    """Return the name of the file of the analysis called name drawn with parameters, without its extension.
+    A set of more than three countries is named by its size and a hash of the countries in it"""
+    parts = [name]
+    for parameter in parameters:
+        value = parameters[parameter]
+        if value is None:
+            continue
+        if isinstance(value, frozenset):
+            countries = sorted(value)
+            if len(countries) > 3:
+                digest = hashlib.sha1('\n'.join(countries).encode('utf-8')).hexdigest()[:8]
+                value = str(len(countries)) + '-countries-' + digest
+            else:
+                value = '+'.join(countries)
+        parts.append(parameter + '-' + str(value).replace(' ', '-').replace(os.sep, '-'))
+    return '_'.join(parts)
+
+
+def _describe() -> str:
+    """Return every analysis, the parameters it takes with their default and what it draws"""
+    lines = []
+    for name in ANALYSES:
+        defaults = ANALYSES[name].defaults
+        parameters = ', '.join(parameter + '=' + ('<default>' if defaults[parameter] is None
+                                                 else str(defaults[parameter])) for parameter in defaults)
+        lines.append(name + ' (' + parameters + ')')
+        lines.append('    ' + ANALYSES[name].description)
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the analyses of the project for many years and countries')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('list', help='list every analysis and the parameters it takes')
+    run_parser = commands.add_parser('run', help='draw analyses into a folder')
+    run_parser.add_argument('analyses', nargs='+', help='the analyses to draw, or all to draw every analysis')
+    run_parser.add_argument('--start-year', type=int, nargs='+', help='the years the analyses start from')
+    run_parser.add_argument('--end-year', type=int, nargs='+', help='the years the analyses end at')
+    run_parser.add_argument('--country', nargs='+', help='the countries drawn by analyses about one country')
+    run_parser.add_argument('--countries', nargs='+', action='append',
+                            help='a set of countries for analyses comparing countries, can be given many times')
+    run_parser.add_argument('--top', type=int, nargs='+', help='how many countries the pollution share shows')
+    run_parser.add_argument('--method', choices=rolling.METHODS, nargs='+',
+                            help='how the smoothed analyses smooth their series')
+    run_parser.add_argument('--window', type=int, nargs='+', help='how many months the smoothed analyses smooth over')
+    run_parser.add_argument('--resolution', choices=global_map.RESOLUTIONS, nargs='+',
+                            help='the period of every frame of the temperature map')
+    run_parser.add_argument('--max-frames', type=int, nargs='+', help='how many frames the temperature map keeps')
+    run_parser.add_argument('--compact', choices=['yes', 'no'], nargs='+',
+                            help='whether the temperature map rounds its temperatures to make it smaller')
+    run_parser.add_argument('--output', default='report', help='the folder the analyses are written into')
+    run_parser.add_argument('--format', choices=['html', 'json'], default='html', help='the type of file written')
+    run_parser.add_argument('--workers', type=int, default=1, help='how many worker processes draw the analyses')
+    arguments = parser.parse_args()
+
+    if arguments.command == 'list':
+        print(_describe())
+        sys.exit()
+    if 'all' in arguments.analyses:
+        chosen_analyses = list(ANALYSES)
+    else:
+        try:
+            chosen_analyses = [graph.alias for graph in batch.select(list(ANALYSES.values()), arguments.analyses)]
+        except ValueError as error:
+            parser.error(str(error) + ', run python report.py list to see every analysis')
+    parameter_values = {
+        'start_year': arguments.start_year,
+        'end_year': arguments.end_year,
+        'country': None if arguments.country is None
+        else [country_registry.canonical_name(country) for country in arguments.country],
+        'countries': None if arguments.countries is None
+        else [frozenset(country_registry.canonical_name(country) for country in group)
+              for group in arguments.countries],
+        'top': arguments.top,
+        'method': arguments.method,
+        'window': arguments.window,
+        'resolution': arguments.resolution,
+        'max_frames': arguments.max_frames,
+        'compact': None if arguments.compact is None else [choice == 'yes' for choice in arguments.compact],
+    }
+    report_tasks = tasks(chosen_analyses, parameter_values, arguments.output, arguments.format)
+    report_start = time.perf_counter()
+    failed = 0
+    for (result_path, seconds, error) in run(report_tasks, arguments.workers):
+        if error is None:
+            print('%-100s %8.3f s' % (result_path, seconds))
+        else:
+            failed += 1
+            print('%-100s FAILED %s' % (result_path, error), file=sys.stderr)
+    print('Wrote %d of %d analyses in %.3f s' % (len(report_tasks) - failed, len(report_tasks),
+                                                 time.perf_counter() - report_start))
+    sys.exit(1 if failed > 0 else 0)
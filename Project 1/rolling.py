@@ -0,0 +1,224 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file smooths a monthly series, such as the temperature of the world, with a window that rolls over
+it one row at a time. The sums of the window are updated as every row enters and leaves it, so a whole series
+is smoothed in a single pass through it however wide the window is. The series can be smoothed with:
+    - mean: the mean of the values in the window
+    - sum: the sum of the values in the window
+    - slope: the slope of the regression line of the values in the window, per year
+    - ewma: the exponentially weighted moving average, where a window of w rows weighs every row 2 / (w + 1)"""
+
+import datetime
+import math
+from collections import deque
+from typing import Callable, Deque, List, Optional, Sequence, Tuple, Union
+
+from records import GlobalTemperature, GlobalCO2
+from temperature_table import CountryTemperatureTable
+
+METHODS = ('mean', 'sum', 'slope', 'ewma')
+
+
+class RollingWindow:
+    """The sums of the values in the last size rows of a series, updated as every row is added. A missing value
+    takes up a row of the window but is not counted in its sums
+    Instance Attributes
+        - size: the amount of rows in the window
+        - n: the amount of values in the window that are not missing
+        - sum_x: the sum of the x values in the window, measured from origin
+        - sum_y: the sum of the values in the window
+        - sum_xx: the sum of the squared x values in the window, measured from origin
+        - sum_xy: the sum of the products of the x values, measured from origin, and the values in the window
+        - origin: the x value every x value is measured from, so that the sums stay small. It is moved to the
+          oldest value of the window whenever the sums are computed again
+        - _rows: the x value and the value of every row in the window, or None if its value is missing
+        - _added: the amount of rows added so far
+    Representative Invariants:
+        - self.size >= 1
+        - 0 <= self.n <= len(self._rows) <= self.size
+    """
+    size: int
+    n: int
+    sum_x: float
+    sum_y: float
+    sum_xx: float
+    sum_xy: float
+    origin: Optional[float]
+    _rows: Deque[Optional[Tuple[float, float]]]
+    _added: int
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty window of size rows"""
+        if size < 1:
+            raise ValueError('A window must have at least one row, not ' + str(size))
+        self.size = size
+        self.n = 0
+        self.sum_x = 0.0
+        self.sum_y = 0.0
+        self.sum_xx = 0.0
+        self.sum_xy = 0.0
+        self.origin = None
+        self._rows = deque()
+        self._added = 0
+
+    def add(self, x: float, y: Optional[float]) -> None:
+        """Add the row with the value y at x to the window, and remove the oldest row if the window is full"""
+        if self.origin is None:
+            self.origin = x
+        if _is_present(y):
+            x -= self.origin
+            self._rows.append((x, y))
+            self._update(x, y, 1)
+        else:
+            self._rows.append(None)
+        if len(self._rows) > self.size:
+            oldest = self._rows.popleft()
+            if oldest is not None:
+                self._update(oldest[0], oldest[1], -1)
+        self._added += 1
+        if self._added % self.size == 0:
+            self._sum_again()
+
+    def total(self) -> float:
+        """Return the sum of the values in the window, or nan if every value is missing"""
+        return self.sum_y if self.n > 0 else math.nan
+
+    def mean(self) -> float:
+        """Return the mean of the values in the window, or nan if every value is missing"""
+        return self.sum_y / self.n if self.n > 0 else math.nan
+
+    def slope(self) -> float:
+        """Return the slope of the regression line of the values in the window on their x values, or nan if
+        there are fewer than two values or they all have the same x value"""
+        if self.n < 2:
+            return math.nan
+        denominator = self.n * self.sum_xx - self.sum_x * self.sum_x
+        if denominator <= 0:
+            return math.nan
+        return (self.n * self.sum_xy - self.sum_x * self.sum_y) / denominator
+
+    def _update(self, x: float, y: float, sign: int) -> None:
+        """Add the value y at x to the sums if sign is 1, or remove it from the sums if sign is -1"""
+        self.n += sign
+        self.sum_x += sign * x
+        self.sum_y += sign * y
+        self.sum_xx += sign * x * x
+        self.sum_xy += sign * x * y
+
+    def _sum_again(self) -> None:
+        """Move origin to the oldest value of the window and compute the sums again from the rows in the window.
+        This is done once every size rows, so that the rounding errors of adding and removing rows do not build
+        up, and costs a constant time per row"""
+        rows = [row for row in self._rows if row is not None]
+        if rows != []:
+            shift = rows[0][0]
+            self.origin += shift
+            rows = [(x - shift, y) for (x, y) in rows]
+            self._rows = deque(None if row is None else (row[0] - shift, row[1]) for row in self._rows)
+        self.n = len(rows)
+        self.sum_x = math.fsum(x for (x, _) in rows)
+        self.sum_y = math.fsum(y for (_, y) in rows)
+        self.sum_xx = math.fsum(x * x for (x, _) in rows)
+        self.sum_xy = math.fsum(x * y for (x, y) in rows)
+
+
+def moving_sum(values: Sequence[Optional[float]], window: int, min_values: int = 1) -> List[float]:
+    """Return the sum of the values in the window of the last window rows ending at every row, or nan where
+    the window has fewer than min_values values that are not missing"""
+    return _roll(range(len(values)), values, window, min_values, RollingWindow.total)
+
+
+def moving_mean(values: Sequence[Optional[float]], window: int, min_values: int = 1) -> List[float]:
+    """Return the mean of the values in the window of the last window rows ending at every row, or nan where
+    the window has fewer than min_values values that are not missing"""
+    return _roll(range(len(values)), values, window, min_values, RollingWindow.mean)
+
+
+def rolling_slope(x: Sequence[float], values: Sequence[Optional[float]], window: int,
+                  min_values: int = 2) -> List[float]:
+    """Return the slope of the regression line of the values on x in the window of the last window rows ending
+    at every row, or nan where the window has fewer than min_values values that are not missing
+    Representative Invariants:
+        - len(x) == len(values)"""
+    return _roll(x, values, window, max(min_values, 2), RollingWindow.slope)
+
+
+def ewma(values: Sequence[Optional[float]], alpha: float) -> List[float]:
+    """Return the exponentially weighted moving average of values at every row, where every value is weighed
+    alpha and the average before it 1 - alpha. A missing value leaves the average as it is, and the average is
+    nan before the first value
+    Representative Invariants:
+        - 0 < alpha <= 1"""
+    average = math.nan
+    averages = []
+    for value in values:
+        if _is_present(value):
+            average = value if average != average else alpha * value + (1 - alpha) * average
+        averages.append(average)
+    return averages
+
+
+def smooth(values: Sequence[Optional[float]], method: str, window: int,
+           x: Optional[Sequence[float]] = None) -> List[float]:
+    """Return values smoothed with method over a window of window rows. The slope is found on x, or on the
+    position of every row if x is None
+    Representative Invariants:
+        - method in METHODS
+        - window >= 1"""
+    if method == 'mean':
+        return moving_mean(values, window)
+    if method == 'sum':
+        return moving_sum(values, window)
+    if method == 'slope':
+        return rolling_slope(range(len(values)) if x is None else x, values, window)
+    if method == 'ewma':
+        return ewma(values, 2 / (window + 1))
+    raise ValueError('Unknown smoothing method ' + repr(method) + ', expected one of ' + str(METHODS))
+
+
+def series(data: Union[CountryTemperatureTable, List[GlobalTemperature], List[GlobalCO2]],
+           nation: Optional[str] = None) -> Tuple[List[datetime.date], List[float]]:
+    """Return the date and the value of every row of data, in the order of data, with nan where the value is
+    missing. The value is the temperature of a temperature dataset and the emission of a CO2 dataset. If data is
+    the table of country temperatures, only the rows of nation are returned
+    Representative Invariants:
+        - not isinstance(data, CountryTemperatureTable) or nation is not None"""
+    if isinstance(data, CountryTemperatureTable):
+        rows = data.select(nation)
+        return (rows.dates(), list(rows.temperatures))
+    if data != [] and isinstance(data[0], GlobalCO2):
+        return ([row.date for row in data], [row.emission for row in data])
+    return ([row.date for row in data],
+            [math.nan if row.temperature is None else row.temperature for row in data])
+
+
+def decimal_year(date: datetime.date) -> float:
+    """Return date as a number of years, where every month is a twelfth of a year, such as 1990.5 for July 1990"""
+    return date.year + (date.month - 1) / 12
+
+
+def _roll(x: Sequence[float], values: Sequence[Optional[float]], window: int, min_values: int,
+          statistic: Callable[[RollingWindow], float]) -> List[float]:
+    """Return statistic of the window of the last window rows ending at every row, or nan where the window has
+    fewer than min_values values that are not missing"""
+    rolling = RollingWindow(window)
+    results = []
+    for i in range(len(values)):
+        rolling.add(x[i], values[i])
+        results.append(statistic(rolling) if rolling.n >= min_values else math.nan)
+    return results
+
+
+def _is_present(value: Optional[float]) -> bool:
+    """Return whether value is not missing"""
+    return value is not None and value == value
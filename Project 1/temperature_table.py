@@ -0,0 +1,164 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file contains the columnar table that stores GlobalLandTemperaturesByCountry.csv. Instead of
+one dataclass per row, every variable is stored in its own compact array"""
+
+import datetime
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+Column = Union[array, memoryview]
+
+
+class CountryTemperatureTable:
+    """The dataset from GlobalLandTemperaturesByCountry.csv stored column by column. The row i of the table
+    is the average temperature temperatures[i] of the country names[codes[i]] in the month months[i] of the
+    year years[i]
+    Instance Attributes
+        - years: the year of every row, stored as 16 bit integers
+        - months: the month of every row, stored as 8 bit integers
+        - temperatures: the average temperature of every row in floats, nan if the temperature is missing
+        - codes: the index in names of the country of every row
+        - names: the name of every country, each name is stored only once
+        - _codes: maps the name of every country to its code
+        - _bounds: maps the code of every country in the table to its first and one past its last row
+    Representative Invariants:
+        - len(self.years) == len(self.months) == len(self.temperatures) == len(self.codes)
+        - all(0 <= code < len(self.names) for code in self.codes)
+        - the rows of the same country are next to each other and sorted by date
+    """
+    years: memoryview
+    months: memoryview
+    temperatures: memoryview
+    codes: memoryview
+    names: List[str]
+    _codes: Dict[str, int]
+    _bounds: Dict[int, Tuple[int, int]]
+
+    def __init__(self, years: Column, months: Column, temperatures: Column, codes: Column,
+                 names: List[str], bounds: Optional[Dict[int, Tuple[int, int]]] = None) -> None:
+        """Initialize the table from its columns. The rows are sorted by country and date if they are
+        not already. If bounds is given, the rows must already be sorted and bounds must map the code of every
+        country to its first and one past its last row"""
+        if bounds is None and not _is_grouped(years, months, codes):
+            order = sorted(range(len(codes)), key=lambda i: (codes[i], years[i], months[i]))
+            years = array('h', [years[i] for i in order])
+            months = array('b', [months[i] for i in order])
+            temperatures = array('d', [temperatures[i] for i in order])
+            codes = array('H', [codes[i] for i in order])
+        self.years = memoryview(years)
+        self.months = memoryview(months)
+        self.temperatures = memoryview(temperatures)
+        self.codes = memoryview(codes)
+        self.names = names
+        self._codes = {name: code for code, name in enumerate(names)}
+        if bounds is None:
+            self._bounds = _index_countries(self.codes)
+        else:
+            self._bounds = bounds
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Union[Column, List[str]]]) -> 'CountryTemperatureTable':
+        """Return the table stored in columns, as returned by to_columns"""
+        bounds = {code: (start, end) for (code, start, end) in
+                  zip(columns['bound_codes'], columns['bound_starts'], columns['bound_ends'])}
+        return cls(columns['years'], columns['months'], columns['temperatures'], columns['codes'],
+                   columns['names'], bounds)
+
+    def to_columns(self) -> Dict[str, Union[Column, List[str]]]:
+        """Return every column of the table along with its index, so that the table can be stored
+        and rebuilt with from_columns without sorting or indexing it again"""
+        return {'years': self.years, 'months': self.months, 'temperatures': self.temperatures,
+                'codes': self.codes, 'names': self.names,
+                'bound_codes': array('H', self._bounds.keys()),
+                'bound_starts': array('q', [start for (start, _) in self._bounds.values()]),
+                'bound_ends': array('q', [end for (_, end) in self._bounds.values()])}
+
+    def __len__(self) -> int:
+        """Return the amount of rows in the table"""
+        return len(self.years)
+
+    def countries(self) -> set:
+        """Return the set of countries that have at least one row in the table"""
+        return {self.names[code] for code in self._bounds}
+
+    def dates(self) -> List[datetime.date]:
+        """Return the date of every row in datetime.date format, with every day being the 1st"""
+        return [datetime.date(year, month, 1) for year, month in zip(self.years, self.months)]
+
+    def temperature_list(self) -> List[Optional[float]]:
+        """Return the temperature of every row, with None where the temperature is missing"""
+        return [None if math.isnan(temperature) else temperature for temperature in self.temperatures]
+
+    def select(self, nation: Optional[str] = None, start_year: Optional[int] = None,
+               end_year: Optional[int] = None) -> 'CountryTemperatureTable':
+        """Return the rows of the given nation from start_year to end_year (both included) as a new table.
+        The new table shares its memory with this table, so nothing is copied.
+        If nation is None, every country is kept. The years must be given with a nation
+        Representative Invariants:
+            - nation is not None or (start_year is None and end_year is None)"""
+        if nation is None:
+            return self._view(0, len(self), self._bounds)
+        start, end = self._country_bounds(nation)
+        if start_year is not None:
+            start = bisect_left(self.years, start_year, start, end)
+        if end_year is not None:
+            end = bisect_right(self.years, end_year, start, end)
+        return self._view(start, end, {self._codes[nation]: (0, end - start)} if end > start else {})
+
+    def _country_bounds(self, nation: str) -> Tuple[int, int]:
+        """Return the first and one past the last row of the given nation. Both are 0 if there is no
+        such nation in the table"""
+        if nation not in self._codes:
+            return (0, 0)
+        return self._bounds.get(self._codes[nation], (0, 0))
+
+    def _view(self, start: int, end: int, bounds: Dict[int, Tuple[int, int]]) -> 'CountryTemperatureTable':
+        """Return the rows start to end as a table that shares its memory with this table, where bounds maps
+        the code of every country in those rows to its first and one past its last row among them"""
+        view = CountryTemperatureTable.__new__(CountryTemperatureTable)
+        view.years = self.years[start:end]
+        view.months = self.months[start:end]
+        view.temperatures = self.temperatures[start:end]
+        view.codes = self.codes[start:end]
+        view.names = self.names
+        view._codes = self._codes
+        view._bounds = bounds
+        return view
+
+
+def _is_grouped(years: Sequence[int], months: Sequence[int], codes: Sequence[int]) -> bool:
+    """Return whether the rows of every country are next to each other and sorted by date"""
+    seen = set()
+    for i in range(len(codes)):
+        if i == 0 or codes[i] != codes[i - 1]:
+            if codes[i] in seen:
+                return False
+            seen.add(codes[i])
+        elif (years[i], months[i]) < (years[i - 1], months[i - 1]):
+            return False
+    return True
+
+
+def _index_countries(codes: Sequence[int]) -> Dict[int, Tuple[int, int]]:
+    """Return a mapping of every code in codes to its first and one past its last position, where the
+    positions of the same code are next to each other"""
+    bounds = {}
+    start = 0
+    for i in range(1, len(codes) + 1):
+        if i == len(codes) or codes[i] != codes[start]:
+            bounds[codes[start]] = (start, i)
+            start = i
+    return bounds
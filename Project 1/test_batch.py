@@ -0,0 +1,80 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that the batch runner writes the graphs of main.py into files without opening a browser,
+only loading the datasets those graphs use, and that a graph is chosen by its step, name or alias.
+
+Run it with
+    python -m pytest test_batch.py"""
+
+import json
+import os
+
+import pytest
+
+import batch
+import benchmark
+import render
+
+
+@pytest.fixture
+def synthetic(tmp_path, monkeypatch) -> str:
+    """Write the synthetic datasets of benchmark into a temporary folder, work from there and return its path"""
+    benchmark.write_datasets(str(tmp_path), 1)
+    monkeypatch.chdir(tmp_path)
+    return str(tmp_path)
+
+
+def test_graphs_are_described() -> None:
+    """Test that every graph has its own name and alias, a step of main.py and datasets that can be loaded"""
+    all_graphs = batch.graphs()
+    assert len({graph.name for graph in all_graphs}) == len({graph.alias for graph in all_graphs}) == len(all_graphs)
+    assert {graph.step for graph in all_graphs} == set(range(2, 10))
+    assert all(set(graph.datasets) <= set(batch.LOADERS) for graph in all_graphs)
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_render_all_writes_files(synthetic, monkeypatch, workers) -> None:
+    """Test that the graphs of the chosen steps are written into files, whatever the amount of workers, without
+    being shown and without loading the datasets the other steps use"""
+    monkeypatch.setattr(render, 'default_target', render.RenderTarget('show'))
+    datasets = batch.load_datasets()
+    written = batch.render_all(os.path.join(synthetic, 'out'), 'json', workers, [3], datasets)
+    expected = [graph for graph in batch.graphs() if graph.step == 3]
+    assert sorted(os.path.basename(path) for path in written) == \
+        sorted('step3_' + graph.name + '.json' for graph in expected)
+    for path in written:
+        with open(path) as file:
+            assert json.load(file)['data'] != []
+    assert datasets.loaded() == {name for graph in expected for name in graph.datasets}
+
+
+@pytest.mark.parametrize('choices, expected', [(['3'], ['global_graph_year', 'global_co2_year',
+                                                        'global_co2_vs_temperature']),
+                                               (['global-co2'], ['global_co2_year']),
+                                               (['ranking_comparison'], ['ranking_comparison']),
+                                               (['ranking-comparison'], ['ranking_comparison']),
+                                               (['pollution'], ['percentage_of_pollution']),
+                                               (['country-co2', '4'], ['co2_gdp_ranking', 'co2_emission']),
+                                               (['global-co2', '3'], ['global_graph_year', 'global_co2_year',
+                                                                      'global_co2_vs_temperature'])])
+def test_select(choices, expected) -> None:
+    """Test that a graph is chosen by its step, name, alias or the start of either, in the order of main.py and
+    only once"""
+    assert [graph.name for graph in batch.select(batch.graphs(), choices)] == expected
+
+
+@pytest.mark.parametrize('choice', ['smoothed', 'global', '10', 'nothing'])
+def test_select_rejects(choice) -> None:
+    """Test that a choice that starts the names of many graphs, or of none, is rejected"""
+    with pytest.raises(ValueError):
+        batch.select(batch.graphs(), [choice])
@@ -0,0 +1,208 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that appending a new release of the CO2 emission to a dataset gives the same dataset,
+index, store and results as reading every row at once.
+
+Run it with
+    python -m pytest test_co2_store.py"""
+
+import datetime
+import gc
+import math
+import statistics
+from typing import List, Tuple
+
+import pytest
+
+import co2_store
+import converting_data
+import country_index
+import helper_functions
+import memo
+from records import CO2Emission, RecordList
+
+# The country, year and emission of every row of the first release, in the order of a UNdata_Export file
+FIRST_RELEASE = [('Australia', year, 400000.1 + year * 0.7) for year in range(2015, 1989, -1)] + \
+    [('United States of America', year, 5000000.3 - year * 1.1) for year in range(2015, 1989, -1)] + \
+    [('Canada', year, 550000.7 + (year % 7) * 0.3) for year in range(2014, 1994, -1)]
+
+# The rows of a later release: newer years, a country that is new, a year filled in and rows already known
+SECOND_RELEASE = [('Australia', 2017, 417041.277910766), ('Australia', 2016, 413157.391667875),
+                  ('Australia', 2015, 1.0), ('United States of America', 2016, 4000000.5),
+                  ('Canada', 1990, 1.5), ('Canada', 2015, 560000.25), ('Norway', 2016, 50000.125),
+                  ('Norway', 2017, 49000.5)]
+
+Release = List[Tuple[str, int, float]]
+
+
+def write_release(path: str, rows: Release) -> None:
+    """Write rows into the file path as a UNdata_Export csv file"""
+    with open(path, 'w') as file:
+        file.write('"Country or Area","Year","Value"\n')
+        for (country, year, emission) in rows:
+            file.write('"%s","%d","%r"\n' % (country, year, emission))
+
+
+def write_xml_release(path: str, rows: Release) -> None:
+    """Write rows into the file path as a UNdata_Export xml file"""
+    with open(path, 'w') as file:
+        file.write('<ROOT>\n    <data>\n')
+        for (country, year, emission) in rows:
+            file.write('        <record>\n'
+                       '            <field name="Country or Area">%s</field>\n'
+                       '            <field name="Year">%d</field>\n'
+                       '            <field name="Value">%r</field>\n'
+                       '        </record>\n' % (country, year, emission))
+        file.write('    </data>\n</ROOT>\n')
+
+
+def read(path: str) -> RecordList:
+    """Return every row of the UNdata_Export csv file path, as co2_emission_convert returns it"""
+    columns = converting_data._co2_emission_columns(converting_data.iter_co2_emission(path))
+    return converting_data._co2_emission_rows(columns)
+
+
+def rows_of(data: List[CO2Emission]) -> List[tuple]:
+    """Return the country, year and emission of every row of data, sorted"""
+    return sorted((row.country, row.year, row.emission) for row in data)
+
+
+def assert_same_store(store: co2_store.CO2Store, expected: co2_store.CO2Store) -> None:
+    """Assert that store has the same rows as expected and computes the same totals and average increases"""
+    assert store.years == expected.years
+    assert store.emissions == expected.emissions
+    assert store.increases == expected.increases
+    for country in expected.years:
+        for year in range(1985, 2019):
+            assert store.total_since(country, year) == expected.total_since(country, year)
+            assert store.increases_between(country, year, 2018) == expected.increases_between(country, year, 2018)
+            try:
+                average = expected.average_increase_since(country, year)
+            except statistics.StatisticsError:
+                with pytest.raises(statistics.StatisticsError):
+                    store.average_increase_since(country, year)
+            else:
+                assert store.average_increase_since(country, year) == average
+
+
+def known_rows(release: Release) -> Release:
+    """Return the rows of release for a country and year that FIRST_RELEASE does not have, keeping the first row
+    of every country and year"""
+    seen = {(country, year) for (country, year, _) in FIRST_RELEASE}
+    new_rows = []
+    for (country, year, emission) in release:
+        if (country, year) not in seen:
+            seen.add((country, year))
+            new_rows.append((country, year, emission))
+    return new_rows
+
+
+@pytest.mark.parametrize('file_format', ['csv', 'xml'])
+def test_append_matches_full_read(tmp_path, file_format) -> None:
+    """Test that appending a release gives the rows, index and store of reading both releases at once, even
+    after totals and averages were asked for before the release was appended"""
+    write_release(str(tmp_path / 'first.csv'), FIRST_RELEASE)
+    data = read(str(tmp_path / 'first.csv'))
+    store = co2_store.store_of(data)
+    for country in store.years:
+        for year in (1989, 1995, 2010, 2015):
+            store.total_since(country, year)
+            try:
+                store.average_increase_since(country, year)
+            except statistics.StatisticsError:
+                pass
+    path = str(tmp_path / ('second.' + file_format))
+    if file_format == 'xml':
+        write_xml_release(path, SECOND_RELEASE)
+    else:
+        write_release(path, SECOND_RELEASE)
+
+    appended = converting_data.append_co2_emission(data, path)
+
+    write_release(str(tmp_path / 'both.csv'), FIRST_RELEASE + known_rows(SECOND_RELEASE))
+    expected = read(str(tmp_path / 'both.csv'))
+    assert appended == len(known_rows(SECOND_RELEASE))
+    assert rows_of(data) == rows_of(expected)
+    assert co2_store.store_of(data) is store
+    assert_same_store(store, co2_store.CO2Store(expected))
+    index = country_index.index_of(data)
+    assert {country: [(row.year, row.emission) for row in rows] for (country, rows) in index.rows.items()} == \
+        {country: [(row.year, row.emission) for row in rows]
+         for (country, rows) in country_index.CountryIndex(expected).rows.items()}
+
+
+def test_append_start_year(tmp_path) -> None:
+    """Test that only the rows of a release from start_year on are appended"""
+    write_release(str(tmp_path / 'first.csv'), FIRST_RELEASE)
+    write_release(str(tmp_path / 'second.csv'), SECOND_RELEASE)
+    data = read(str(tmp_path / 'first.csv'))
+    appended = converting_data.append_co2_emission(data, str(tmp_path / 'second.csv'), start_year=2017)
+    assert appended == 2
+    assert [(row.country, row.year) for row in data[-2:]] == [('Australia', 2017), ('Norway', 2017)]
+
+
+def test_append_again_adds_nothing(tmp_path) -> None:
+    """Test that appending the same release twice only adds its rows once"""
+    write_release(str(tmp_path / 'first.csv'), FIRST_RELEASE)
+    data = read(str(tmp_path / 'first.csv'))
+    assert converting_data.append_co2_emission(data, str(tmp_path / 'first.csv')) == 0
+    assert len(data) == len(FIRST_RELEASE)
+
+
+def test_append_renames_countries(tmp_path) -> None:
+    """Test that the countries of an appended release are renamed like the rows of co2_emission_convert"""
+    write_release(str(tmp_path / 'first.csv'), FIRST_RELEASE)
+    write_release(str(tmp_path / 'second.csv'), SECOND_RELEASE)
+    data = read(str(tmp_path / 'first.csv'))
+    converting_data.append_co2_emission(data, str(tmp_path / 'second.csv'))
+    assert 'United States of America' not in co2_store.store_of(data).years
+    assert co2_store.store_of(data).years['United States'][-1] == 2016
+
+
+def test_append_forgets_remembered_results(tmp_path) -> None:
+    """Test that the results remembered for a registered dataset are not used once a release is appended"""
+    write_release(str(tmp_path / 'first.csv'), FIRST_RELEASE)
+    write_release(str(tmp_path / 'second.csv'), SECOND_RELEASE)
+    data = read(str(tmp_path / 'first.csv'))
+    memo.register(data)
+    before = helper_functions.co2_ranking(data, {'Australia', 'Norway'}, 2000)
+    converting_data.append_co2_emission(data, str(tmp_path / 'second.csv'))
+    after = helper_functions.co2_ranking(data, {'Australia', 'Norway'}, 2000)
+    write_release(str(tmp_path / 'both.csv'), FIRST_RELEASE + known_rows(SECOND_RELEASE))
+    assert set(before) == {'Australia'}
+    assert after == helper_functions.co2_ranking(read(str(tmp_path / 'both.csv')), {'Australia', 'Norway'}, 2000)
+    assert set(after) == {'Australia', 'Norway'}
+
+
+def test_total_does_not_depend_on_order() -> None:
+    """Test that a total is the same whatever the order the rows were added in"""
+    emissions = [0.1, 1e16, 0.3, -1e16, 0.7, 2.5e-3, 3.3]
+    forwards = co2_store.CO2Store(RecordList())
+    backwards = co2_store.CO2Store(RecordList())
+    for year in range(len(emissions)):
+        forwards.add(CO2Emission(datetime.date(2000 + year, 1, 1), emissions[year], 'Tuvalu'))
+    for year in reversed(range(len(emissions))):
+        backwards.add(CO2Emission(datetime.date(2000 + year, 1, 1), emissions[year], 'Tuvalu'))
+    assert forwards.total_since('Tuvalu', 2000) == backwards.total_since('Tuvalu', 2000) == math.fsum(emissions)
+
+
+def test_store_is_dropped_with_its_dataset(tmp_path) -> None:
+    """Test that the store and the index of a dataset do not keep it alive"""
+    write_release(str(tmp_path / 'first.csv'), FIRST_RELEASE)
+    data = read(str(tmp_path / 'first.csv'))
+    co2_store.store_of(data)
+    identity = id(data)
+    del data
+    gc.collect()
+    assert identity not in co2_store._stores
+    assert identity not in country_index._indexes
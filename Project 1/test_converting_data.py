@@ -0,0 +1,276 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that the fast readers of converting_data return the same rows as the readers that go
+through a file one row at a time, and that the xml form of UNdata_Export is read into the same rows as its csv
+form.
+
+Run it with
+    python -m pytest test_converting_data.py"""
+
+import csv
+import math
+import os
+from typing import List, Optional, Tuple
+
+from xml.sax.saxutils import escape
+
+import pytest
+
+import converting_data
+from records import RecordList
+
+COUNTRY_HEADER = 'dt,AverageTemperature,AverageTemperatureUncertainty,Country'
+GLOBAL_HEADER = ('dt,LandAverageTemperature,LandAverageTemperatureUncertainty,LandMaxTemperature,'
+                 'LandMaxTemperatureUncertainty,LandMinTemperature,LandMinTemperatureUncertainty,'
+                 'LandAndOceanAverageTemperature,LandAndOceanAverageTemperatureUncertainty')
+
+# Every country is written as it is in the csv file, with quotes around a name that has a comma
+COUNTRIES = ['Albania', '"Korea, South"', 'Åland', "Côte D'Ivoire", '"Bonaire, Saint Eustatius And Saba"',
+             'São Tomé And Príncipe']
+
+# The bounds of the years read by every test, where None reads every year
+YEARS = [(None, None), (1900, None), (None, 1900), (1900, 1901), (1901, 1901), (1950, None)]
+
+# How many bytes are read at once, from less than a row to more than the whole file
+CHUNK_SIZES = [1, 7, 64, 333, converting_data.CHUNK_SIZE]
+
+# The country, year and emission of every row of a small UNdata_Export file, with names that have a comma, an
+# ampersand or accents and an emission written with an exponent
+CO2_ROWS = [(country, year, round(1000 * number + year * 0.37, 3))
+            for (number, country) in enumerate(['Australia', 'Korea, Republic of', "Côte d'Ivoire",
+                                                'Trinidad & Tobago', 'United States of America'])
+            for year in range(2017, 1989, -1)] + [('Tuvalu', 1995, 1.5e-05)]
+
+# The bounds of the years and the countries read by the tests of the xml reader, where None reads all of them
+CO2_FILTERS = [(None, None, None), (2000, None, None), (None, 1999, None), (2005, 2005, None),
+               (None, None, {'Korea, Republic of', 'Trinidad & Tobago'}), (1995, 2010, {'Tuvalu', 'Australia'})]
+
+Row = Tuple[int, int, Optional[float], Optional[str]]
+
+
+def country_lines() -> List[str]:
+    """Return the rows of a small GlobalLandTemperaturesByCountry.csv. Every country has its own months, some
+    of them missing a temperature or skipping a month"""
+    lines = []
+    for (number, country) in enumerate(COUNTRIES):
+        dates = [(year, month) for year in range(1898, 1903) for month in range(1, 13)][number * 5:]
+        if number % 2 == 1:
+            dates = dates[:7] + dates[9:]
+        for (i, (year, month)) in enumerate(dates):
+            temperature = '' if i % 11 == 3 else repr(round(-5 + number + i * 0.37, 3))
+            lines.append('%04d-%02d-01,%s,0.5,%s' % (year, month, temperature, country))
+    return lines
+
+
+def global_lines() -> List[str]:
+    """Return the rows of a small GlobalTemperatures.csv, some of them missing a temperature"""
+    return ['%04d-%02d-01,%s,0.3,,,,,,' % (year, month, '' if month == 4 else repr(year / 100 + month * 0.1))
+            for year in range(1898, 1903) for month in range(1, 13)]
+
+
+def write(path: str, header: str, lines: List[str], newline: str, last_newline: bool = True) -> None:
+    """Write header and lines into the file path in utf-8, ending every line with newline"""
+    text = newline.join([header] + lines) + (newline if last_newline else '')
+    with open(path, 'wb') as file:
+        file.write(text.encode('utf-8'))
+
+
+def write_co2(directory: str, rows: List[Tuple[str, int, float]]) -> Tuple[str, str]:
+    """Write rows into directory as a UNdata_Export csv file and as its xml form, and return the paths of the csv
+    and the xml file"""
+    csv_path = os.path.join(directory, 'co2.csv')
+    xml_path = os.path.join(directory, 'co2.xml')
+    with open(csv_path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file, quoting=csv.QUOTE_ALL)
+        writer.writerow(['Country or Area', 'Year', 'Value'])
+        writer.writerows([(country, year, repr(emission)) for (country, year, emission) in rows])
+    with open(xml_path, 'w', encoding='utf-8') as file:
+        file.write('<?xml version="1.0" encoding="utf-8"?>\n<ROOT>\n    <data>\n')
+        for (country, year, emission) in rows:
+            file.write('        <record>\n'
+                       '            <field name="Country or Area">%s</field>\n'
+                       '            <field name="Year">%d</field>\n'
+                       '            <field name="Value">%r</field>\n'
+                       '        </record>\n' % (escape(country), year, emission))
+        file.write('    </data>\n</ROOT>\n')
+    return (csv_path, xml_path)
+
+
+def co2_rows(data: list) -> List[tuple]:
+    """Return the date, emission and country of every row of data, in order"""
+    return [(row.date, row.emission, row.country) for row in data]
+
+
+def from_columns(columns: dict) -> List[Row]:
+    """Return the year, month, temperature and country of every row of columns read by
+    read_temperature_columns, with None for a missing temperature"""
+    countries = [None] * len(columns['years'])
+    if 'codes' in columns:
+        countries = [columns['names'][code] for code in columns['codes']]
+    return [(year, month, None if math.isnan(temperature) else temperature, country)
+            for (year, month, temperature, country)
+            in zip(columns['years'], columns['months'], columns['temperatures'], countries)]
+
+
+def by_country(row: Row) -> tuple:
+    """Return the country, year and month of row, which order the rows of a table"""
+    return (row[3], row[0], row[1])
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+@pytest.mark.parametrize('start_year, end_year', YEARS)
+def test_country_columns_match_rows(tmp_path, monkeypatch, newline, chunk_size, start_year, end_year) -> None:
+    """Test that the chunked reader returns the rows of the row reader for every country, including names with
+    commas or accents, whatever the line endings and wherever the chunks are cut"""
+    path = str(tmp_path / 'countries.csv')
+    write(path, COUNTRY_HEADER, country_lines(), newline)
+    monkeypatch.setattr(converting_data, 'CHUNK_SIZE', chunk_size)
+    columns = converting_data.read_temperature_columns(path, start_year, end_year, with_country=True)
+    expected = [(row.year, row.month, row.temperature, row.country)
+                for row in converting_data.iter_country_temperatures(path, start_year, end_year)]
+    assert from_columns(columns) == expected
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+@pytest.mark.parametrize('start_year, end_year', YEARS)
+def test_global_columns_match_rows(tmp_path, monkeypatch, newline, chunk_size, start_year, end_year) -> None:
+    """Test that the chunked reader returns the rows of the row reader for the temperature of the world"""
+    path = str(tmp_path / 'global.csv')
+    write(path, GLOBAL_HEADER, global_lines(), newline)
+    monkeypatch.setattr(converting_data, 'CHUNK_SIZE', chunk_size)
+    columns = converting_data.read_temperature_columns(path, start_year, end_year)
+    expected = [(row.year, row.month, row.temperature, None)
+                for row in converting_data.iter_global_temperatures(path, start_year, end_year)]
+    assert from_columns(columns) == expected
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+@pytest.mark.parametrize('chunk_size', [7, converting_data.CHUNK_SIZE])
+def test_last_line_without_newline(tmp_path, monkeypatch, newline, chunk_size) -> None:
+    """Test that the last row is read even if the file does not end with a newline"""
+    path = str(tmp_path / 'countries.csv')
+    write(path, COUNTRY_HEADER, country_lines(), newline, last_newline=False)
+    monkeypatch.setattr(converting_data, 'CHUNK_SIZE', chunk_size)
+    columns = converting_data.read_temperature_columns(path, with_country=True)
+    expected = [(row.year, row.month, row.temperature, row.country)
+                for row in converting_data.iter_country_temperatures(path)]
+    assert from_columns(columns) == expected
+
+
+def test_chunks_end_with_whole_lines(tmp_path, monkeypatch) -> None:
+    """Test that every chunk ends with a whole line ending with a line feed only, and that the chunks add up to
+    the file"""
+    path = str(tmp_path / 'countries.csv')
+    write(path, COUNTRY_HEADER, country_lines(), '\r\n')
+    monkeypatch.setattr(converting_data, 'CHUNK_SIZE', 50)
+    with open(path, 'rb') as file:
+        file.readline()
+        chunks = list(converting_data._chunks(file))
+    assert all(chunk.endswith(b'\n') and b'\r' not in chunk for chunk in chunks)
+    assert b''.join(chunks).decode('utf-8') == '\n'.join(country_lines()) + '\n'
+
+
+def test_country_block_ends_with_its_country() -> None:
+    """Test that the block of a country ends right after its last row, even if its name has a comma"""
+    lines = [line for line in country_lines() if line.endswith(('"Korea, South"', 'Åland'))]
+    data = ('\n'.join(lines) + '\n').encode('utf-8')
+    (country, end) = converting_data._country_block(data, 0)
+    assert country == '"Korea, South"'.encode('utf-8')
+    assert data[:end].decode('utf-8') == '\n'.join(line for line in lines if 'Korea' in line) + '\n'
+    assert converting_data._decode_field(country) == 'Korea, South'
+
+
+@pytest.mark.parametrize('chunk_size', [7, converting_data.CHUNK_SIZE])
+def test_countries_apart_are_read(tmp_path, monkeypatch, chunk_size) -> None:
+    """Test that the table of a file where the rows of a country are not together has the rows of the row
+    reader, whether the chunked reader reads them or falls back to the row reader"""
+    lines = country_lines()
+    write(str(tmp_path / 'countries.csv'), COUNTRY_HEADER, lines[-30:] + lines[:-30], '\n')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(converting_data, 'COUNTRY_TEMPERATURE_FILE', 'countries.csv')
+    monkeypatch.setattr(converting_data, 'CHUNK_SIZE', chunk_size)
+    columns = converting_data._parse_country_temperatures()
+    expected = [(row.year, row.month, row.temperature, row.country)
+                for row in converting_data.iter_country_temperatures('countries.csv', 1900)]
+    assert sorted(from_columns(columns), key=by_country) == sorted(expected, key=by_country)
+
+
+@pytest.mark.parametrize('start_year, end_year, countries', CO2_FILTERS)
+def test_co2_xml_rows_match_csv(tmp_path, start_year, end_year, countries) -> None:
+    """Test that the xml reader yields the rows of the csv reader in the same order, for any years and
+    countries"""
+    (csv_path, xml_path) = write_co2(str(tmp_path), CO2_ROWS)
+    expected = co2_rows(converting_data.iter_co2_emission(csv_path, start_year, end_year, countries))
+    assert co2_rows(converting_data.iter_co2_emission_xml(xml_path, start_year, end_year, countries)) == expected
+    assert expected != []
+
+
+def test_co2_xml_convert_matches_csv(tmp_path, monkeypatch) -> None:
+    """Test that co2_emission_convert_xml returns the rows of co2_emission_convert, both when the files are read
+    and when they come from the cache"""
+    monkeypatch.chdir(tmp_path)
+    (csv_path, xml_path) = write_co2(str(tmp_path), CO2_ROWS)
+    monkeypatch.setattr(converting_data, 'CO2_EMISSION_FILE', csv_path)
+    for _ in range(2):
+        expected = co2_rows(converting_data.co2_emission_convert())
+        assert co2_rows(converting_data.co2_emission_convert_xml(xml_path)) == expected
+    assert len(expected) == len(CO2_ROWS)
+    assert ('United States' in {country for (_, _, country) in expected}
+            and 'United States of America' not in {country for (_, _, country) in expected})
+
+
+def test_co2_xml_append_matches_csv(tmp_path) -> None:
+    """Test that appending the xml form of a release adds the rows of appending its csv form"""
+    (csv_path, xml_path) = write_co2(str(tmp_path), CO2_ROWS)
+    (from_csv, from_xml) = (RecordList(), RecordList())
+    assert converting_data.append_co2_emission(from_csv, csv_path, 2000) == \
+        converting_data.append_co2_emission(from_xml, xml_path, 2000) > 0
+    assert co2_rows(from_xml) == co2_rows(from_csv)
+
+
+def test_co2_xml_export_matches_csv() -> None:
+    """Test that the xml and csv exports of UNdata_Export in the project have the same rows"""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    expected = co2_rows(converting_data.iter_co2_emission(os.path.join(directory, converting_data.CO2_EMISSION_FILE)))
+    assert co2_rows(converting_data.iter_co2_emission_xml(
+        os.path.join(directory, converting_data.CO2_EMISSION_XML_FILE))) == expected
+
+
+@pytest.mark.parametrize('start_year, end_year', YEARS)
+def test_unsorted_rows_are_filtered(tmp_path, start_year, end_year) -> None:
+    """Test that the rows of a country that are not sorted by date are still filtered by year like the row
+    reader filters them"""
+    lines = country_lines()
+    write(str(tmp_path / 'countries.csv'), COUNTRY_HEADER, lines[:40][::-1] + lines[40:], '\n')
+    columns = converting_data.read_temperature_columns(str(tmp_path / 'countries.csv'), start_year, end_year,
+                                                       with_country=True)
+    expected = [(row.year, row.month, row.temperature, row.country) for row
+                in converting_data.iter_country_temperatures(str(tmp_path / 'countries.csv'), start_year, end_year)]
+    assert sorted(from_columns(columns), key=by_country) == sorted(expected, key=by_country)
+
+
+@pytest.mark.parametrize('with_country', [False, True])
+def test_day_other_than_first_is_rejected(tmp_path, with_country) -> None:
+    """Test that the chunked reader rejects a date that is not the first day of a month"""
+    if with_country:
+        lines = country_lines()
+        header = COUNTRY_HEADER
+    else:
+        lines = global_lines()
+        header = GLOBAL_HEADER
+    lines[3] = lines[3][:8] + '15' + lines[3][10:]
+    write(str(tmp_path / 'temperatures.csv'), header, lines, '\n')
+    with pytest.raises(ValueError):
+        converting_data.read_temperature_columns(str(tmp_path / 'temperatures.csv'), with_country=with_country)
@@ -0,0 +1,79 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that the country index of a dataset returns the rows that scanning every row of the
+dataset returns.
+
+Run it with
+    python -m pytest test_country_index.py"""
+
+import datetime
+from typing import List, Optional
+
+import pytest
+
+import country_index
+from records import CO2Emission, RecordList
+
+COUNTRIES = ['Australia', 'Canada', 'Norway']
+
+
+def rows() -> RecordList:
+    """Return the CO2 emission of every country from 1990 to 2017, newest first as in a UNdata_Export file"""
+    return RecordList(CO2Emission(datetime.date(year, 1, 1), number * 1000.0 + year, country)
+                      for (number, country) in enumerate(COUNTRIES) for year in range(2017, 1989, -1))
+
+
+def scanned(data: List[CO2Emission], nation: str, start_year: Optional[int],
+            end_year: Optional[int]) -> List[CO2Emission]:
+    """Return the rows of nation from start_year to end_year by going through every row, sorted by date"""
+    return sorted((row for row in data if row.country == nation and (start_year is None or row.year >= start_year)
+                   and (end_year is None or row.year <= end_year)), key=lambda row: row.date)
+
+
+@pytest.mark.parametrize('nation', COUNTRIES + ['Chad'])
+@pytest.mark.parametrize('start_year, end_year', [(None, None), (2000, None), (None, 2000), (1995, 2005),
+                                                  (2017, 2017), (2020, None)])
+def test_select_matches_scan(nation, start_year, end_year) -> None:
+    """Test that select returns the rows of a scan through the dataset"""
+    data = rows()
+    assert country_index.CountryIndex(data).select(nation, start_year, end_year) == \
+        scanned(data, nation, start_year, end_year)
+
+
+def test_add_keeps_rows_sorted() -> None:
+    """Test that a row added for a year already in the index, or a new country, keeps the rows sorted by date"""
+    data = rows()
+    index = country_index.CountryIndex(data)
+    added = [CO2Emission(datetime.date(2018, 1, 1), 5.0, 'Canada'),
+             CO2Emission(datetime.date(1989, 1, 1), 6.0, 'Canada'),
+             CO2Emission(datetime.date(2000, 1, 1), 7.0, 'Chad')]
+    for row in added:
+        index.add(row)
+    for nation in COUNTRIES + ['Chad']:
+        assert index.select(nation) == scanned(data + added, nation, None, None)
+
+
+def test_index_is_kept_for_its_list() -> None:
+    """Test that index_of builds the index of a dataset once, and again after it is forgotten"""
+    data = rows()
+    index = country_index.index_of(data)
+    assert country_index.index_of(data) is index
+    country_index.forget(data)
+    assert country_index.index_of(data) is not index
+
+
+def test_plain_list_is_indexed() -> None:
+    """Test that a list that can not be weakly referenced is still indexed, every time it is asked for"""
+    data = list(rows())
+    assert country_index.index_of(data).select('Norway', 2017) == scanned(data, 'Norway', 2017, None)
+    assert country_index.index_of(data) is not country_index.index_of(data)
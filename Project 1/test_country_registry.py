@@ -0,0 +1,72 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that the country registry gives a country the same name and number whichever dataset
+it comes from.
+
+Run it with
+    python -m pytest test_country_registry.py"""
+
+import threading
+
+import pytest
+
+import country_registry
+
+
+@pytest.mark.parametrize('name, kept', [('United States of America', 'United States'),
+                                        ('Korea, Rep.', 'South Korea'), ('Republic of Korea', 'South Korea'),
+                                        ('South Korea', 'South Korea'), ('Canada', 'Canada')])
+def test_canonical_name(name, kept) -> None:
+    """Test that the UN, World Bank and Berkeley Earth names of a country are all kept as its Berkeley Earth
+    name, and that a name without an alias is kept as it is"""
+    assert country_registry.canonical_name(name) == kept
+
+
+def test_aliases_share_a_number() -> None:
+    """Test that every alias has the number of the name that is kept for it"""
+    registry = country_registry.CountryRegistry(country_registry.ALIASES)
+    for (alias, kept) in country_registry.ALIASES.items():
+        assert registry.id_of(alias) == registry.id_of(kept)
+        assert registry.names[registry.id_of(kept)] == kept
+    assert all(registry.names[registry.ids[name]] == name for name in registry.names)
+
+
+def test_in_all_matches_names_of_every_dataset() -> None:
+    """Test that in_all finds the countries in every group, whichever way each group writes them"""
+    temperature = {'United States', 'South Korea', 'Vietnam', 'France'}
+    co2 = {'United States of America', 'Republic of Korea', 'Viet Nam', 'Germany'}
+    gdp = {'United States', 'Korea, Rep.', 'Germany', 'France'}
+    assert country_registry.in_all(temperature, co2) == {'United States', 'South Korea', 'Vietnam'}
+    assert country_registry.in_all(temperature, co2, gdp) == {'United States', 'South Korea'}
+    assert country_registry.in_all(co2) == {'United States', 'South Korea', 'Vietnam', 'Germany'}
+
+
+def test_new_name_gets_one_number_across_threads() -> None:
+    """Test that a name first seen by many threads at once is given a single number"""
+    registry = country_registry.CountryRegistry({})
+    names = ['Country ' + str(i) for i in range(200)]
+    barrier = threading.Barrier(8)
+
+    def register() -> None:
+        """Give every one of names a number once every thread is ready"""
+        barrier.wait()
+        for name in names:
+            registry.id_of(name)
+
+    threads = [threading.Thread(target=register) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert registry.names == names
+    assert [registry.id_of(name) for name in names] == list(range(len(names)))
@@ -0,0 +1,137 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that data_cache returns the columns it stored for a file, and parses the file again
+whenever the file has changed or its cache file is not valid.
+
+Run it with
+    python -m pytest test_data_cache.py"""
+
+import os
+from array import array
+from typing import Callable, Dict, List
+
+import pytest
+
+import data_cache
+
+# The columns parsed from the source file
+COLUMNS = {'year': array('h', [1990, 1991, 1992]), 'emission': array('d', [1.5, -2.25, 3e10]),
+           'country': ['Canada', 'Côte d\'Ivoire', '']}
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch) -> None:
+    """Keep the cache folder of every test in its own temporary folder"""
+    monkeypatch.chdir(tmp_path)
+
+
+def write_source(text: str = 'country,year,emission\n') -> str:
+    """Write text into the source file and return its path"""
+    with open('source.csv', 'w') as file:
+        file.write(text)
+    return 'source.csv'
+
+
+def parser(calls: List[str]) -> Callable[[], Dict[str, data_cache.Column]]:
+    """Return a parser of the source file that returns COLUMNS and records every call in calls"""
+    def parse() -> Dict[str, data_cache.Column]:
+        """Return a copy of COLUMNS"""
+        calls.append('parse')
+        return {name: column[:] for (name, column) in COLUMNS.items()}
+    return parse
+
+
+def as_lists(columns: Dict[str, data_cache.Column]) -> Dict[str, list]:
+    """Return every column of columns as a list"""
+    return {name: list(column) for (name, column) in columns.items()}
+
+
+def cache_file(source: str) -> str:
+    """Return the path of the one cache file of source"""
+    path = data_cache._cache_path(source)
+    assert os.path.exists(path)
+    return path
+
+
+def test_hit_returns_stored_columns() -> None:
+    """Test that the second read of an unchanged file returns the same columns without parsing it"""
+    calls = []
+    source = write_source()
+    first = data_cache.cached(source, parser(calls))
+    second = data_cache.cached(source, parser(calls))
+    assert calls == ['parse']
+    assert as_lists(first) == as_lists(second) == as_lists(COLUMNS)
+    assert second['year'].format == 'h' and second['emission'].format == 'd'
+
+
+def test_changed_source_is_a_miss() -> None:
+    """Test that a source file changed since it was cached is parsed again"""
+    calls = []
+    source = write_source()
+    data_cache.cached(source, parser(calls))
+    write_source('country,year,emission\nCanada,1990,1.5\n')
+    assert as_lists(data_cache.cached(source, parser(calls))) == as_lists(COLUMNS)
+    assert calls == ['parse', 'parse']
+    data_cache.cached(source, parser(calls))
+    assert len(calls) == 2
+
+
+def test_other_parser_version_is_a_miss(monkeypatch) -> None:
+    """Test that a cache file written by another version of the parsers is not used"""
+    calls = []
+    source = write_source()
+    data_cache.cached(source, parser(calls))
+    monkeypatch.setattr(data_cache, 'PARSER_VERSION', data_cache.PARSER_VERSION + 1)
+    data_cache.cached(source, parser(calls))
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize('damage', ['empty', 'magic', 'truncated', 'header', 'garbage'])
+def test_corrupt_cache_file_is_a_miss(damage) -> None:
+    """Test that a cache file that is empty, of another format, cut short or overwritten is parsed again and
+    replaced by a valid one"""
+    calls = []
+    source = write_source()
+    data_cache.cached(source, parser(calls))
+    path = cache_file(source)
+    with open(path, 'rb') as file:
+        raw = file.read()
+    if damage == 'empty':
+        raw = b''
+    elif damage == 'magic':
+        raw = b'CSC110CACHE1' + raw[len(data_cache.MAGIC):]
+    elif damage == 'truncated':
+        raw = raw[:-5]
+    elif damage == 'header':
+        raw = raw[:len(data_cache.MAGIC) + 8] + b'[' + raw[len(data_cache.MAGIC) + 9:]
+    else:
+        raw = bytes(range(256)) * 4
+    with open(path, 'wb') as file:
+        file.write(raw)
+
+    assert as_lists(data_cache.cached(source, parser(calls))) == as_lists(COLUMNS)
+    assert len(calls) == 2
+    assert as_lists(data_cache.cached(source, parser(calls))) == as_lists(COLUMNS)
+    assert len(calls) == 2
+
+
+def test_unwritable_cache_still_parses(monkeypatch) -> None:
+    """Test that the columns are still returned when the cache folder can not be created"""
+    calls = []
+    source = write_source()
+    with open('blocked', 'w') as file:
+        file.write('not a folder')
+    monkeypatch.setattr(data_cache, 'CACHE_DIRECTORY', 'blocked')
+    assert as_lists(data_cache.cached(source, parser(calls))) == as_lists(COLUMNS)
+    assert as_lists(data_cache.cached(source, parser(calls))) == as_lists(COLUMNS)
+    assert len(calls) == 2
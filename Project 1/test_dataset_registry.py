@@ -0,0 +1,102 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that the dataset registry only loads a dataset the first time it is used, and only once.
+
+Run it with
+    python -m pytest test_dataset_registry.py"""
+
+import threading
+import time
+from typing import Callable, Dict, List
+
+import pytest
+
+import dataset_registry
+import memo
+from records import RecordList
+
+
+def loaders(calls: List[str]) -> Dict[str, Callable[[], object]]:
+    """Return loaders of two datasets that record every load in calls"""
+    def load_first() -> RecordList:
+        """Return the first dataset, slowly enough for other threads to ask for it at the same time"""
+        calls.append('first')
+        time.sleep(0.05)
+        return RecordList([1, 2, 3])
+
+    def load_second() -> RecordList:
+        """Return the second dataset"""
+        calls.append('second')
+        return RecordList([4])
+    return {'first': load_first, 'second': load_second}
+
+
+# The datasets total was computed for
+totalled = []
+
+
+@memo.memoize
+def total(data: List[int]) -> int:
+    """Return the sum of data"""
+    totalled.append(data)
+    return sum(data)
+
+
+def test_nothing_is_loaded_until_used() -> None:
+    """Test that a dataset is only loaded once it is used, as an attribute or as a key"""
+    calls = []
+    registry = dataset_registry.DatasetRegistry(loaders(calls))
+    assert registry.loaded() == set() and calls == []
+    assert registry.second == [4]
+    assert registry.loaded() == {'second'} and calls == ['second']
+    assert registry['second'] is registry.second
+    assert calls == ['second']
+
+
+def test_unknown_dataset() -> None:
+    """Test that a dataset that does not exist is a KeyError as a key and an AttributeError as an attribute"""
+    registry = dataset_registry.DatasetRegistry(loaders([]))
+    with pytest.raises(KeyError):
+        registry['third']
+    with pytest.raises(AttributeError):
+        registry.third
+    assert not hasattr(registry, '_private')
+
+
+def test_dataset_is_registered() -> None:
+    """Test that a loaded dataset is registered with memo, so the results computed from it are remembered"""
+    totalled.clear()
+    registry = dataset_registry.DatasetRegistry(loaders([]))
+    assert total(registry.first) == total(registry.first) == 6
+    assert len(totalled) == 1
+
+
+def test_loaded_once_across_threads() -> None:
+    """Test that a dataset used by many threads at once is loaded by only one of them"""
+    calls = []
+    registry = dataset_registry.DatasetRegistry(loaders(calls))
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry['first'])) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == ['first']
+    assert all(result is results[0] for result in results) and len(results) == 8
+
+
+def test_default_loaders() -> None:
+    """Test that the registry knows the five datasets of the project without loading any of them"""
+    registry = dataset_registry.DatasetRegistry()
+    assert set(registry.loaders) == {'country_data', 'global_data', 'co2_data', 'gdp_data', 'global_co2'}
+    assert registry.loaded() == set()
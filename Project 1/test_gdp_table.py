@@ -0,0 +1,75 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that the GDP table parses the GDP written in GDP.csv, looks up the ranking and GDP of a
+country, and is never changed once it is made.
+
+Run it with
+    python -m pytest test_gdp_table.py"""
+
+import math
+
+import pytest
+
+from gdp_table import GDPTable, parse_gdp
+
+# The columns of GDP.csv, as they are parsed by converting_data
+COLUMNS = {'rankings': [1, 2, 3, 4, 5], 'gdps': [' 21,427,700 ', ' 14,342,903 ', '5,081,770', '..', ' 1,736,426 '],
+           'countries': ['United States', 'China', 'Japan', 'Somalia', 'Canada']}
+
+
+@pytest.mark.parametrize('gdp, expected', [(' 21,427,700 ', 21427700.0), ('5,081,770', 5081770.0), ('42', 42.0),
+                                           ('0.5', 0.5)])
+def test_parse_gdp(gdp, expected) -> None:
+    """Test that the GDP written with commas and spaces is read as a number"""
+    assert parse_gdp(gdp) == expected
+
+
+@pytest.mark.parametrize('gdp', ['..', '', ' ', 'n/a'])
+def test_parse_missing_gdp(gdp) -> None:
+    """Test that a GDP that is not a number is nan"""
+    assert math.isnan(parse_gdp(gdp))
+
+
+def test_lookup() -> None:
+    """Test that the GDP and ranking of every country are found by its name"""
+    table = GDPTable.from_columns(COLUMNS)
+    assert len(table) == 5
+    assert table.gdp_of('Japan') == 5081770.0
+    assert math.isnan(table.gdp_of('Somalia'))
+    assert table.gdp_of('Atlantis') is None
+    assert dict(table.ranks) == {'United States': 1, 'China': 2, 'Japan': 3, 'Somalia': 4, 'Canada': 5}
+
+
+def test_rerank_keeps_table() -> None:
+    """Test that reranking some countries ranks them from 1 in the same order, skips the countries that are not
+    in the table, and leaves the table as it was"""
+    table = GDPTable.from_columns(COLUMNS)
+    reranked = table.rerank({'Canada', 'China', 'Atlantis'})
+    assert list(reranked.rankings) == [1, 2]
+    assert reranked.countries == ('China', 'Canada')
+    assert list(reranked.gdps) == [14342903.0, 1736426.0]
+    assert dict(reranked.ranks) == {'China': 1, 'Canada': 2}
+    assert list(table.rankings) == [1, 2, 3, 4, 5]
+    assert table.countries == tuple(COLUMNS['countries'])
+    assert table.ranks['Canada'] == 5
+
+
+def test_table_is_read_only() -> None:
+    """Test that the columns and rankings of the table can not be changed"""
+    table = GDPTable.from_columns(COLUMNS)
+    with pytest.raises(TypeError):
+        table.gdps[0] = 0.0
+    with pytest.raises(TypeError):
+        table.rankings[0] = 7
+    with pytest.raises(TypeError):
+        table.ranks['Canada'] = 1
@@ -0,0 +1,159 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that the single-pass yearly aggregator of helper_functions gives the yearly values the
+loops through every row used to give, and that fitting every country at once gives the regression of fitting
+every country by itself.
+
+Run it with
+    python -m pytest test_helper_functions.py"""
+
+import datetime
+import math
+import statistics
+from array import array
+from typing import List, Optional
+
+import pytest
+
+import helper_functions
+import regression
+from records import CO2Emission, CountryTemperature, RecordList
+from temperature_table import CountryTemperatureTable
+
+# The years whose January has no temperature
+MISSING_JANUARY = {1903, 1907}
+
+# The countries fitted by co2_temperature_fits, and the years missing from the CO2 emission of each of them
+FITTED = {'Albania': set(), 'Brazil': {1995, 1996}, 'Chad': {1990, 2005}}
+
+
+def temperature_of(year: int, month: int) -> Optional[float]:
+    """Return the temperature of the synthetic country in month of year, None if it is missing"""
+    if month == 1 and year in MISSING_JANUARY:
+        return None
+    return round(10 + 8 * math.sin(month / 2) + (year - 1900) * 0.03, 3)
+
+
+def table() -> CountryTemperatureTable:
+    """Return a table of the temperature of Tuvalu in every month from 1900 to 1910"""
+    rows = [(year, month, temperature_of(year, month)) for year in range(1900, 1911) for month in range(1, 13)]
+    return CountryTemperatureTable(array('h', [row[0] for row in rows]), array('b', [row[1] for row in rows]),
+                                   array('d', [math.nan if row[2] is None else row[2] for row in rows]),
+                                   array('H', [0] * len(rows)), ['Tuvalu'])
+
+
+def loop_yearly_data(rows: List[CountryTemperature], nation: str, year: int,
+                     end_year: int) -> List[CountryTemperature]:
+    """Return the yearly average temperature of nation the way create_country_yearly_data first computed it,
+    going through every row for every year"""
+    country_only_data = [row for row in rows if row.country == nation]
+    data_so_far = []
+    for i in range(year, end_year):
+        sum_temperature = []
+        for row in country_only_data:
+            if row.date.year == i:
+                sum_temperature.append(row.temperature)
+            elif row.date.year > i:
+                if isinstance(sum_temperature[0], float):
+                    data_so_far.append(CountryTemperature(datetime.date(i, 1, 1), statistics.mean(sum_temperature),
+                                                          nation))
+                break
+    return data_so_far
+
+
+@pytest.mark.parametrize('how, expected', [('mean', [1.5, 5.0]), ('sum', [3.0, 10.0]), ('count', [2, 2]),
+                                           ('min', [1.0, 4.0]), ('max', [2.0, 6.0])])
+def test_yearly_aggregate(how, expected) -> None:
+    """Test that every aggregation combines the values of every year, skipping missing values"""
+    years = [2000, 2000, 2000, 2001, 2001, 2001]
+    values = [1.0, None, 2.0, 4.0, math.nan, 6.0]
+    assert helper_functions.yearly_aggregate(years, values, how) == ([2000, 2001], expected)
+
+
+def test_yearly_aggregate_years() -> None:
+    """Test that only the years from start_year up to but not including end_year are kept"""
+    years = [1999, 2000, 2001, 2002]
+    assert helper_functions.yearly_aggregate(years, [1.0, 2.0, 3.0, 4.0], 'sum', 2000, 2002) == ([2000, 2001],
+                                                                                                [2.0, 3.0])
+
+
+def test_yearly_aggregate_first_required() -> None:
+    """Test that a year whose first row is missing is only left out if first_required is True"""
+    years = [2000, 2000, 2001, 2001]
+    values = [None, 2.0, 3.0, math.nan]
+    assert helper_functions.yearly_aggregate(years, values) == ([2000, 2001], [2.0, 3.0])
+    assert helper_functions.yearly_aggregate(years, values, first_required=True) == ([2001], [3.0])
+
+
+def test_yearly_aggregate_unknown() -> None:
+    """Test that an unknown aggregation is rejected"""
+    with pytest.raises(ValueError):
+        helper_functions.yearly_aggregate([2000], [1.0], 'median')
+
+
+def test_country_yearly_data_matches_loop() -> None:
+    """Test that create_country_yearly_data leaves out the years whose January is missing and averages the others
+    like the loop through every row"""
+    countries = table()
+    rows = [CountryTemperature(datetime.date(year, month, 1), temperature_of(year, month), 'Tuvalu')
+            for year in range(1900, 1911) for month in range(1, 13)]
+    result = helper_functions.create_country_yearly_data(countries, 'Tuvalu', 1900, 1910)
+    expected = loop_yearly_data(rows, 'Tuvalu', 1900, 1910)
+    assert [row.year for row in result] == [row.year for row in expected]
+    assert not MISSING_JANUARY & {row.year for row in result}
+    assert [row.temperature for row in result] == pytest.approx([row.temperature for row in expected], abs=1e-12)
+
+
+def fitted_temperatures() -> CountryTemperatureTable:
+    """Return the temperature of every country of FITTED in every month from 1988 to 2013, with the January of a
+    few years missing"""
+    rows = [(year, month, code, math.nan if month == 1 and (year + code) % 9 == 0
+             else 10 + code + 6 * math.sin(month / 2) + (year - 1988) * 0.02 * (code + 1) + (year * month % 7) / 10)
+            for code in range(len(FITTED)) for year in range(1988, 2014) for month in range(1, 13)]
+    return CountryTemperatureTable(array('h', [row[0] for row in rows]), array('b', [row[1] for row in rows]),
+                                   array('d', [row[3] for row in rows]), array('H', [row[2] for row in rows]),
+                                   list(FITTED))
+
+
+def fitted_emissions() -> RecordList:
+    """Return the CO2 emission of every country of FITTED from 1988 to 2017, newest first, without its missing
+    years"""
+    return RecordList(CO2Emission(datetime.date(year, 1, 1), 500.0 * (code + 1) + (year - 1988) ** 1.3
+                                  + (year * (code + 3) % 11) * 2.5, nation)
+                      for (code, nation) in enumerate(FITTED) for year in range(2017, 1987, -1)
+                      if year not in FITTED[nation])
+
+
+@pytest.mark.parametrize('start_year, end_year', [(1990, 2013), (1994, 2008)])
+def test_co2_temperature_fits_matches_fit(start_year, end_year) -> None:
+    """Test that the fit of every country at once is the fit of the yearly increases of every country by itself,
+    using only the increases whose year and year before it both have data"""
+    countries = fitted_temperatures()
+    co2_data = fitted_emissions()
+    fits = helper_functions.co2_temperature_fits(countries, co2_data, set(FITTED), start_year, end_year)
+    assert fits.nations == sorted(FITTED)
+    assert fits.years == list(range(start_year + 1, end_year + 1))
+    for nation in FITTED:
+        temperature = {row.year: row.temperature
+                       for row in helper_functions.create_country_yearly_data(countries, nation, start_year,
+                                                                              end_year)}
+        co2 = {row.year: row.emission for row in co2_data
+               if row.country == nation and start_year <= row.year <= end_year}
+        pairs = [(co2[year] - co2[year - 1], temperature[year] - temperature[year - 1]) for year in fits.years
+                 if {year, year - 1} <= set(temperature) & set(co2)]
+        expected = regression.fit([pair[0] for pair in pairs], [pair[1] for pair in pairs])
+        result = fits.fits[nation]
+        assert result.n == expected.n == len(pairs)
+        assert [result.intercept, result.slope, result.r_squared, result.slope_error] == \
+            pytest.approx([expected.intercept, expected.slope, expected.r_squared, expected.slope_error], rel=1e-9)
+        assert result.residuals == pytest.approx(expected.residuals, rel=1e-9, abs=1e-12)
@@ -0,0 +1,146 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that memo remembers the results of a function for a registered dataset until the dataset
+is mutated or garbage collected, and that the results it returns can be changed without changing what it
+remembers.
+
+Run it with
+    python -m pytest test_memo.py"""
+
+import gc
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+
+import memo
+from records import RecordList
+
+# The arguments of every call of the functions below
+calls = []
+
+
+@memo.memoize
+def total(data: List[int], scale: object = 1) -> list:
+    """Return the sum of data times scale, along with the type of scale"""
+    calls.append(scale)
+    return [sum(data) * scale, type(scale).__name__]
+
+
+@memo.memoize
+def chosen(data: List[int], nations: set) -> list:
+    """Return the type of every one of nations"""
+    calls.append(nations)
+    return sorted(type(nation).__name__ for nation in nations)
+
+
+@dataclass
+class Summary:
+    """The rows of a dataset and their total"""
+    rows: List[int]
+    total: int
+
+
+@memo.memoize
+def summary(data: List[int]) -> Summary:
+    """Return the rows of data and their total"""
+    calls.append(None)
+    return Summary(list(data), sum(data))
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> None:
+    """Start every test without remembered results"""
+    memo.clear()
+    calls.clear()
+
+
+def test_result_is_remembered() -> None:
+    """Test that the second call with the same registered dataset does not call the function again"""
+    data = RecordList([1, 2, 3])
+    memo.register(data)
+    assert total(data) == total(data) == [6, 'int']
+    assert len(calls) == 1
+
+
+def test_touch_forgets_result() -> None:
+    """Test that a dataset mutated and touched gets a new result"""
+    data = RecordList([1, 2, 3])
+    memo.register(data)
+    assert total(data) == [6, 'int']
+    data.append(4)
+    memo.touch(data)
+    assert total(data) == [10, 'int']
+    assert len(calls) == 2
+
+
+def test_touch_keeps_other_datasets() -> None:
+    """Test that touching a dataset leaves the results of another dataset remembered"""
+    (first, second) = (RecordList([1]), RecordList([2]))
+    memo.register(first)
+    memo.register(second)
+    total(first)
+    total(second)
+    memo.touch(first)
+    total(second)
+    assert len(calls) == 2
+
+
+def test_plain_values_of_different_types() -> None:
+    """Test that 1, 1.0 and True are different arguments, even though they are equal"""
+    data = RecordList([1, 2, 3])
+    memo.register(data)
+    assert total(data, 1) == [6, 'int']
+    assert total(data, 1.0) == [6.0, 'float']
+    assert total(data, True) == [6, 'bool']
+    assert chosen(data, {1}) == ['int']
+    assert chosen(data, {True}) == ['bool']
+    assert calls == [1, 1.0, True, {1}, {True}]
+
+
+def test_unregistered_dataset_is_not_remembered() -> None:
+    """Test that a list that is not registered is computed every time"""
+    data = [1, 2, 3]
+    total(data)
+    total(data)
+    assert len(calls) == 2
+
+
+def test_result_can_be_changed() -> None:
+    """Test that changing a returned result, or a dataclass in it, does not change the result remembered"""
+    data = RecordList([1, 2, 3])
+    memo.register(data)
+    total(data).append('changed')
+    assert total(data) == [6, 'int']
+    summary(data).rows.append(4)
+    assert summary(data) == Summary([1, 2, 3], 6)
+    assert len(calls) == 2
+
+
+def test_collected_dataset_is_forgotten() -> None:
+    """Test that the results of a dataset are dropped once it is garbage collected"""
+    data = RecordList([1, 2, 3])
+    memo.register(data)
+    total(data)
+    del data
+    gc.collect()
+    other = RecordList([4])
+    memo.register(other)
+    total(other)
+    assert memo.statistics()['size'] == 1
+
+
+def test_register_plain_list() -> None:
+    """Test that a list that can not be weakly referenced can not be registered"""
+    with pytest.raises(TypeError):
+        memo.register([1, 2, 3])
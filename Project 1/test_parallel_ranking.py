@@ -0,0 +1,81 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that the rankings computed in a pool of processes reading the dataset from shared memory
+are the rankings computed in this process.
+
+Run it with
+    python -m pytest test_parallel_ranking.py"""
+
+import datetime
+import math
+from array import array
+
+import pytest
+
+import helper_functions
+import memo
+from records import CO2Emission, RecordList
+from temperature_table import CountryTemperatureTable
+
+NAMES = ['Albania', 'Brazil', 'Chad', 'Denmark', 'Ecuador', 'Fiji', 'Greece']
+
+
+def temperatures() -> CountryTemperatureTable:
+    """Return the temperature of every country in every month from 1985 to 2013, each warming at its own rate,
+    with a few months missing"""
+    rows = [(year, month, code, math.nan if (year + month + code) % 17 == 0
+             else 10 + code + 6 * math.sin(month / 2) + (year - 1985) * 0.01 * (code + 1) + (month * code % 5) / 10)
+            for code in range(len(NAMES)) for year in range(1985, 2014) for month in range(1, 13)]
+    return CountryTemperatureTable(array('h', [row[0] for row in rows]), array('b', [row[1] for row in rows]),
+                                   array('d', [row[3] for row in rows]), array('H', [row[2] for row in rows]),
+                                   list(NAMES))
+
+
+def emissions() -> RecordList:
+    """Return the CO2 emission of every country from 1980 to 2017, newest first as in a UNdata_Export file, each
+    country starting in a different year"""
+    return RecordList(CO2Emission(datetime.date(year, 1, 1), 1000.0 * (code + 1) + (year - 1980) ** 1.5 * (code - 3)
+                                  + (year * code % 7) * 3.25, NAMES[code])
+                      for code in range(len(NAMES)) for year in range(2017, 1979 + code, -1))
+
+
+@pytest.mark.parametrize('workers', [2, 3])
+def test_temperature_ranking_matches_serial(workers) -> None:
+    """Test that the temperature ranking of every worker count is the ranking of one process"""
+    countries = temperatures()
+    serial = helper_functions.temperature_increase_ranking(countries, set(NAMES), 1990, 2013)
+    assert helper_functions.temperature_increase_ranking(countries, set(NAMES), 1990, 2013, workers) == serial
+    assert sorted(row[1] for row in serial) == sorted(NAMES)
+
+
+@pytest.mark.parametrize('workers', [2, 3])
+@pytest.mark.parametrize('year', [1985, 1990, 2010])
+def test_co2_ranking_matches_serial(workers, year) -> None:
+    """Test that the CO2 ranking of every worker count is the ranking of one process"""
+    data = emissions()
+    serial = helper_functions.co2_increase_ranking(data, set(NAMES), year)
+    assert helper_functions.co2_increase_ranking(data, set(NAMES), year, workers) == serial
+
+
+def test_registered_dataset_ranking_matches_serial() -> None:
+    """Test that the rankings of a registered dataset, whose results are remembered, match between one process
+    and many, and a subset of the nations is ranked on its own"""
+    memo.clear()
+    data = emissions()
+    memo.register(data)
+    nations = {'Brazil', 'Chad', 'Fiji'}
+    serial = helper_functions.co2_increase_ranking(data, nations, 1995)
+    assert helper_functions.co2_increase_ranking(data, nations, 1995, 2) == serial
+    assert helper_functions.co2_increase_ranking(data, nations, 1995, 2) == serial
+    assert sorted(row[1] for row in serial) == sorted(nations)
+    memo.clear()
@@ -0,0 +1,84 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests the dataclasses of records, which every dataset is made of: that they have slots, that
+the frozen ones can not be changed and that they can still be copied and pickled.
+
+Run it with
+    python -m pytest test_records.py"""
+
+import copy
+import dataclasses
+import datetime
+import pickle
+import weakref
+
+import pytest
+
+from records import CO2Emission, CountryTemperature, GDP, GlobalCO2, GlobalTemperature, RecordList
+
+DATE = datetime.date(1998, 7, 1)
+
+# A row of every dataclass that has a date
+DATED_ROWS = [GlobalTemperature(DATE, 15.25), CountryTemperature(DATE, None, 'Chad'), CO2Emission(DATE, 2.5, 'Chad'),
+              GlobalCO2(DATE, 366.5)]
+
+# A row of every dataclass
+ROWS = DATED_ROWS + [GDP(12, '1,736,426', 'Canada')]
+
+
+@pytest.mark.parametrize('row', DATED_ROWS)
+def test_year_and_month_of_date(row) -> None:
+    """Test that the year and month of a row are the year and month of its date"""
+    assert (row.year, row.month) == (1998, 7)
+    assert row.date.strftime('%Y') == str(row.year)
+
+
+@pytest.mark.parametrize('row', ROWS)
+def test_rows_have_slots(row) -> None:
+    """Test that no row has a dictionary of attributes"""
+    assert not hasattr(row, '__dict__')
+    with pytest.raises((AttributeError, TypeError)):
+        row.other = 1
+
+
+@pytest.mark.parametrize('row', [row for row in ROWS if not isinstance(row, CO2Emission)])
+def test_frozen_rows_can_not_be_changed(row) -> None:
+    """Test that every row other than CO2Emission can not be assigned to"""
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        row.date = datetime.date(2000, 1, 1)
+
+
+def test_co2_emission_country_can_be_renamed() -> None:
+    """Test that the country of a CO2Emission can be renamed, as mutate_united_states does"""
+    row = CO2Emission(DATE, 2.5, 'United States of America')
+    row.country = 'United States'
+    assert row == CO2Emission(DATE, 2.5, 'United States')
+
+
+@pytest.mark.parametrize('row', ROWS)
+def test_rows_are_copied_and_pickled(row) -> None:
+    """Test that a copy or an unpickled row is equal to the row, with the same year and month"""
+    for other in (copy.copy(row), copy.deepcopy(row), pickle.loads(pickle.dumps(row))):
+        assert other == row
+        assert type(other) is type(row)
+        if hasattr(row, 'year'):
+            assert (other.year, other.month) == (row.year, row.month)
+
+
+def test_record_list_is_weakly_referenced() -> None:
+    """Test that a RecordList is a list that can be weakly referenced, unlike a plain list"""
+    data = RecordList(ROWS)
+    assert data == ROWS and isinstance(data, list)
+    assert weakref.ref(data)() is data
+    with pytest.raises(TypeError):
+        weakref.ref(list(ROWS))
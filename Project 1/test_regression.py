@@ -0,0 +1,128 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that fit, fit_batch and RunningRegression give the regression of the textbook formulas,
+with and without NumPy, skipping the missing points.
+
+Run it with
+    python -m pytest test_regression.py"""
+
+import math
+from typing import List, Optional
+
+import pytest
+
+import regression
+
+# The x values shared by every row, and the y values of every row, some of them missing
+X = [1990.0, 1991.0, 1992.0, 1993.0, 1994.0, 1995.0, 1996.0, 1997.0]
+ROWS = [[3.1, 2.9, 3.8, 4.4, 4.1, 5.0, 5.6, 5.3],
+        [None, 2.0, math.nan, 1.5, 0.75, 0.5, 0.25, None],
+        [7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0],
+        [1.0, None, None, None, None, None, 3.0, None],
+        [None] * 8]
+
+# The names of the statistics of a Regression other than its residuals
+STATISTICS = ['intercept', 'slope', 'r_squared', 'intercept_error', 'slope_error', 'n']
+
+
+def textbook(x: List[float], y: List[Optional[float]]) -> regression.Regression:
+    """Return the regression of y on x from the two-pass formulas, skipping the missing points"""
+    points = [(x[i], y[i]) for i in range(len(x)) if y[i] is not None and not math.isnan(y[i])]
+    n = len(points)
+    if n == 0:
+        return regression.Regression(math.nan, math.nan, math.nan, math.nan, math.nan, 0)
+    mean_x = sum(p[0] for p in points) / n
+    mean_y = sum(p[1] for p in points) / n
+    sxx = sum((p[0] - mean_x) ** 2 for p in points)
+    syy = sum((p[1] - mean_y) ** 2 for p in points)
+    sxy = sum((p[0] - mean_x) * (p[1] - mean_y) for p in points)
+    slope = sxy / sxx if sxx else math.nan
+    intercept = mean_y - slope * mean_x
+    ssres = sum((p[1] - intercept - slope * p[0]) ** 2 for p in points)
+    r_squared = 1 - ssres / syy if syy else math.nan
+    variance = ssres / (n - 2) if n > 2 else math.nan
+    slope_error = math.sqrt(variance / sxx) if sxx else math.nan
+    intercept_error = math.sqrt(variance * (1 / n + mean_x ** 2 / sxx)) if sxx else math.nan
+    return regression.Regression(intercept, slope, r_squared, intercept_error, slope_error, n,
+                                 [p[1] - intercept - slope * p[0] for p in points])
+
+
+def assert_same(result: regression.Regression, expected: regression.Regression, residuals: bool = True) -> None:
+    """Assert that result has the statistics of expected, nan where expected is nan"""
+    for name in STATISTICS:
+        value = getattr(expected, name)
+        if isinstance(value, float) and math.isnan(value):
+            assert math.isnan(getattr(result, name)), name
+        else:
+            assert getattr(result, name) == pytest.approx(value, rel=1e-9, abs=1e-9), name
+    if residuals:
+        assert result.residuals == pytest.approx(expected.residuals, rel=1e-9, abs=1e-9)
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch) -> str:
+    """Run a test with NumPy, if it is installed, and again without it"""
+    if request.param == 'python':
+        monkeypatch.setattr(regression, 'numpy', None)
+    elif regression.numpy is None:
+        pytest.skip('NumPy is not installed')
+    return request.param
+
+
+@pytest.mark.parametrize('row', range(len(ROWS)))
+def test_fit_matches_textbook(backend, row) -> None:
+    """Test that fit gives the regression of the textbook formulas, skipping missing points"""
+    assert_same(regression.fit(X, ROWS[row]), textbook(X, ROWS[row]))
+
+
+def test_fit_batch_matches_fit(backend) -> None:
+    """Test that fitting every row at once gives the regression of fitting every row by itself"""
+    results = regression.fit_batch([X] * len(ROWS), ROWS)
+    assert len(results) == len(ROWS)
+    for row in range(len(ROWS)):
+        assert_same(results[row], regression.fit(X, ROWS[row]))
+
+
+def test_fit_batch_rows_of_different_lengths(backend) -> None:
+    """Test that rows of different lengths are each fitted by themselves"""
+    xs = [X, X[:5], X[2:]]
+    ys = [ROWS[0], ROWS[0][:5], ROWS[1][2:]]
+    results = regression.fit_batch(xs, ys)
+    for row in range(len(xs)):
+        assert_same(results[row], textbook(xs[row], ys[row]))
+
+
+def test_fit_is_the_same_with_and_without_numpy(monkeypatch) -> None:
+    """Test that the regression found with NumPy is the regression found one point at a time"""
+    if regression.numpy is None:
+        pytest.skip('NumPy is not installed')
+    with_numpy = [regression.fit(X, row) for row in ROWS]
+    monkeypatch.setattr(regression, 'numpy', None)
+    for row in range(len(ROWS)):
+        assert_same(regression.fit(X, ROWS[row]), with_numpy[row])
+
+
+def test_running_regression_matches_fit() -> None:
+    """Test that adding the points one at a time gives the regression of fit, without the residuals"""
+    running = regression.RunningRegression()
+    for i in range(len(X)):
+        running.add(X[i], ROWS[1][i])
+    result = running.result()
+    assert result.residuals == []
+    assert_same(result, textbook(X, ROWS[1]), residuals=False)
+
+
+def test_line_points() -> None:
+    """Test that line_points returns the y value of the line at every integer x"""
+    line = regression.Regression(1.0, 0.5, 1.0, 0.0, 0.0, 2)
+    assert regression.line_points(line, 0, 4) == [[0, 1, 2, 3], [1.0, 1.5, 2.0, 2.5]]
@@ -0,0 +1,100 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that a graph is sent where its render target says, and only opened in the browser when
+it is shown.
+
+Run it with
+    python -m pytest test_render.py"""
+
+import datetime
+import json
+from typing import List
+
+import pytest
+
+import render
+from records import GlobalTemperature
+
+
+class Graph:
+    """A graph that records what was done to it instead of doing it
+    Instance Attributes
+        - actions: what was done to the graph, in order"""
+    actions: List[tuple]
+
+    def __init__(self) -> None:
+        """Initialize a graph that nothing was done to"""
+        self.actions = []
+
+    def show(self) -> None:
+        """Record that the graph was opened in the browser"""
+        self.actions.append(('show',))
+
+    def write_html(self, path: str) -> None:
+        """Record that the graph was written into the html file path"""
+        self.actions.append(('html', path))
+
+    def write_json(self, path: str) -> None:
+        """Record that the graph was written into the json file path"""
+        self.actions.append(('json', path))
+
+
+@pytest.mark.parametrize('target, actions', [(render.RenderTarget(), [('show',)]),
+                                             (render.RenderTarget('figure'), []),
+                                             (render.RenderTarget('html', 'graph.html'), [('html', 'graph.html')]),
+                                             (render.RenderTarget('json', 'graph.json'), [('json', 'graph.json')])])
+def test_render_target(target, actions) -> None:
+    """Test that every mode does only what it says and returns the graph"""
+    graph = Graph()
+    assert render.render(graph, target) is graph
+    assert graph.actions == actions
+
+
+def test_render_unknown_mode() -> None:
+    """Test that an unknown mode is rejected"""
+    with pytest.raises(ValueError):
+        render.render(Graph(), render.RenderTarget('png', 'graph.png'))
+
+
+def test_render_makes_folder(tmp_path) -> None:
+    """Test that the folder of a file that a graph is written into is created"""
+    path = str(tmp_path / 'graphs' / 'yearly' / 'graph.html')
+    render.render(Graph(), render.RenderTarget('html', path))
+    assert (tmp_path / 'graphs' / 'yearly').is_dir()
+
+
+def test_using_sets_default_target() -> None:
+    """Test that using changes the target of the graphs not given one, only inside the with block, even when
+    the block raises an error"""
+    graph = Graph()
+    with render.using(render.RenderTarget('json', 'inside.json')):
+        render.render(graph)
+        render.render(graph, render.RenderTarget('figure'))
+    with pytest.raises(KeyError):
+        with render.using(render.RenderTarget('figure')):
+            raise KeyError('stop')
+    assert render.default_target == render.RenderTarget()
+    assert graph.actions == [('json', 'inside.json')]
+
+
+def test_draw_graph_writes_json(tmp_path) -> None:
+    """Test that a graph of draw_graph is written into a file instead of being shown"""
+    draw_graph = pytest.importorskip('draw_graph')
+    global_data = [GlobalTemperature(datetime.date(year, month, 1), 8.0 + month / 12 + (year - 2000) / 50)
+                   for year in range(2000, 2004) for month in range(1, 13)]
+    path = str(tmp_path / 'global.json')
+    fig = draw_graph.draw_global_graph(global_data, render.RenderTarget('json', path))
+    with open(path) as file:
+        written = json.load(file)
+    assert len(written['data']) == len(fig.data)
+    assert len(written['data'][0]['x']) == len(global_data)
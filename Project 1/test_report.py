@@ -0,0 +1,78 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that the report runner draws an analysis for every combination of the values of its
+parameters, and that an analysis that fails does not stop the others.
+
+Run it with
+    python -m pytest test_report.py"""
+
+import os
+
+import pytest
+
+import benchmark
+import report
+
+
+@pytest.fixture
+def synthetic(tmp_path, monkeypatch) -> str:
+    """Write the synthetic datasets of benchmark into a temporary folder, work from there and return its path"""
+    benchmark.write_datasets(str(tmp_path), 1)
+    monkeypatch.chdir(tmp_path)
+    return str(tmp_path)
+
+
+def test_tasks_every_combination() -> None:
+    """Test that an analysis is drawn for every combination of the values of the parameters it takes, with the
+    default of the parameters not given, skipping the years that end before they start"""
+    all_tasks = report.tasks(['country-vs-global-year'], {'start_year': [1900, 1950, 2020],
+                                                          'country': ['Canada', 'Chad']}, 'out', 'json')
+    assert [parameters for (_, parameters, _) in all_tasks] == [
+        {'start_year': 1900, 'end_year': 2013, 'country': 'Canada'},
+        {'start_year': 1900, 'end_year': 2013, 'country': 'Chad'},
+        {'start_year': 1950, 'end_year': 2013, 'country': 'Canada'},
+        {'start_year': 1950, 'end_year': 2013, 'country': 'Chad'}]
+    assert all(path.startswith('out' + os.sep) and path.endswith('.json') for (_, _, path) in all_tasks)
+    assert len({path for (_, _, path) in all_tasks}) == len(all_tasks)
+
+
+def test_tasks_leave_out_other_parameters() -> None:
+    """Test that the values of a parameter an analysis does not take are left out of that analysis"""
+    all_tasks = report.tasks(['global-co2', 'country-co2'], {'start_year': [1980, 1990], 'country': ['Chad']},
+                             'out')
+    assert [(name, parameters) for (name, parameters, _) in all_tasks] == [('global-co2', {}),
+                                                                           ('country-co2', {'country': 'Chad'})]
+
+
+def test_file_name_of_countries() -> None:
+    """Test that a few countries are named in the file, and many countries by their amount and a hash"""
+    few = report._file_name('ranking-comparison', {'start_year': 1990, 'countries': frozenset({'Chad', 'Fiji'})})
+    assert few == 'ranking-comparison_start_year-1990_countries-Chad+Fiji'
+    many = frozenset({'Chad', 'Fiji', 'Peru', 'Oman', 'Togo'})
+    assert report._file_name('ranking-comparison', {'countries': many}).startswith(
+        'ranking-comparison_countries-5-countries-')
+    assert report._file_name('ranking-comparison', {'countries': many}) != \
+        report._file_name('ranking-comparison', {'countries': many - {'Togo'} | {'Mali'}})
+
+
+def test_run_keeps_going_after_an_error(synthetic) -> None:
+    """Test that every task is drawn into its file and that a task that raises an error is reported without
+    stopping the tasks after it"""
+    all_tasks = report.tasks(['global-co2', 'smoothed-global-co2'], {'method': ['mean', 'sum'], 'window': [0, 6]},
+                             os.path.join(synthetic, 'out'), 'json')
+    results = {path: error for (path, _, error) in report.run(all_tasks)}
+    assert set(results) == {path for (_, _, path) in all_tasks}
+    failed = {path for path in results if results[path] is not None}
+    assert failed == {path for (_, parameters, path) in all_tasks if parameters.get('window') == 0}
+    assert all(results[path].startswith('ValueError') for path in failed)
+    assert all(os.path.exists(path) != (path in failed) for path in results)
@@ -0,0 +1,114 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that the rolling statistics updated one row at a time are the statistics of every window
+computed from scratch.
+
+Run it with
+    python -m pytest test_rolling.py"""
+
+import datetime
+import math
+from typing import List, Optional, Sequence
+
+import pytest
+
+import rolling
+from records import GlobalCO2, GlobalTemperature
+
+# A monthly series over fifty years with a missing value every so often
+VALUES = [None if i % 23 == 5 or 300 <= i < 320 else 8.5 + 6 * math.sin(i / 2) + i * 0.002 + (i * 7 % 11) / 10
+          for i in range(600)]
+
+# The decimal year of every value of VALUES, far from 0 like the years of the datasets
+X = [1950 + i / 12 for i in range(len(VALUES))]
+
+
+def windows(values: Sequence, window: int) -> List[list]:
+    """Return the values of the window of the last window rows ending at every row"""
+    return [list(values[max(0, i - window + 1):i + 1]) for i in range(len(values))]
+
+
+def present(values: Sequence[Optional[float]]) -> List[float]:
+    """Return the values that are not missing"""
+    return [value for value in values if value is not None and value == value]
+
+
+def slope(x: Sequence[float], values: Sequence[Optional[float]]) -> float:
+    """Return the slope of the regression line of the present values on x, from the two-pass formula"""
+    points = [(x[i], values[i]) for i in range(len(x)) if values[i] is not None]
+    if len(points) < 2:
+        return math.nan
+    mean_x = sum(point[0] for point in points) / len(points)
+    mean_y = sum(point[1] for point in points) / len(points)
+    sxx = sum((point[0] - mean_x) ** 2 for point in points)
+    return sum((point[0] - mean_x) * (point[1] - mean_y) for point in points) / sxx
+
+
+def assert_close(result: List[float], expected: List[float]) -> None:
+    """Assert that result is expected, with nan in the same places"""
+    assert [value != value for value in result] == [value != value for value in expected]
+    assert [value for value in result if value == value] == \
+        pytest.approx([value for value in expected if value == value], rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize('window', [1, 2, 12, 25, 120])
+def test_moving_sum_and_mean(window) -> None:
+    """Test that the moving sum and mean are the sum and mean of the values of every window"""
+    assert_close(rolling.moving_sum(VALUES, window),
+                 [math.fsum(present(values)) if present(values) else math.nan for values in windows(VALUES, window)])
+    assert_close(rolling.moving_mean(VALUES, window),
+                 [sum(present(values)) / len(present(values)) if present(values) else math.nan
+                  for values in windows(VALUES, window)])
+
+
+def test_min_values() -> None:
+    """Test that a window with fewer than min_values values is nan"""
+    assert_close(rolling.moving_mean([1.0, None, 3.0, None, None, 6.0], 3, 2),
+                 [math.nan, math.nan, 2.0, math.nan, math.nan, math.nan])
+
+
+@pytest.mark.parametrize('window', [2, 12, 120, 360])
+def test_rolling_slope(window) -> None:
+    """Test that the rolling slope on decimal years is the slope of the regression of every window"""
+    expected = [slope(x, values) for (x, values) in zip(windows(X, window), windows(VALUES, window))]
+    assert_close(rolling.rolling_slope(X, VALUES, window), expected)
+
+
+def test_ewma() -> None:
+    """Test that the exponentially weighted average skips missing values and is nan before the first value"""
+    assert_close(rolling.ewma([None, 2.0, 4.0, None, 8.0], 0.5), [math.nan, 2.0, 3.0, 3.0, 5.5])
+
+
+@pytest.mark.parametrize('method', rolling.METHODS)
+def test_smooth(method) -> None:
+    """Test that smooth uses the statistic called method"""
+    expected = {'mean': rolling.moving_mean(VALUES, 12), 'sum': rolling.moving_sum(VALUES, 12),
+                'slope': rolling.rolling_slope(range(len(VALUES)), VALUES, 12),
+                'ewma': rolling.ewma(VALUES, 2 / 13)}
+    assert_close(rolling.smooth(VALUES, method, 12), expected[method])
+
+
+@pytest.mark.parametrize('method, window', [('median', 12), ('mean', 0), ('slope', -1)])
+def test_smooth_rejects(method, window) -> None:
+    """Test that an unknown method or a window without rows is rejected"""
+    with pytest.raises(ValueError):
+        rolling.smooth(VALUES, method, window)
+
+
+def test_series() -> None:
+    """Test that the series of a global dataset is its dates and values, with nan for a missing temperature"""
+    dates = [datetime.date(2000, month, 1) for month in range(1, 4)]
+    assert_close(rolling.series([GlobalTemperature(dates[0], 1.5), GlobalTemperature(dates[1], None),
+                                 GlobalTemperature(dates[2], 2.5)])[1], [1.5, math.nan, 2.5])
+    assert rolling.series([GlobalCO2(date, 370.0) for date in dates]) == (dates, [370.0] * 3)
+    assert rolling.decimal_year(datetime.date(1990, 7, 1)) == 1990.5
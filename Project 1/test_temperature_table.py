@@ -0,0 +1,96 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that the columnar CountryTemperatureTable returns the same rows as filtering a list of
+CountryTemperature, the dataclasses it replaced.
+
+Run it with
+    python -m pytest test_temperature_table.py"""
+
+import datetime
+import math
+from array import array
+from typing import List, Optional
+
+import pytest
+
+from records import CountryTemperature
+from temperature_table import CountryTemperatureTable
+
+NAMES = ['Albania', 'Brazil', 'Chad']
+
+
+def rows() -> List[CountryTemperature]:
+    """Return the temperature of every country in every month from 1998 to 2001, Chad missing every March,
+    with the countries mixed together and out of order as they could be in a csv file"""
+    all_rows = [CountryTemperature(datetime.date(year, month, 1),
+                                   None if name == 'Chad' and month == 3 else code * 10 + year % 100 + month / 100,
+                                   name)
+                for year in range(1998, 2002) for month in range(1, 13) for (code, name) in enumerate(NAMES)]
+    return all_rows[1::2] + all_rows[0::2]
+
+
+def table(data: List[CountryTemperature]) -> CountryTemperatureTable:
+    """Return the table of the rows of data"""
+    return CountryTemperatureTable(array('h', [row.year for row in data]), array('b', [row.month for row in data]),
+                                   array('d', [math.nan if row.temperature is None else row.temperature
+                                               for row in data]),
+                                   array('H', [NAMES.index(row.country) for row in data]), list(NAMES))
+
+
+def expected(data: List[CountryTemperature], nation: Optional[str] = None, start_year: Optional[int] = None,
+             end_year: Optional[int] = None) -> List[tuple]:
+    """Return the date and temperature of the rows of nation from start_year to end_year, sorted by date"""
+    return sorted((row.date, row.temperature) for row in data
+                  if (nation is None or row.country == nation) and (start_year is None or row.year >= start_year)
+                  and (end_year is None or row.year <= end_year))
+
+
+def selected(countries: CountryTemperatureTable) -> List[tuple]:
+    """Return the date and temperature of every row of countries"""
+    return list(zip(countries.dates(), countries.temperature_list()))
+
+
+@pytest.mark.parametrize('nation', NAMES + ['Nowhere'])
+@pytest.mark.parametrize('start_year, end_year', [(None, None), (1999, None), (None, 1999), (1999, 2000),
+                                                  (2001, 2001), (2005, None), (2000, 1999)])
+def test_select_matches_rows(nation, start_year, end_year) -> None:
+    """Test that select returns the rows of a nation between the years, sorted by date, with None for the
+    missing temperatures"""
+    data = rows()
+    assert selected(table(data).select(nation, start_year, end_year)) == expected(data, nation, start_year,
+                                                                                 end_year)
+
+
+def test_select_every_country() -> None:
+    """Test that select without a nation keeps every row and every country"""
+    countries = table(rows()).select()
+    assert len(countries) == len(rows())
+    assert countries.countries() == set(NAMES)
+    assert sorted(selected(countries.select('Brazil'))) == expected(rows(), 'Brazil')
+
+
+def test_selection_keeps_only_its_country() -> None:
+    """Test that the table selected for a nation only knows about that nation"""
+    countries = table(rows()).select('Chad', 1999, 1999)
+    assert countries.countries() == {'Chad'}
+    assert len(countries.select('Albania')) == 0
+    assert selected(countries.select('Chad', 1999)) == expected(rows(), 'Chad', 1999, 1999)
+
+
+def test_columns_round_trip() -> None:
+    """Test that a table rebuilt from its columns has the same rows"""
+    countries = table(rows())
+    rebuilt = CountryTemperatureTable.from_columns(countries.to_columns())
+    for nation in NAMES:
+        assert selected(rebuilt.select(nation)) == selected(countries.select(nation))
+    assert rebuilt.countries() == countries.countries()
@@ -0,0 +1,91 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file tests that the year by country matrix lines up the datasets by year and country, with and
+without NumPy.
+
+Run it with
+    python -m pytest test_year_matrix.py"""
+
+import math
+from typing import Any, List, Optional
+
+import pytest
+
+import year_matrix
+
+TEMPERATURE = {'Canada': {1990: 1.5, 1991: 2.0, 1993: None}, 'Viet Nam': {1992: 25.0}}
+CO2 = {'Canada': {1991: 500.0, 1992: 510.0}, 'United States of America': {1990: 5000.0, 1994: 5500.0}}
+GDP = {'United States': 21427700.0, 'Canada': 1736426.0}
+
+
+@pytest.fixture(params=['numpy', 'python'], autouse=True)
+def backend(request, monkeypatch) -> str:
+    """Run every test with NumPy, if it is installed, and again without it"""
+    if request.param == 'python':
+        monkeypatch.setattr(year_matrix, 'numpy', None)
+    elif year_matrix.numpy is None:
+        pytest.skip('NumPy is not installed')
+    return request.param
+
+
+def rows(values: Any) -> List[List[Optional[float]]]:
+    """Return the rows of values as lists, with None where a value is nan"""
+    return [[None if math.isnan(value) else float(value) for value in row] for row in values]
+
+
+def test_from_series_lines_up_datasets() -> None:
+    """Test that every country gets a column under its registry name, and every year a row, with nan for the
+    values a dataset does not have"""
+    matrix = year_matrix.YearCountryMatrix.from_series(TEMPERATURE, CO2, GDP)
+    assert matrix.years == range(1990, 1995)
+    assert matrix.countries == ('Canada', 'United States', 'Vietnam')
+    assert rows(matrix.temperature) == [[1.5, None, None], [2.0, None, None], [None, None, 25.0],
+                                        [None, None, None], [None, None, None]]
+    assert rows(matrix.co2) == [[None, 5000.0, None], [500.0, None, None], [510.0, None, None],
+                                [None, None, None], [None, 5500.0, None]]
+    assert rows([matrix.gdp]) == [[1736426.0, 21427700.0, None]]
+
+
+def test_matrix_is_read_only() -> None:
+    """Test that the arrays of the matrix can not be changed"""
+    matrix = year_matrix.YearCountryMatrix.from_series(TEMPERATURE, CO2, GDP)
+    with pytest.raises((TypeError, ValueError)):
+        matrix.co2[0][0] = 1.0
+
+
+def test_select() -> None:
+    """Test that select returns the chosen years and countries in the order asked for, by any of their names,
+    with nan for the years and countries the matrix does not have and for the years after last_year"""
+    matrix = year_matrix.YearCountryMatrix.from_series(TEMPERATURE, CO2, GDP)
+    selected = matrix.select('co2', ['United States of America', 'Atlantis', 'Canada'], 1989, 1994, 1992)
+    assert rows(selected) == [[None, None, None], [5000.0, None, None], [None, None, 500.0], [None, None, 510.0],
+                              [None, None, None], [None, None, None]]
+    assert rows(matrix.select('temperature', ['Atlantis'], 1990, 1991)) == [[None], [None]]
+    assert rows(matrix.select('temperature', ['Canada'], 2000, 2001)) == [[None], [None]]
+
+
+def test_increase_transpose_and_present() -> None:
+    """Test that the yearly increase of every country is nan where either year is missing, and is turned into a
+    row per country"""
+    matrix = year_matrix.YearCountryMatrix.from_series(TEMPERATURE, CO2, GDP)
+    co2 = matrix.select('co2', ['Canada', 'United States'], 1990, 1993)
+    temperature = matrix.select('temperature', ['Canada', 'United States'], 1990, 1993)
+    co2_increase = year_matrix.transpose(year_matrix.increase(co2), 2)
+    temperature_increase = year_matrix.transpose(year_matrix.increase(temperature), 2)
+    assert rows(co2_increase) == [[None, 10.0, None], [None, None, None]]
+    assert rows(temperature_increase) == [[0.5, None, None], [None, None, None]]
+    mask = year_matrix.present(co2_increase, temperature_increase)
+    assert [[bool(value) for value in row] for row in mask] == [[False, False, False], [False, False, False]]
+    both = year_matrix.present(co2_increase, co2_increase)
+    assert year_matrix.compress(co2_increase[0], both[0]) == [10.0]
+    assert rows([year_matrix.column_sums(co2, year_matrix.present(co2))]) == [[1010.0, 5000.0]]
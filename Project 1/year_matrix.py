@@ -0,0 +1,182 @@
+"""CSC110 Fall 2020 Project: Relationship between Climate Change, Pollution, and Productivity of a Nation
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of graders
+grading this project and people who has permission from the creator to use. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited.
+
+This file is Copyright (c) 2020 Jason Sastra
+
+This python file lines up the temperature, the CO2 emission and the GDP of every country in arrays with a row
+per year and a column per country, with nan wherever a value is missing. An analysis that combines the datasets
+then works on whole rows or columns at once instead of matching separate lists of every country by position.
+The arrays are NumPy arrays if NumPy is installed, and lists of rows otherwise"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+import country_registry
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The names of the arrays with a row per year
+YEARLY = ('temperature', 'co2')
+
+
+class YearCountryMatrix:
+    """The yearly temperature and CO2 emission of every country, along with its GDP. The row i of an array is
+    the year years[i] and the column j is the country countries[j]. The matrix is shared by every analysis,
+    so its arrays can not be changed: they are read-only NumPy arrays, or tuples of rows without NumPy
+    Instance Attributes
+        - years: the year of every row, every year from the first to the last without gaps
+        - countries: the name of the country of every column, as in country_registry, sorted by name
+        - temperature: the mean temperature of every year of every country, nan if it is missing
+        - co2: the CO2 emission of every year of every country, nan if it is missing
+        - gdp: the GDP of every country in 2019, the only year in GDP.csv, nan if it is missing
+        - _columns: maps the name of every country to its column
+    Representative Invariants:
+        - list(self.years) == list(range(self.years[0], self.years[-1] + 1)) if len(self.years) > 0
+        - len(self.temperature) == len(self.co2) == len(self.years)
+        - len(self.gdp) == len(self.countries)
+    """
+    years: range
+    countries: tuple
+    temperature: Any
+    co2: Any
+    gdp: Any
+    _columns: Dict[str, int]
+
+    def __init__(self, years: range, countries: Sequence[str], temperature: Any, co2: Any, gdp: Any) -> None:
+        """Initialize the matrix from its arrays, which must already be lined up with years and countries"""
+        self.years = years
+        self.countries = tuple(countries)
+        self.temperature = read_only(temperature)
+        self.co2 = read_only(co2)
+        self.gdp = read_only(gdp)
+        self._columns = {country: column for column, country in enumerate(self.countries)}
+
+    @classmethod
+    def from_series(cls, temperature: Dict[str, Dict[int, float]], co2: Dict[str, Dict[int, float]],
+                    gdp: Dict[str, float]) -> 'YearCountryMatrix':
+        """Return the matrix of the yearly temperature and CO2 emission of every country, each given as a mapping
+        from a year to its value, and the GDP of every country. The countries are matched by their name in
+        country_registry, and a country or year missing from a dataset is nan in its array"""
+        temperature = _canonical(temperature)
+        co2 = _canonical(co2)
+        gdp = _canonical(gdp)
+        countries = sorted(set(temperature) | set(co2) | set(gdp))
+        all_years = {year for series in (temperature, co2) for values in series.values() for year in values}
+        years = range(min(all_years), max(all_years) + 1) if all_years else range(0)
+        arrays = []
+        for series in (temperature, co2):
+            array = _full(len(years), len(countries))
+            for column in range(len(countries)):
+                for (year, value) in series.get(countries[column], {}).items():
+                    array[year - years.start][column] = math.nan if value is None else value
+            arrays.append(array)
+        gdps = [gdp.get(country, math.nan) for country in countries]
+        return cls(years, countries, arrays[0], arrays[1], gdps if numpy is None else numpy.array(gdps, dtype=float))
+
+    def select(self, name: str, nations: Sequence[str], start_year: int, end_year: int,
+               last_year: Optional[int] = None) -> Any:
+        """Return a new array of the years from start_year to end_year (both included) of the array called name,
+        with a column for every country in nations in the same order. A year or a country that is not in the
+        matrix is nan, and so is every year after last_year if it is given
+        Representative Invariants:
+            - name in YEARLY
+            - start_year <= end_year"""
+        values = getattr(self, name)
+        result = _full(end_year - start_year + 1, len(nations))
+        first = max(start_year, self.years.start)
+        last = min(end_year, self.years.stop - 1, end_year if last_year is None else last_year)
+        names = [country_registry.canonical_name(nation) for nation in nations]
+        found = [(position, self._columns[names[position]]) for position in range(len(names))
+                 if names[position] in self._columns]
+        if first > last or found == []:
+            return result
+        positions = [position for (position, _) in found]
+        columns = [column for (_, column) in found]
+        rows = range(first - self.years.start, last - self.years.start + 1)
+        if numpy is not None:
+            result[first - start_year:last - start_year + 1, positions] = values[rows.start:rows.stop][:, columns]
+            return result
+        for row in rows:
+            for (position, column) in zip(positions, columns):
+                result[row + self.years.start - start_year][position] = values[row][column]
+        return result
+
+
+def increase(values: Any) -> Any:
+    """Return the increase of every column of values from every row to the next, which is nan where either row
+    is missing. The result has one row less than values"""
+    if numpy is not None:
+        return values[1:] - values[:-1]
+    return [[after - before for (before, after) in zip(values[row], values[row + 1])]
+            for row in range(len(values) - 1)]
+
+
+def transpose(values: Any, columns: int) -> Any:
+    """Return a new array with a row for every one of the columns columns of values"""
+    if numpy is not None:
+        return numpy.ascontiguousarray(values.T)
+    return [[row[column] for row in values] for column in range(columns)]
+
+
+def present(*arrays: Any) -> Any:
+    """Return the mask of the positions where none of the arrays, which have the same shape, is missing"""
+    if numpy is not None:
+        mask = numpy.ones(arrays[0].shape, dtype=bool)
+        for array in arrays:
+            mask &= ~numpy.isnan(array)
+        return mask
+    return [[all(array[row][column] == array[row][column] for array in arrays)
+             for column in range(len(arrays[0][row]))] for row in range(len(arrays[0]))]
+
+
+def column_sums(values: Any, mask: Any) -> List[float]:
+    """Return the sum of every column of values over the rows where mask is True, adding the rows in order, or
+    nan for a column where mask is never True"""
+    if numpy is not None:
+        sums = numpy.where(mask, values, 0).sum(axis=0)
+        sums[~mask.any(axis=0)] = math.nan
+        return sums.tolist()
+    sums = []
+    for column in range(len(values[0]) if len(values) > 0 else 0):
+        rows = [row for row in range(len(values)) if mask[row][column]]
+        sums.append(sum([values[row][column] for row in rows]) if rows != [] else math.nan)
+    return sums
+
+
+def compress(values: Any, mask: Any) -> List[float]:
+    """Return the values of a row where mask is True, in order"""
+    if numpy is not None:
+        return values[mask].tolist()
+    return [value for (value, kept) in zip(values, mask) if kept]
+
+
+def read_only(array: Any) -> Any:
+    """Return array as an array that can not be changed. A list of values is made an array of floats"""
+    if numpy is not None:
+        if not isinstance(array, numpy.ndarray):
+            array = numpy.asarray(array, dtype=float)
+        array.setflags(write=False)
+        return array
+    return tuple(tuple(row) if isinstance(row, list) else row for row in array)
+
+
+def _full(rows: int, columns: int) -> Any:
+    """Return a new array of rows rows and columns columns where every value is nan"""
+    if numpy is not None:
+        return numpy.full((rows, columns), math.nan)
+    return [[math.nan] * columns for _ in range(rows)]
+
+
+def _canonical(series: Dict[str, object]) -> Dict[str, object]:
+    """Return series with every country renamed to its name in country_registry"""
+    return {country_registry.canonical_name(country): series[country] for country in series}